@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# scripts/backup_banco.py
+"""
+Script para gerar um backup verificado do banco (pode rodar com a aplicação no ar).
+
+Uso:
+    python scripts/backup_banco.py [--destino DIR] [--sem-compactar] [--listar]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.persistence.backup import criar_backup, listar_backups
+from src.interface.console import console
+
+
+def main():
+    """Gera o backup e informa o resultado da verificação."""
+    parser = argparse.ArgumentParser(description="Backup online do banco SQLite")
+    parser.add_argument("--destino", help="Diretório dos backups (padrão: BACKUP_DIR)")
+    parser.add_argument("--sem-compactar", action="store_true", help="Não aplicar VACUUM INTO")
+    parser.add_argument("--listar", action="store_true", help="Listar backups existentes")
+    args = parser.parse_args()
+
+    if args.listar:
+        for caminho in listar_backups(args.destino):
+            console.print(f"  • {caminho.name} ({caminho.stat().st_size / 1024:.0f} KB)")
+        return
+
+    console.print("[bold cyan]💾 Backup do Banco de Dados[/bold cyan]")
+    resultado = criar_backup(args.destino, compactado=not args.sem_compactar)
+
+    console.print(f"  • Arquivo: {resultado.caminho}")
+    console.print(f"  • Páginas copiadas: {resultado.paginas}")
+    console.print(f"  • Tamanho: {resultado.tamanho_bytes / 1024:.0f} KB")
+    console.print(f"  • Duração: {resultado.duracao:.2f}s")
+
+    if not resultado.integro:
+        console.print("[red]❌ quick_check encontrou problemas:[/red]")
+        for problema in resultado.problemas[:10]:
+            console.print(f"    {problema}")
+        sys.exit(1)
+
+    console.print("\n[green]✅ Backup concluído e verificado![/green]")
+
+
+if __name__ == "__main__":
+    main()
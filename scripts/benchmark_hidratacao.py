@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# scripts/benchmark_hidratacao.py
+"""
+Micro-benchmark da conversão linha -> Documento em cargas grandes.
+
+Compara o caminho antigo (DocumentoModel + para_entidade, com validação)
+com a carga direta usada pelo repositório (Documento.reconstituir).
+
+Uso:
+    python scripts/benchmark_hidratacao.py [--linhas 10000] [--repeticoes 5]
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.entities.documento import Documento
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.models import DocumentoModel
+from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
+from src.interface.console import console
+
+
+def _popular(repo: SQLiteDocumentoRepository, linhas: int) -> None:
+    repo.salvar_em_lote(
+        Documento(
+            centro="lencenter" if i % 2 else "moscenter",
+            titulo=f"Протокол допроса {i}",
+            url=f"http://benchmark/{i}",
+            texto="Текст протокола допроса.\n" * 20,
+            data_coleta=datetime.now(),
+            tipo="interrogatorio",
+            pessoa_principal="Л.В. Николаева",
+            envolvidos=["Николаев", "Киров"],
+        )
+        for i in range(linhas)
+    )
+
+
+def _via_modelo(row) -> Documento:
+    """Caminho anterior: modelo intermediário e entidade validada."""
+    return DocumentoModel(
+        id=row[0],
+        centro=row[1],
+        titulo=row[2],
+        data_original=row[3],
+        url=row[4],
+        texto=row[5],
+        data_coleta=row[6],
+        tipo_documento=row[7],
+        tipo_descricao=row[8],
+        pessoa_principal=row[9],
+        remetente=row[10],
+        destinatario=row[11],
+        envolvidos=row[12],
+        tem_anexos=row[13],
+        num_caracteres=row[14],
+        num_palavras=row[15],
+        num_paragrafos=row[16],
+        hash_conteudo=row[17],
+        updated_at=row[18],
+    ).para_entidade()
+
+
+def _melhor_tempo(funcao, repeticoes: int) -> float:
+    """Menor tempo entre as repetições, sem coleta de lixo (como o timeit)."""
+    tempos = []
+    for _ in range(repeticoes):
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            funcao()
+            tempos.append(time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+    return min(tempos)
+
+
+def main():
+    """Executa o benchmark e imprime os tempos."""
+    parser = argparse.ArgumentParser(description="Benchmark da hidratação de documentos")
+    parser.add_argument("--linhas", type=int, default=10_000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        repo = SQLiteDocumentoRepository(db_path=str(Path(diretorio) / "benchmark.db"))
+        with repo._conexao() as conn:
+            aplicar_migracoes(conn)
+        _popular(repo, args.linhas)
+
+        with repo._conexao() as conn:
+            rows = conn.execute(f"SELECT {repo._SELECAO_COMPLETA} FROM documentos").fetchall()
+
+        converter = repo._row_para_entidade
+        modelo = _melhor_tempo(lambda: [_via_modelo(row) for row in rows], args.repeticoes)
+        direto = _melhor_tempo(lambda: [converter(row) for row in rows], args.repeticoes)
+        listar = _melhor_tempo(lambda: repo.listar(limite=args.linhas), args.repeticoes)
+
+    console.print(f"[bold cyan]⏱️ Hidratação de {len(rows)} linhas[/bold cyan]")
+    console.print(f"  • DocumentoModel + para_entidade: {modelo * 1000:.1f} ms")
+    console.print(f"  • Carga direta (reconstituir):    {direto * 1000:.1f} ms")
+    console.print(f"  • Ganho: {modelo / direto:.1f}x")
+    console.print(f"  • listar(limite={args.linhas}) completo: {listar * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
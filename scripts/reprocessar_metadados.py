@@ -8,6 +8,12 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+# Adicionar src ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.persistence.compressao import registrar_funcoes
+from src.infrastructure.persistence.models import AlteracaoModel, PessoaModel
+
 # Importar o classificador do seu extractor
 try:
     from extractor import classificar_documento
@@ -21,7 +27,10 @@ DB_PATH = Path("data/showtrials.db")
 
 def conectar():
     """Conecta ao banco de dados"""
-    return sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH)
+    # Triggers do índice de busca usam essas funções no modo comprimido
+    registrar_funcoes(conn)
+    return conn
 
 
 def criar_colunas_metadados():
@@ -87,51 +96,101 @@ def buscar_todos_documentos():
     return resultados
 
 
+SQL_ATUALIZAR_METADADOS = """
+    UPDATE documentos SET
+        tipo_documento = ?,
+        tipo_descricao = ?,
+        pessoa_principal = ?,
+        remetente = ?,
+        destinatario = ?,
+        destinatario_orgao = ?,
+        envolvidos = ?,
+        tem_anexos = ?,
+        tipo_en = ?,
+        updated_at = ?
+    WHERE id = ?
+"""
+
+
+def parametros_metadados(doc_id, metadados):
+    """
+    Monta a tupla de parâmetros do UPDATE de metadados
+    (sem updated_at, preenchido na gravação do lote)
+    """
+    return (
+        metadados["tipo"],
+        metadados["tipo_descricao"],
+        metadados["pessoa_principal"],
+        metadados["remetente"],
+        metadados["destinatario"],
+        metadados["destinatario_orgao"],
+        ", ".join(metadados["envolvidos"]) if metadados["envolvidos"] else None,
+        metadados["tem_anexos"],
+        {
+            "interrogatorio": "Interrogation",
+            "acareacao": "Confrontation",
+            "acusacao": "Indictment",
+            "declaracao": "Statement",
+            "carta": "Letter",
+            "relatorio": "Special Report",
+            "depoimento": "Testimony",
+            "laudo": "Forensic Report",
+            "desconhecido": "Unknown",
+        }.get(metadados["tipo"], "Unknown"),
+        doc_id,
+    )
+
+
 def atualizar_metadados_documento(doc_id, titulo, metadados):
     """Atualiza os metadados de um documento específico"""
-    conn = conectar()
-    cursor = conn.cursor()
+    atualizar_metadados_em_lote([parametros_metadados(doc_id, metadados)])
 
-    cursor.execute(
-        """
-        UPDATE documentos SET
-            tipo_documento = ?,
-            tipo_descricao = ?,
-            pessoa_principal = ?,
-            remetente = ?,
-            destinatario = ?,
-            destinatario_orgao = ?,
-            envolvidos = ?,
-            tem_anexos = ?,
-            tipo_en = ?
-        WHERE id = ?
-    """,
-        (
-            metadados["tipo"],
-            metadados["tipo_descricao"],
-            metadados["pessoa_principal"],
-            metadados["remetente"],
-            metadados["destinatario"],
-            metadados["destinatario_orgao"],
-            ", ".join(metadados["envolvidos"]) if metadados["envolvidos"] else None,
-            metadados["tem_anexos"],
-            {
-                "interrogatorio": "Interrogation",
-                "acareacao": "Confrontation",
-                "acusacao": "Indictment",
-                "declaracao": "Statement",
-                "carta": "Letter",
-                "relatorio": "Special Report",
-                "depoimento": "Testimony",
-                "laudo": "Forensic Report",
-                "desconhecido": "Unknown",
-            }.get(metadados["tipo"], "Unknown"),
-            doc_id,
-        ),
-    )
 
-    conn.commit()
-    conn.close()
+def atualizar_metadados_em_lote(atualizacoes, chunk_size=500):
+    """
+    Atualiza metadados em lotes: um executemany e um commit por lote.
+    Um lote com erro é desfeito sem afetar os demais.
+
+    Como o SQLiteDocumentoRepository, cada lote também ressincroniza o índice
+    de pessoas (documento_pessoas) e registra as alterações no log
+    `alteracoes`, na mesma transação: consumidores incrementais
+    (listar_alterados_desde) enxergam os documentos reclassificados.
+
+    Returns:
+        int: quantidade de documentos atualizados
+    """
+    conn = conectar()
+    atualizados = 0
+
+    try:
+        for inicio in range(0, len(atualizacoes), chunk_size):
+            lote = atualizacoes[inicio : inicio + chunk_size]
+            agora = datetime.now().isoformat()
+            try:
+                with conn:  # commit ao final do lote, rollback em erro
+                    cursor = conn.cursor()
+                    cursor.executemany(
+                        SQL_ATUALIZAR_METADADOS,
+                        [(*parametros[:-1], agora, parametros[-1]) for parametros in lote],
+                    )
+                    # (tipo, descrição, principal, remetente, destinatário, órgão, envolvidos, ...)
+                    PessoaModel.sincronizar(
+                        cursor,
+                        {p[-1]: PessoaModel.vinculos(p[2], p[3], p[4], p[6]) for p in lote},
+                    )
+                    AlteracaoModel.registrar(
+                        cursor,
+                        "documentos",
+                        [(p[-1], AlteracaoModel.ATUALIZACAO) for p in lote],
+                        agora,
+                    )
+                atualizados += len(lote)
+            except sqlite3.Error as e:
+                print(f"  [{'ERRO':>3}] Lote {inicio}-{inicio + len(lote) - 1}: {str(e)[:50]}")
+    finally:
+        conn.close()
+
+    return atualizados
 
 
 def gerar_estatisticas():
@@ -261,8 +320,8 @@ def reprocessar_todos(limite=None):
     print(f"\n🔄 Processando {len(todos_docs)} documentos...")
     print("-" * 60)
 
-    # 4. Processar cada documento
-    processados = 0
+    # 4. Classificar cada documento (gravação em lote no final)
+    atualizacoes = []
     erros = 0
 
     for i, (doc_id, titulo) in enumerate(todos_docs, 1):
@@ -270,8 +329,8 @@ def reprocessar_todos(limite=None):
             # Classificar o documento
             metadados = classificar_documento(titulo)
 
-            # Atualizar no banco
-            atualizar_metadados_documento(doc_id, titulo, metadados)
+            # Acumular para gravação em lote
+            atualizacoes.append(parametros_metadados(doc_id, metadados))
 
             # Feedback visual
             tipo_icone = {
@@ -293,13 +352,18 @@ def reprocessar_todos(limite=None):
             print(
                 f"  [{i:3d}] {tipo_icone} ID {doc_id:3d}: {metadados['tipo_descricao']:25} - {pessoa[:30]}"
             )
-            processados += 1
 
         except Exception as e:
             print(f"  [{'ERRO':>3}] ID {doc_id}: {str(e)[:50]}")
             erros += 1
 
-    # 5. Resumo final
+    # 5. Gravar no banco (uma transação por lote)
+    print("-" * 60)
+    print(f"\n💾 Gravando {len(atualizacoes)} documentos em lote...")
+    processados = atualizar_metadados_em_lote(atualizacoes)
+    erros += len(atualizacoes) - processados
+
+    # 6. Resumo final
     print("-" * 60)
     print("\n✅ Processamento concluído!")
     print(f"  📊 Documentos processados: {processados}")
@@ -307,7 +371,7 @@ def reprocessar_todos(limite=None):
         print(f"  ⚠️  Erros: {erros}")
     print(f"  ⏱️  {datetime.now().strftime('%H:%M:%S')}")
 
-    # 6. Estatísticas
+    # 7. Estatísticas
     gerar_estatisticas()
 
 
@@ -63,9 +63,6 @@ class DocumentoDTO:
             except Exception:
                 pessoa_en = documento.pessoa_principal
 
-        # Calcular palavras (aproximado)
-        palavras = len(documento.texto.split()) if documento.texto else 0
-
         return cls(
             id=documento.id,
             centro=documento.centro,
@@ -84,7 +81,7 @@ class DocumentoDTO:
             envolvidos=documento.envolvidos or [],
             tem_anexos=documento.tem_anexos,
             tamanho_caracteres=documento.tamanho_caracteres,
-            tamanho_palavras=palavras,
+            tamanho_palavras=documento.tamanho_palavras,
             traducoes=traducoes or [],
         )
 
@@ -107,10 +104,11 @@ class DocumentoListaDTO:
     pessoa_principal_en: Optional[str]
     tem_traducao: bool = False
     tamanho: int = 0
+    idiomas: List[str] = field(default_factory=list)
 
     @classmethod
-    def from_domain(cls, documento, tem_traducao=False, tradutor_nomes=None):
-        """Converte entidade para DTO de listagem."""
+    def from_domain(cls, documento, tem_traducao=False, tradutor_nomes=None, idiomas=None):
+        """Converte entidade (ou ResumoDocumento) para DTO de listagem."""
         pessoa_en = None
         if tradutor_nomes and documento.pessoa_principal:
             try:
@@ -129,6 +127,7 @@ class DocumentoListaDTO:
             tipo_descricao=documento.tipo_descricao,
             pessoa_principal=documento.pessoa_principal,
             pessoa_principal_en=pessoa_en,
-            tem_traducao=tem_traducao,
+            tem_traducao=tem_traducao or bool(idiomas),
             tamanho=documento.tamanho_caracteres,
+            idiomas=sorted(idiomas or []),
         )
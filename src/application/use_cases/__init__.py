@@ -1,7 +1,14 @@
 # src/application/use_cases/__init__.py
+from src.application.use_cases.buscar_documentos import BuscarDocumentos
 from src.application.use_cases.classificar_documento import ClassificarDocumento
 from src.application.use_cases.estatisticas import ObterEstatisticas
 from src.application.use_cases.listar_documentos import ListarDocumentos
 from src.application.use_cases.obter_documento import ObterDocumento
 
-__all__ = ["ClassificarDocumento", "ListarDocumentos", "ObterDocumento", "ObterEstatisticas"]
+__all__ = [
+    "BuscarDocumentos",
+    "ClassificarDocumento",
+    "ListarDocumentos",
+    "ObterDocumento",
+    "ObterEstatisticas",
+]
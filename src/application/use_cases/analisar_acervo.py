@@ -3,9 +3,11 @@
 Caso de uso: Analisar todo o acervo (estatísticas globais) com telemetria.
 """
 
+from collections import Counter
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
 
 from src.domain.interfaces.repositories import RepositorioDocumento
 from src.infrastructure.analysis.spacy_analyzer import SpacyAnalyzer
@@ -22,14 +24,51 @@ def configure_telemetry(telemetry_instance=None):
     _telemetry = telemetry_instance
 
 
+# Colunas lidas pelas estatísticas (contagens calculadas na gravação)
+COLUNAS_TAMANHO = ("num_caracteres", "num_palavras", "num_paragrafos")
+
+# Rótulos de entidade agregados nas estatísticas (modelos ru usam PER)
+TIPOS_AGREGADOS = {
+    "PER": "pessoas_mais_citadas",
+    "PERSON": "pessoas_mais_citadas",
+    "LOC": "top_locais",
+    "GPE": "top_locais",
+    "ORG": "top_organizacoes",
+}
+LIMITE_TOP_ENTIDADES = 10
+
+# Abaixo disso a análise em lote roda em um só processo (iniciar workers custa mais)
+MIN_DOCS_MULTIPROCESSO = 200
+
+
 class AnalisarAcervo:
     """
     Caso de uso para análise global do acervo.
     """
 
-    def __init__(self, repo_doc: RepositorioDocumento, registry: Optional[ServiceRegistry] = None):
+    def __init__(
+        self,
+        repo_doc: RepositorioDocumento,
+        registry: Optional[ServiceRegistry] = None,
+        n_process: Optional[int] = None,
+    ):
+        """
+        Args:
+            repo_doc: Repositório de documentos
+            registry: Registry de serviços (padrão: o do processo)
+            n_process: Processos da análise em lote de acervos grandes
+                       (None = o configurado no analisador)
+        """
         self.repo_doc = repo_doc
         self.registry = registry or ServiceRegistry()
+        self.n_process = n_process
+
+        # Menções por (chave das estatísticas, entidade), por documento e no total.
+        # Mantidas entre chamadas e atualizadas pelo log de alterações: só os
+        # documentos alterados desde a última análise são reanalisados.
+        self._entidades_por_doc: Dict[int, Counter] = {}
+        self._entidades_total: Counter = Counter()
+        self._marca_entidades: Optional[int] = None
 
     def _get_analyzer(self) -> SpacyAnalyzer:
         """Obtém analisador spaCy do registry."""
@@ -46,10 +85,8 @@ class AnalisarAcervo:
         if _telemetry:
             _telemetry.increment("analisar_acervo.estatisticas.iniciado")
 
-        documentos = self.repo_doc.listar(limite=5000)
-
         stats: Dict[str, Any] = {
-            "total_docs": len(documentos),
+            "total_docs": 0,
             "total_palavras": 0,
             "total_caracteres": 0,
             "media_palavras_por_doc": 0,
@@ -63,11 +100,26 @@ class AnalisarAcervo:
             "top_organizacoes": [],
         }
 
-        if _telemetry:
-            _telemetry.increment("analisar_acervo.estatisticas.documentos", value=len(documentos))
+        # Estatísticas básicas sobre todo o acervo (streaming, memória constante).
+        # Usa as contagens gravadas no banco: o texto não é carregado.
+        for doc in self.repo_doc.iterar(colunas=COLUNAS_TAMANHO):
+            stats["total_docs"] += 1
+            num_palavras = doc.tamanho_palavras
+            stats["total_palavras"] += num_palavras
+            stats["total_caracteres"] += doc.tamanho_caracteres
 
-        # Amostra para análise de entidades (limitado por performance)
-        amostra = documentos[:100]
+            # Classificar por tamanho
+            if num_palavras < 1000:
+                stats["documentos_por_tamanho"]["pequeno (<1000 palavras)"] += 1
+            elif num_palavras < 5000:
+                stats["documentos_por_tamanho"]["médio (1000-5000 palavras)"] += 1
+            else:
+                stats["documentos_por_tamanho"]["grande (>5000 palavras)"] += 1
+
+        if _telemetry:
+            _telemetry.increment(
+                "analisar_acervo.estatisticas.documentos", value=stats["total_docs"]
+            )
 
         # Usa analyzer se disponível
         try:
@@ -81,32 +133,19 @@ class AnalisarAcervo:
             if _telemetry:
                 _telemetry.increment("analisar_acervo.analyzer.indisponivel")
 
-        for doc in amostra:
-            # Estatísticas básicas
-            palavras = doc.texto.split()
-            num_palavras = len(palavras)
-            stats["total_palavras"] += num_palavras
-            stats["total_caracteres"] += len(doc.texto)
-
-            # Classificar por tamanho
-            if num_palavras < 1000:
-                stats["documentos_por_tamanho"]["pequeno (<1000 palavras)"] += 1
-            elif num_palavras < 5000:
-                stats["documentos_por_tamanho"]["médio (1000-5000 palavras)"] += 1
-            else:
-                stats["documentos_por_tamanho"]["grande (>5000 palavras)"] += 1
-
-            # Análise de entidades (apenas se analyzer disponível)
-            if analyzer and len(amostra) < 50:  # Performance
-                try:
-                    if doc.id is not None:
-                        analise = analyzer.analisar(doc.texto[:20000], doc.id, "ru")
-                    if _telemetry:
-                        _telemetry.increment("analisar_acervo.analise_entidades.sucesso")
-                except Exception:
-                    if _telemetry:
-                        _telemetry.increment("analisar_acervo.analise_entidades.erro")
-                    pass
+        # Entidades de todo o acervo (análise em lote, incremental entre chamadas)
+        if analyzer:
+            n_process = 1 if stats["total_docs"] < MIN_DOCS_MULTIPROCESSO else self.n_process
+            try:
+                self._atualizar_entidades(analyzer, n_process)
+            except Exception:
+                if _telemetry:
+                    _telemetry.increment("analisar_acervo.analise_entidades.erro")
+            for chave in set(TIPOS_AGREGADOS.values()):
+                contagem = Counter(
+                    {texto: n for (c, texto), n in self._entidades_total.items() if c == chave}
+                )
+                stats[chave] = contagem.most_common(LIMITE_TOP_ENTIDADES)
 
         # Calcular médias
         if stats["total_docs"] > 0:
@@ -117,6 +156,53 @@ class AnalisarAcervo:
 
         return stats
 
+    def _alteracoes_pendentes(self) -> Tuple[Set[int], Set[int], int]:
+        """Documentos alterados e removidos desde a última análise de entidades."""
+        alterados: Set[int] = set()
+        removidos: Set[int] = set()
+        marca = self._marca_entidades or 0
+        while True:
+            lote = self.repo_doc.listar_alterados_desde(marca, limite=5000)
+            if lote.vazio:
+                return alterados, removidos, marca
+            alterados.difference_update(lote.removidos)
+            alterados.update(lote.alterados)
+            removidos.update(lote.removidos)
+            marca = lote.marca
+
+    def _atualizar_entidades(self, analyzer: SpacyAnalyzer, n_process: Optional[int]) -> None:
+        """
+        Conta as entidades de cada documento com SpacyAnalyzer.analisar_lote.
+
+        A primeira chamada analisa o acervo inteiro; as seguintes, apenas os
+        documentos alterados desde então (removidos saem da contagem).
+        """
+        alterados, removidos, marca = self._alteracoes_pendentes()
+
+        textos: Iterator[Tuple[int, str]]
+        if self._marca_entidades is None:
+            documentos = self.repo_doc.iterar(colunas=("texto",))
+            textos = ((doc.id, doc.texto) for doc in documentos if doc.id is not None)
+        else:
+            for doc_id in removidos | alterados:
+                self._entidades_total -= self._entidades_por_doc.pop(doc_id, Counter())
+            documentos = (self.repo_doc.buscar_por_id(doc_id) for doc_id in sorted(alterados))
+            textos = ((doc.id, doc.texto) for doc in documentos if doc is not None)
+
+        for analise in analyzer.analisar_lote(textos, "ru", n_process=n_process):
+            contagem = Counter(
+                (TIPOS_AGREGADOS[e.tipo], e.texto)
+                for e in analise.entidades
+                if e.tipo in TIPOS_AGREGADOS
+            )
+            self._entidades_total -= self._entidades_por_doc.pop(analise.documento_id, Counter())
+            self._entidades_por_doc[analise.documento_id] = contagem
+            self._entidades_total += contagem
+            if _telemetry:
+                _telemetry.increment("analisar_acervo.analise_entidades.sucesso")
+
+        self._marca_entidades = marca
+
     def gerar_wordcloud_geral(self, idioma: str = "ru") -> Path:
         """
         Gera nuvem de palavras com todo o acervo.
@@ -125,12 +211,9 @@ class AnalisarAcervo:
             _telemetry.increment("analisar_acervo.wordcloud.iniciado")
             _telemetry.increment(f"analisar_acervo.wordcloud.idioma.{idioma}")
 
-        documentos = self.repo_doc.listar(limite=500)
-
-        # Concatenar textos (limitado)
-        texto_completo = ""
-        for i, doc in enumerate(documentos[:100]):  # Limitar para performance
-            texto_completo += doc.texto[:5000] + "\n"
+        # Concatenar textos (limitado para performance)
+        documentos = islice(self.repo_doc.iterar(batch_size=100, colunas=("texto",)), 100)
+        texto_completo = "\n".join(doc.texto[:5000] for doc in documentos) + "\n"
 
         nome_arquivo = f"wordcloud_acervo_{idioma}_{datetime.now().strftime('%Y%m%d')}.png"
         caminho = Path("analises") / nome_arquivo
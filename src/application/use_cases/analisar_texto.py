@@ -3,17 +3,22 @@
 Caso de uso: Analisar um documento individual com telemetria.
 """
 
+import hashlib
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from src.domain.interfaces.repositories import RepositorioDocumento
+from src.domain.interfaces.repositorio_analise import RepositorioAnalise
 from src.domain.interfaces.repositorio_traducao import RepositorioTraducao
 from src.domain.value_objects.analise_texto import AnaliseTexto
 from src.infrastructure.analysis.spacy_analyzer import SpacyAnalyzer
 from src.infrastructure.analysis.wordcloud_generator import WordCloudGenerator
 from src.infrastructure.registry import ServiceRegistry
 
+logger = logging.getLogger(__name__)
+
 # Telemetria opcional
 _telemetry = None
 
@@ -35,16 +40,19 @@ class AnalisarDocumento:
         repo_doc: RepositorioDocumento,
         repo_trad: Optional[RepositorioTraducao] = None,
         registry: Optional[ServiceRegistry] = None,
+        repo_analise: Optional[RepositorioAnalise] = None,
     ):
         """
         Args:
             repo_doc: Repositório de documentos
             repo_trad: Repositório de traduções (opcional)
             registry: Registry de serviços (para lazy loading)
+            repo_analise: Análises já calculadas (opcional; sem ele, sempre reanalisa)
         """
         self.repo_doc = repo_doc
         self.repo_trad = repo_trad
         self.registry = registry or ServiceRegistry()
+        self.repo_analise = repo_analise
 
     def _get_analyzer(self) -> SpacyAnalyzer:
         """Obtém analisador spaCy do registry (lazy)."""
@@ -54,6 +62,39 @@ class AnalisarDocumento:
         """Obtém gerador de wordcloud do registry (lazy)."""
         return self.registry.get("wordcloud")
 
+    def _chave_analise(self, analyzer: SpacyAnalyzer, texto: str, idioma: str):
+        """(hash do texto, modelo) que identificam a análise gravada, ou None sem cache."""
+        if self.repo_analise is None:
+            return None
+        hash_texto = hashlib.sha256(texto.encode("utf-8")).hexdigest()
+        return hash_texto, analyzer.identificar_modelo(idioma)
+
+    def _analise_gravada(self, documento_id: int, idioma: str, chave) -> Optional[AnaliseTexto]:
+        """Análise gravada para a chave (falhas do cache contam como ausência)."""
+        if chave is None:
+            return None
+        try:
+            analise = self.repo_analise.buscar(documento_id, idioma, *chave)
+        except Exception as e:
+            logger.warning(f"⚠️ Falha ao ler análise gravada do documento {documento_id}: {e}")
+            analise = None
+        if _telemetry:
+            _telemetry.increment(
+                "analisar_documento.cache.hit" if analise else "analisar_documento.cache.miss"
+            )
+        return analise
+
+    def _gravar_analise(self, analise: AnaliseTexto, chave) -> None:
+        """Grava a análise calculada; falhas não impedem o retorno do resultado."""
+        if chave is None:
+            return
+        try:
+            self.repo_analise.salvar(analise, *chave)
+        except Exception as e:
+            logger.warning(f"⚠️ Falha ao gravar análise do documento {analise.documento_id}: {e}")
+            if _telemetry:
+                _telemetry.increment("analisar_documento.cache.erro_gravacao")
+
     def executar(
         self, documento_id: int, idioma: str = "ru", gerar_wordcloud: bool = False
     ) -> Optional[AnaliseTexto]:
@@ -92,10 +133,15 @@ class AnalisarDocumento:
                 return None
             texto = traducao.texto_traduzido
 
-        # 2. Analisar (usa registry para obter analyzer)
+        # 2. Analisar (usa registry para obter analyzer), reaproveitando a
+        # análise gravada se o texto e o modelo não mudaram
         try:
             analyzer = self._get_analyzer()
-            analise = analyzer.analisar(texto=texto, documento_id=documento_id, idioma=idioma)
+            chave = self._chave_analise(analyzer, texto, idioma)
+            analise = self._analise_gravada(documento_id, idioma, chave)
+            if analise is None:
+                analise = analyzer.analisar(texto=texto, documento_id=documento_id, idioma=idioma)
+                self._gravar_analise(analise, chave)
             if _telemetry:
                 _telemetry.increment("analisar_documento.analise.sucesso")
                 _telemetry.increment("analisar_documento.caracteres", value=len(texto))
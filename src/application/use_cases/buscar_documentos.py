@@ -0,0 +1,71 @@
+"""
+Caso de uso: Buscar documentos por texto (títulos, textos e traduções).
+"""
+
+from typing import Dict, Optional
+
+from src.domain.interfaces.repositories import RepositorioDocumento
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+class BuscarDocumentos:
+    """
+    Caso de uso para busca textual no acervo.
+
+    Responsabilidades:
+    - Validar a consulta
+    - Paginar resultados ordenados por relevância
+    """
+
+    def __init__(self, repo: RepositorioDocumento):
+        self.repo = repo
+
+    def executar(
+        self,
+        query: str,
+        pagina: int = 1,
+        limite: int = 20,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+    ) -> Dict:
+        """
+        Executa a busca com filtros e paginação.
+        """
+        query = (query or "").strip()
+        pagina = max(pagina, 1)
+
+        if _telemetry:
+            _telemetry.increment("buscar_documentos.executar.iniciado")
+
+        items = []
+        if query:
+            # Busca um item a mais para saber se existe próxima página
+            items = self.repo.buscar_texto(
+                query,
+                centro=centro,
+                tipo=tipo,
+                limite=limite + 1,
+                offset=(pagina - 1) * limite,
+            )
+
+        tem_proxima = len(items) > limite
+
+        if _telemetry:
+            _telemetry.increment("buscar_documentos.executar.concluido")
+            _telemetry.increment("buscar_documentos.resultados", value=len(items[:limite]))
+
+        return {
+            "items": items[:limite],
+            "query": query,
+            "pagina": pagina,
+            "tem_proxima": tem_proxima,
+            "filtros": {"centro": centro, "tipo": tipo, "limite": limite},
+        }
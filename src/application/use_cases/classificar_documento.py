@@ -5,12 +5,26 @@ Orquestra a classificação de um documento baseado em seu título.
 """
 
 import re
-from typing import Optional
+from itertools import islice
+from typing import List, Optional
 
 from src.domain.entities.documento import Documento
 from src.domain.interfaces.repositories import RepositorioDocumento
 from src.domain.value_objects.tipo_documento import TipoDocumento
 
+# Metadados lidos na classificação em lote: todos menos o texto, de modo que
+# os documentos não são parciais e a gravação preserva o texto no banco
+COLUNAS_CLASSIFICACAO = (
+    "data_original",
+    "tipo_documento",
+    "tipo_descricao",
+    "pessoa_principal",
+    "remetente",
+    "destinatario",
+    "envolvidos",
+    "tem_anexos",
+)
+
 
 class ClassificarDocumento:
     """
@@ -40,43 +54,54 @@ class ClassificarDocumento:
         Returns:
             Documento classificado ou None se não encontrado
         """
-        # 1. Buscar documento
-        documento = self.repo.buscar_por_id(documento_id)
+        # 1. Buscar documento (a classificação usa só o título)
+        documento = self.repo.buscar_por_id(documento_id, carregar_texto=False)
         if not documento:
             return None
 
         # 2. Aplicar classificação
         documento = self._classificar(documento)
 
-        # 3. Salvar resultados
+        # 3. Salvar resultados (o repositório atualiza também o índice de pessoas)
         self.repo.salvar(documento)
 
         return documento
 
-    def executar_em_lote(self, limite: int = None) -> int:
+    def executar_em_lote(self, limite: int = None, tamanho_lote: int = 500) -> int:
         """
-        Classifica múltiplos documentos não classificados.
+        Classifica os documentos não classificados de todo o acervo.
+
+        Os documentos são percorridos em lotes (sem o texto) e gravados com
+        uma chamada a salvar_em_lote por lote.
 
         Args:
             limite: Número máximo de documentos (None = todos)
+            tamanho_lote: Documentos lidos e gravados por vez
 
         Returns:
             int: Quantidade de documentos classificados
         """
-        # Buscar documentos sem classificação
-        todos = self.repo.listar(limite=1000)  # Busca grande
-        nao_classificados = [d for d in todos if not d.tipo]
-
+        documentos = self.repo.iterar(batch_size=tamanho_lote, colunas=COLUNAS_CLASSIFICACAO)
+        nao_classificados = (d for d in documentos if not d.tipo)
         if limite:
-            nao_classificados = nao_classificados[:limite]
-
-        count = 0
-        for doc in nao_classificados:
-            doc_classificado = self._classificar(doc)
-            self.repo.salvar(doc_classificado)
-            count += 1
-
-        return count
+            nao_classificados = islice(nao_classificados, limite)
+
+        total = 0
+        lote: List[Documento] = []
+        for documento in nao_classificados:
+            lote.append(self._classificar(documento))
+            if len(lote) == tamanho_lote:
+                total += self._salvar_lote(lote)
+                lote = []
+        if lote:
+            total += self._salvar_lote(lote)
+
+        return total
+
+    def _salvar_lote(self, lote: List[Documento]) -> int:
+        """Grava um lote classificado e retorna quantos foram salvos."""
+        ids = self.repo.salvar_em_lote(lote, chunk_size=len(lote))
+        return sum(1 for id_salvo in ids if id_salvo is not None)
 
     def _classificar(self, documento: Documento) -> Documento:
         """
@@ -3,8 +3,6 @@
 Caso de uso: Obter estatísticas do acervo.
 """
 
-from collections import Counter
-
 from src.application.dtos.estatisticas_dto import EstatisticasDTO
 from src.domain.interfaces.repositories import RepositorioDocumento
 from src.domain.value_objects.nome_russo import NomeRusso
@@ -21,80 +19,35 @@ class ObterEstatisticas:
     def executar(self) -> EstatisticasDTO:
         """
         Calcula estatísticas baseadas em todos os documentos.
-        """
-        # Buscar todos os documentos (limitado para performance)
-        documentos = self.repo.listar(limite=5000)
-
-        # Inicializar contadores
-        centro_counter = Counter()
-        tipo_counter = Counter()
-        pessoa_counter = Counter()
-
-        # Métricas especiais
-        cartas = 0
-        declaracoes = 0
-        relatorios = 0
-        acareacoes = 0
-        acusacoes = 0
-        laudos = 0
-        anexos = 0
-
-        # Processar documentos
-        for doc in documentos:
-            # Por centro
-            centro_counter[doc.centro] += 1
 
-            # Por tipo
-            if doc.tipo:
-                tipo_counter[doc.tipo] += 1
-
-                # Contagens específicas
-                if doc.tipo == "carta":
-                    cartas += 1
-                elif doc.tipo == "declaracao":
-                    declaracoes += 1
-                elif doc.tipo == "relatorio":
-                    relatorios += 1
-                elif doc.tipo == "acareacao":
-                    acareacoes += 1
-                elif doc.tipo == "acusacao":
-                    acusacoes += 1
-                elif doc.tipo == "laudo":
-                    laudos += 1
-
-            # Pessoas
-            if doc.pessoa_principal:
-                pessoa_counter[doc.pessoa_principal] += 1
-
-            # Anexos
-            if doc.tem_anexos:
-                anexos += 1
+        As contagens são agregadas no banco (uma consulta), sem carregar
+        documentos na memória.
+        """
+        agregados = self.repo.agregados(limite_pessoas=15)
+        por_tipo = agregados.por_tipo
 
         # Pessoas mais frequentes (com tradução)
         pessoas_frequentes = []
-        for nome, count in pessoa_counter.most_common(15):
+        for nome, count in agregados.pessoas_frequentes:
             try:
                 nome_en = NomeRusso(nome).transliterar()
             except Exception:
                 nome_en = nome
             pessoas_frequentes.append((nome, count, nome_en))
 
-        # Traduções (mock por enquanto - será integrado depois)
-        traducoes_por_idioma = {"en": 0, "pt": 0}
-
         return EstatisticasDTO(
-            total_documentos=len(documentos),
-            total_traducoes=0,  # Será implementado
-            documentos_por_centro=dict(centro_counter),
-            documentos_por_tipo=dict(tipo_counter),
-            traducoes_por_idioma=traducoes_por_idioma,
+            total_documentos=agregados.total_documentos,
+            total_traducoes=agregados.total_traducoes,
+            documentos_por_centro=agregados.por_centro,
+            documentos_por_tipo=por_tipo,
+            traducoes_por_idioma=agregados.traducoes_por_idioma,
             pessoas_frequentes=pessoas_frequentes,
-            cartas=cartas,
-            declaracoes=declaracoes,
-            relatorios=relatorios,
-            acareacoes=acareacoes,
-            acusacoes=acusacoes,
-            laudos=laudos,
-            documentos_com_anexos=anexos,
-            custo_total_traducoes=0.0,  # Será implementado
+            cartas=por_tipo.get("carta", 0),
+            declaracoes=por_tipo.get("declaracao", 0),
+            relatorios=por_tipo.get("relatorio", 0),
+            acareacoes=por_tipo.get("acareacao", 0),
+            acusacoes=por_tipo.get("acusacao", 0),
+            laudos=por_tipo.get("laudo", 0),
+            documentos_com_anexos=agregados.com_anexos,
+            custo_total_traducoes=agregados.custo_total_traducoes,
         )
@@ -23,6 +23,13 @@ def configure_telemetry(telemetry_instance=None):
     _telemetry = telemetry_instance
 
 
+# Colunas necessárias para o relatório (o texto não é carregado)
+COLUNAS_RELATORIO = ("data_original", "tipo_documento", "pessoa_principal", "tem_anexos")
+
+# Documentos cujas traduções entram no relatório (amostra)
+AMOSTRA_TRADUCOES = 100
+
+
 class GerarRelatorio:
     """
     Caso de uso para gerar relatórios avançados.
@@ -41,9 +48,6 @@ class GerarRelatorio:
         if _telemetry:
             _telemetry.increment("gerar_relatorio.coletar_dados.iniciado")
 
-        # Buscar todos os documentos (limitado para performance)
-        documentos = self.repo_doc.listar(limite=5000)
-
         # Inicializar contadores com type hints
         centro_counter: Counter[str] = Counter()
         tipo_counter: Counter[str] = Counter()
@@ -59,9 +63,15 @@ class GerarRelatorio:
         acusacoes = 0
         laudos = 0
         anexos = 0
+        total_documentos = 0
+        amostra_ids: List[int] = []
+
+        # Processar documentos (streaming, sem carregar o texto)
+        for doc in self.repo_doc.iterar(colunas=COLUNAS_RELATORIO):
+            total_documentos += 1
+            if doc.id is not None and len(amostra_ids) < AMOSTRA_TRADUCOES:
+                amostra_ids.append(doc.id)
 
-        # Processar documentos
-        for doc in documentos:
             # Por centro
             centro_counter[doc.centro] += 1
 
@@ -120,20 +130,19 @@ class GerarRelatorio:
 
         if self.repo_trad:
             # Amostra para performance
-            for doc in documentos[:100]:
-                if doc.id is not None:  # ← ADICIONAR ESTA VERIFICAÇÃO
-                    traducoes = self.repo_trad.listar_por_documento(doc.id)
-                    total_traducoes += len(traducoes)
-                    for t in traducoes:
-                        idioma = t.idioma
-                        traducoes_por_idioma[idioma] = traducoes_por_idioma.get(idioma, 0) + 1
+            for doc_id in amostra_ids:
+                traducoes = self.repo_trad.listar_por_documento(doc_id)
+                total_traducoes += len(traducoes)
+                for t in traducoes:
+                    idioma = t.idioma
+                    traducoes_por_idioma[idioma] = traducoes_por_idioma.get(idioma, 0) + 1
 
         if _telemetry:
             _telemetry.increment("gerar_relatorio.coletar_dados.concluido")
-            _telemetry.increment("gerar_relatorio.documentos_processados", value=len(documentos))
+            _telemetry.increment("gerar_relatorio.documentos_processados", value=total_documentos)
 
         return {
-            "total_documentos": len(documentos),
+            "total_documentos": total_documentos,
             "total_traducoes": total_traducoes,
             "documentos_por_centro": dict(centro_counter),
             "documentos_por_tipo": dict(tipo_counter),
@@ -3,12 +3,13 @@
 Caso de uso: Listar documentos com paginação e filtros.
 """
 
-from collections import Counter
-from typing import Counter as CounterType
-from typing import Dict, List, Optional
+import base64
+import binascii
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.application.dtos.documento_dto import DocumentoListaDTO
 from src.domain.interfaces.repositories import RepositorioDocumento
+from src.domain.interfaces.repositorio_traducao import RepositorioTraducao
 from src.domain.value_objects.tipo_documento import TipoDocumento
 
 # Telemetria opcional
@@ -21,6 +22,30 @@ def configure_telemetry(telemetry_instance=None):
     _telemetry = telemetry_instance
 
 
+def codificar_cursor(direcao: str, documento_id: int) -> str:
+    """
+    Gera um cursor opaco para paginação por chave.
+
+    Args:
+        direcao: 'a' (depois do id) ou 'b' (antes do id)
+        documento_id: ID de referência
+    """
+    bruto = f"{direcao}:{documento_id}".encode()
+    return base64.urlsafe_b64encode(bruto).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor: str) -> Optional[Tuple[str, int]]:
+    """Decodifica um cursor opaco. Retorna None se for inválido."""
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        direcao, documento_id = bruto.split(":", 1)
+        if direcao not in ("a", "b"):
+            return None
+        return direcao, int(documento_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
 class ListarDocumentos:
     """
     Caso de uso para listar documentos.
@@ -28,11 +53,12 @@ class ListarDocumentos:
     Responsabilidades:
     - Aplicar filtros (centro, tipo)
     - Paginar resultados
-    - Converter para DTO de listagem
+    - Converter para DTO de listagem (com idiomas traduzidos)
     """
 
-    def __init__(self, repo: RepositorioDocumento):
+    def __init__(self, repo: RepositorioDocumento, repo_trad: Optional[RepositorioTraducao] = None):
         self.repo = repo
+        self.repo_trad = repo_trad
         self._tradutor_nomes: Optional[bool] = None  # ← MyPy: type hint corrigido
 
     def com_traducao_nomes(self, ativo: bool = True):
@@ -48,44 +74,96 @@ class ListarDocumentos:
         limite: int = 20,
         centro: Optional[str] = None,
         tipo: Optional[str] = None,
+        cursor: Optional[str] = None,
+        total: Optional[int] = None,
     ) -> Dict:
         """
         Executa a listagem com filtros e paginação.
+
+        Sem cursor usa paginação por página (offset). Com um cursor
+        (ver cursor_proximo/cursor_anterior no resultado) a página é buscada
+        por chave, com custo constante em qualquer profundidade do acervo.
+
+        O total só é contado na paginação por página. Páginas por cursor não
+        contam: usam o `total` repassado pelo chamador (o da primeira página)
+        ou retornam total e total_paginas como None.
         """
         if _telemetry:
             _telemetry.increment("listar_documentos.executar.iniciado")
             _telemetry.increment(f"listar_documentos.pagina.{pagina}")
 
-        offset = (pagina - 1) * limite
+        referencia = decodificar_cursor(cursor) if cursor else None
+        if cursor and referencia is None and _telemetry:
+            _telemetry.increment("listar_documentos.cursor_invalido")
+
+        if referencia is None:
+            offset = (pagina - 1) * limite
+
+            # Buscar resumos (listagem nunca carrega o texto)
+            documentos = self.repo.listar_resumos(
+                offset=offset, limite=limite, centro=centro, tipo=tipo
+            )
+            tem_anterior = pagina > 1
+            tem_proxima = None  # Decidido pelo total
+        else:
+            direcao, documento_id = referencia
+            if _telemetry:
+                _telemetry.increment("listar_documentos.executar.cursor")
+
+            # Busca um item a mais para saber se a navegação continua
+            if direcao == "a":
+                documentos = self.repo.listar_resumos(
+                    limite=limite + 1, centro=centro, tipo=tipo, after_id=documento_id
+                )
+                tem_proxima = len(documentos) > limite
+                documentos = documentos[:limite]
+                tem_anterior = True
+            else:
+                documentos = self.repo.listar_resumos(
+                    limite=limite + 1, centro=centro, tipo=tipo, before_id=documento_id
+                )
+                tem_anterior = len(documentos) > limite
+                documentos = documentos[-limite:] if documentos else []
+                tem_proxima = True
 
-        # Buscar documentos
-        documentos = self.repo.listar(offset=offset, limite=limite, centro=centro, tipo=tipo)
+        # Contar total (a paginação por página precisa dele para tem_proxima)
+        if total is None and referencia is None:
+            total = self.repo.contar(centro=centro, tipo=tipo)
 
-        # Contar total
-        total = self.repo.contar(centro=centro, tipo=tipo)
+        # Idiomas traduzidos da página inteira (uma consulta)
+        idiomas = self._idiomas_da_pagina(documentos)
 
         # Converter para DTO
-        items = []
-        for doc in documentos:
-            # Verificar se tem tradução (com proteção contra None)
-            tem_traducao = False
-            if doc.id is not None:  # ← MyPy: verificação adicionada
-                tem_traducao = self._verificar_traducoes(doc.id)
-
-            dto = DocumentoListaDTO.from_domain(
-                doc, tem_traducao=tem_traducao, tradutor_nomes=self._tradutor_nomes
+        items = [
+            DocumentoListaDTO.from_domain(
+                doc, idiomas=idiomas.get(doc.id), tradutor_nomes=self._tradutor_nomes
             )
-            items.append(dto)
+            for doc in documentos
+        ]
 
         if _telemetry:
             _telemetry.increment("listar_documentos.executar.concluido")
             _telemetry.increment("listar_documentos.resultados", value=len(items))
 
+        total_paginas = (total + limite - 1) // limite if total is not None else None
+        if tem_proxima is None:
+            tem_proxima = pagina < total_paginas
+
+        cursor_proximo = None
+        cursor_anterior = None
+        if documentos:
+            if tem_proxima and documentos[-1].id is not None:
+                cursor_proximo = codificar_cursor("a", documentos[-1].id)
+            if tem_anterior and documentos[0].id is not None:
+                cursor_anterior = codificar_cursor("b", documentos[0].id)
+
         return {
             "items": items,
             "total": total,
             "pagina": pagina,
-            "total_paginas": (total + limite - 1) // limite,
+            "total_paginas": total_paginas,
+            "cursor_proximo": cursor_proximo,
+            "cursor_anterior": cursor_anterior,
             "filtros": {"centro": centro, "tipo": tipo, "limite": limite},
         }
 
@@ -99,18 +177,12 @@ class ListarDocumentos:
         if _telemetry:
             _telemetry.increment("listar_documentos.listar_tipos.iniciado")
 
-        # Buscar todos (limitado para performance)
-        docs = self.repo.listar(limite=1000, centro=centro)
-
-        # Contar por tipo
-        counter: CounterType[str] = Counter()  # ← MyPy: type hint adicionado
-        for doc in docs:
-            if doc.tipo:
-                counter[doc.tipo] += 1
+        # Contagem por tipo agregada no banco (mais frequentes primeiro)
+        por_tipo = self.repo.contar_por_tipo(centro=centro)
 
         # Converter para lista ordenada
         resultado = []
-        for tipo, count in counter.most_common():
+        for tipo, count in por_tipo.items():
             try:
                 tipo_enum = TipoDocumento(tipo)
                 descricao = tipo_enum.descricao_pt
@@ -127,35 +199,23 @@ class ListarDocumentos:
 
         return resultado
 
-    def _verificar_traducoes(self, documento_id: int) -> bool:
+    def _idiomas_da_pagina(self, documentos) -> Dict[int, Set[str]]:
         """
-        Verifica se documento tem alguma tradução consultando o banco.
+        Busca os idiomas traduzidos de todos os documentos da página.
         """
-        if _telemetry:
-            _telemetry.increment("listar_documentos.verificar_traducoes.iniciado")
+        if not self.repo_trad or not documentos:
+            return {}
 
+        ids = [doc.id for doc in documentos if doc.id is not None]
         try:
-            # Usar o repositório para buscar traduções
-            from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
-
-            repo = SQLiteDocumentoRepository()
-
-            with repo._conexao() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT COUNT(*) FROM traducoes WHERE documento_id = ?", (documento_id,)
-                )
-                count = cursor.fetchone()[0]
-                tem_traducao = count > 0
-
-                if _telemetry:
-                    _telemetry.increment("listar_documentos.verificar_traducoes.sucesso")
-
-                return tem_traducao
-
+            idiomas = self.repo_trad.idiomas_por_documento(ids)
         except Exception as e:
-            # Se algo der errado, assume que não tem tradução
+            # Se algo der errado, lista sem indicar traduções
             if _telemetry:
-                _telemetry.increment("listar_documentos.verificar_traducoes.erro")
+                _telemetry.increment("listar_documentos.idiomas.erro")
             print(f"Erro ao verificar traduções: {e}")
-            return False
+            return {}
+
+        if _telemetry:
+            _telemetry.increment("listar_documentos.idiomas.sucesso")
+        return idiomas
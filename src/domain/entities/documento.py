@@ -7,7 +7,7 @@ Entidade principal do sistema, representa um documento histórico.
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple
 
 # Telemetria opcional
 _telemetry = None
@@ -30,6 +30,18 @@ def configure_telemetry(telemetry_instance=None, monitor_decorator=None):
         _monitor = monitor_decorator
 
 
+def contar_palavras(texto: Optional[str]) -> int:
+    """Número aproximado de palavras (separadas por espaço)."""
+    return len(texto.split()) if texto else 0
+
+
+def contar_paragrafos(texto: Optional[str]) -> int:
+    """Número de parágrafos (linhas não vazias)."""
+    if not texto:
+        return 0
+    return sum(1 for linha in texto.split("\n") if linha.strip())
+
+
 @dataclass
 class Documento:
     """
@@ -56,6 +68,13 @@ class Documento:
     envolvidos: Optional[List[str]] = field(default_factory=list)
     tem_anexos: bool = False
 
+    # Carregamento sob demanda do texto (ver adiar_texto) e contagens já
+    # conhecidas (ver registrar_tamanhos). Atributos de classe, não campos:
+    # não entram em __init__, __eq__ nem __repr__.
+    _carregar_texto = None
+    _tamanhos: ClassVar[Optional[Tuple[int, int, int]]] = None
+    _campos_omitidos: ClassVar[Tuple[str, ...]] = ()
+
     def __post_init__(self):
         """Validações após inicialização"""
         if self.centro not in ["lencenter", "moscenter"]:
@@ -76,11 +95,102 @@ class Documento:
         if _telemetry:
             _telemetry.increment("documento.criado")
 
+    def __setattr__(self, nome: str, valor: Any):
+        # Contagens registradas deixam de valer quando o texto muda
+        if nome == "texto":
+            self.__dict__.pop("_tamanhos", None)
+        object.__setattr__(self, nome, valor)
+
+    def adiar_texto(self, carregar: Callable[[], Optional[str]]) -> "Documento":
+        """
+        Passa a buscar o texto somente no primeiro acesso a `texto`.
+
+        Args:
+            carregar: Função que retorna o texto (ex.: repo.obter_texto)
+
+        Returns:
+            O próprio documento
+        """
+        self.__dict__.pop("texto", None)
+        self._carregar_texto = carregar
+        return self
+
+    def registrar_tamanhos(self, caracteres: int, palavras: int, paragrafos: int) -> "Documento":
+        """
+        Informa contagens já calculadas (ex.: colunas do banco).
+
+        As propriedades tamanho_* passam a usá-las sem percorrer o texto;
+        atribuir um novo `texto` descarta as contagens.
+
+        Returns:
+            O próprio documento
+        """
+        self._tamanhos = (caracteres, palavras, paragrafos)
+        return self
+
+    def marcar_parcial(self, campos: Iterable[str]) -> "Documento":
+        """
+        Registra metadados não carregados (ex.: leitura de poucas colunas).
+
+        Esses campos têm valor padrão, não o gravado; o repositório recusa
+        salvar documentos parciais para não sobrescrever os valores reais.
+
+        Returns:
+            O próprio documento
+        """
+        self._campos_omitidos = tuple(campos)
+        return self
+
+    @property
+    def parcial(self) -> bool:
+        """Indica se algum metadado não foi carregado (ver marcar_parcial)."""
+        return bool(self._campos_omitidos)
+
+    @property
+    def campos_omitidos(self) -> Tuple[str, ...]:
+        """Metadados não carregados (ver marcar_parcial)."""
+        return self._campos_omitidos
+
+    @classmethod
+    def reconstituir(cls, campos: Dict[str, Any]) -> "Documento":
+        """
+        Recria um documento já validado (ex.: lido do banco) sem __init__.
+
+        Não executa as validações de __post_init__ nem a telemetria de
+        criação: destina-se à carga em massa de linhas gravadas pelo próprio
+        sistema. `campos` deve trazer todos os campos da classe (e, se
+        conhecidas, as contagens em `_tamanhos`) e passa a ser o __dict__ do
+        documento, sem cópia.
+        """
+        documento = object.__new__(cls)
+        documento.__dict__ = campos
+        return documento
+
+    def __getattr__(self, nome: str):
+        # Só é chamado quando `nome` não existe na instância
+        if nome == "texto" and self._carregar_texto is not None:
+            if _telemetry:
+                _telemetry.increment("documento.texto_carregado")
+            # Via __dict__ para manter as contagens registradas
+            texto = self.__dict__["texto"] = self._carregar_texto() or ""
+            self._carregar_texto = None
+            return texto
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {nome!r}")
+
+    @property
+    def texto_carregado(self) -> bool:
+        """
+        Indica se o texto já está em memória.
+        """
+        return "texto" in self.__dict__
+
     @property
     def tamanho_caracteres(self) -> int:
         """
         Retorna o tamanho do texto em caracteres.
         """
+        if self._tamanhos is not None:
+            return self._tamanhos[0]
         return len(self.texto)
 
     @property
@@ -88,9 +198,18 @@ class Documento:
         """
         Retorna o número aproximado de palavras.
         """
-        if not self.texto:
-            return 0
-        return len(self.texto.split())
+        if self._tamanhos is not None:
+            return self._tamanhos[1]
+        return contar_palavras(self.texto)
+
+    @property
+    def tamanho_paragrafos(self) -> int:
+        """
+        Retorna o número de parágrafos (linhas não vazias).
+        """
+        if self._tamanhos is not None:
+            return self._tamanhos[2]
+        return contar_paragrafos(self.texto)
 
     @property
     def resumo(self) -> str:
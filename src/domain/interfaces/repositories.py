@@ -5,9 +5,14 @@ Define contratos que a infraestrutura deve implementar.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 from src.domain.entities.documento import Documento
+from src.domain.value_objects.agregados_acervo import AgregadosAcervo
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
+from src.domain.value_objects.resultado_busca import ResultadoBusca
+from src.domain.value_objects.resultado_upsert import ResultadoUpsert
+from src.domain.value_objects.resumo_documento import ResumoDocumento
 
 
 class RepositorioDocumento(ABC):
@@ -32,18 +37,66 @@ class RepositorioDocumento(ABC):
         pass
 
     @abstractmethod
-    def buscar_por_id(self, id: int) -> Optional[Documento]:
+    def salvar_em_lote(
+        self, documentos: Iterable[Documento], chunk_size: int = 500
+    ) -> List[Optional[int]]:
+        """
+        Persiste vários documentos, um lote (chunk) por transação.
+
+        Args:
+            documentos: Entidades a persistir
+            chunk_size: Quantidade de documentos por transação
+
+        Returns:
+            List[Optional[int]]: IDs na ordem da entrada (None nos lotes que falharam)
+        """
+        pass
+
+    @abstractmethod
+    def upsert_por_url(
+        self, documentos: Iterable[Documento], chunk_size: int = 500
+    ) -> ResultadoUpsert:
+        """
+        Grava documentos usando a URL como chave (recoleta idempotente).
+
+        Documentos com conteúdo inalterado não são regravados.
+
+        Args:
+            documentos: Entidades com o texto carregado
+            chunk_size: Quantidade de documentos por transação
+
+        Returns:
+            ResultadoUpsert: IDs na ordem da entrada e contagens
+        """
+        pass
+
+    @abstractmethod
+    def buscar_por_id(self, id: int, carregar_texto: bool = True) -> Optional[Documento]:
         """
         Busca documento pelo ID.
 
         Args:
             id: Identificador único
+            carregar_texto: False para buscar o texto só no primeiro acesso
 
         Returns:
             Documento ou None se não encontrado
         """
         pass
 
+    @abstractmethod
+    def obter_texto(self, documento_id: int) -> Optional[str]:
+        """
+        Busca apenas o texto de um documento.
+
+        Args:
+            documento_id: ID do documento
+
+        Returns:
+            Texto ou None se o documento não existir
+        """
+        pass
+
     @abstractmethod
     def listar(
         self,
@@ -51,6 +104,9 @@ class RepositorioDocumento(ABC):
         limite: int = 20,
         centro: Optional[str] = None,
         tipo: Optional[str] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        carregar_texto: bool = True,
     ) -> List[Documento]:
         """
         Lista documentos com paginação e filtros.
@@ -60,12 +116,74 @@ class RepositorioDocumento(ABC):
             limite: Número máximo de registros
             centro: Filtrar por centro ('lencenter' ou 'moscenter')
             tipo: Filtrar por tipo de documento
+            after_id: Cursor - apenas documentos com id maior (ignora offset)
+            before_id: Cursor - apenas documentos com id menor (ignora offset)
+            carregar_texto: False para buscar os textos só no primeiro acesso
 
         Returns:
             List[Documento]: Lista de documentos
         """
         pass
 
+    @abstractmethod
+    def listar_resumos(
+        self,
+        offset: int = 0,
+        limite: int = 20,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[ResumoDocumento]:
+        """
+        Lista resumos de documentos (sem carregar o texto).
+
+        Mesmos filtros e cursores de listar().
+
+        Returns:
+            List[ResumoDocumento]: Resumos com tamanho calculado no banco
+        """
+        pass
+
+    @abstractmethod
+    def documentos_por_pessoa(
+        self, nome: str, papel: Optional[str] = None
+    ) -> List[ResumoDocumento]:
+        """
+        Lista documentos em que uma pessoa aparece.
+
+        Args:
+            nome: Nome da pessoa
+            papel: 'principal', 'remetente', 'destinatario' ou 'envolvido'
+                (None = qualquer papel)
+
+        Returns:
+            List[ResumoDocumento]: Resumos ordenados por id
+        """
+        pass
+
+    @abstractmethod
+    def iterar(
+        self,
+        batch_size: int = 500,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        colunas: Optional[Sequence[str]] = None,
+    ) -> Iterator[Documento]:
+        """
+        Percorre todos os documentos de forma preguiçosa, em lotes.
+
+        Args:
+            batch_size: Documentos carregados por lote
+            centro: Filtrar por centro
+            tipo: Filtrar por tipo de documento
+            colunas: Colunas a carregar além das essenciais (None = todas)
+
+        Returns:
+            Iterator[Documento]: Documentos em ordem de ID
+        """
+        pass
+
     @abstractmethod
     def contar(self, centro: Optional[str] = None, tipo: Optional[str] = None) -> int:
         """
@@ -80,6 +198,39 @@ class RepositorioDocumento(ABC):
         """
         pass
 
+    @abstractmethod
+    def contar_por_tipo(self, centro: Optional[str] = None) -> Dict[str, int]:
+        """
+        Conta documentos classificados por tipo.
+
+        Args:
+            centro: Filtrar por centro
+
+        Returns:
+            Dict[str, int]: Contagem por tipo, da mais frequente para a menos
+        """
+        pass
+
+    @abstractmethod
+    def agregados(
+        self,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        limite_pessoas: int = 15,
+    ) -> AgregadosAcervo:
+        """
+        Calcula contagens agregadas do acervo em uma única consulta.
+
+        Args:
+            centro: Filtrar por centro
+            tipo: Filtrar por tipo
+            limite_pessoas: Quantidade de pessoas mais frequentes
+
+        Returns:
+            AgregadosAcervo: Contagens por centro, tipo, pessoa, anexos e traduções
+        """
+        pass
+
     @abstractmethod
     def remover(self, id: int) -> bool:
         """
@@ -92,3 +243,41 @@ class RepositorioDocumento(ABC):
             bool: True se removido, False se não encontrado
         """
         pass
+
+    @abstractmethod
+    def listar_alterados_desde(self, marca: int = 0, limite: int = 1000) -> LoteAlteracoes:
+        """
+        Lista documentos inseridos, atualizados ou removidos após a marca.
+
+        Args:
+            marca: Checkpoint retornado pela chamada anterior (0 = desde o início)
+            limite: Máximo de entradas do log lidas por chamada
+
+        Returns:
+            LoteAlteracoes: IDs alterados/removidos e a nova marca
+        """
+        pass
+
+    @abstractmethod
+    def buscar_texto(
+        self,
+        query: str,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        limite: int = 20,
+        offset: int = 0,
+    ) -> List[ResultadoBusca]:
+        """
+        Busca textual em títulos, textos e traduções.
+
+        Args:
+            query: Termos a buscar (sufixo * para prefixo)
+            centro: Filtrar por centro
+            tipo: Filtrar por tipo de documento
+            limite: Número máximo de resultados
+            offset: Deslocamento para paginação
+
+        Returns:
+            List[ResultadoBusca]: Acertos ordenados por relevância
+        """
+        pass
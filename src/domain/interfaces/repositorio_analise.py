@@ -0,0 +1,34 @@
+"""
+Interface para repositório de análises de texto já calculadas.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.value_objects.analise_texto import AnaliseTexto
+
+
+class RepositorioAnalise(ABC):
+    """
+    Interface para o repositório de análises (cache persistente).
+
+    Uma análise vale para o texto e o modelo com que foi calculada: a busca
+    exige o hash do texto e a identificação do modelo.
+    """
+
+    @abstractmethod
+    def buscar(
+        self, documento_id: int, idioma: str, hash_texto: str, modelo: str
+    ) -> Optional[AnaliseTexto]:
+        """Análise gravada para o texto e o modelo informados (None se não houver)."""
+        pass
+
+    @abstractmethod
+    def salvar(self, analise: AnaliseTexto, hash_texto: str, modelo: str) -> None:
+        """Grava a análise, substituindo a anterior do mesmo documento e idioma."""
+        pass
+
+    @abstractmethod
+    def remover_por_documento(self, documento_id: int) -> int:
+        """Remove as análises de um documento; retorna quantas foram removidas."""
+        pass
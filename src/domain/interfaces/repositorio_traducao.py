@@ -4,9 +4,10 @@ Interface para repositório de traduções.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
 from src.domain.entities.traducao import Traducao
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
 
 
 class RepositorioTraducao(ABC):
@@ -17,6 +18,13 @@ class RepositorioTraducao(ABC):
         """Salva uma tradução."""
         pass
 
+    @abstractmethod
+    def salvar_em_lote(
+        self, traducoes: Iterable[Traducao], chunk_size: int = 500
+    ) -> List[Optional[int]]:
+        """Salva traduções em lotes transacionais; retorna IDs (None em lotes com erro)."""
+        pass
+
     @abstractmethod
     def buscar_por_id(self, id: int) -> Optional[Traducao]:
         """Busca tradução por ID."""
@@ -36,3 +44,13 @@ class RepositorioTraducao(ABC):
     def contar_por_documento(self, documento_id: int) -> int:
         """Conta traduções de um documento."""
         pass
+
+    @abstractmethod
+    def idiomas_por_documento(self, documento_ids: Iterable[int]) -> Dict[int, Set[str]]:
+        """Idiomas traduzidos de cada documento (só documentos com tradução)."""
+        pass
+
+    @abstractmethod
+    def listar_alterados_desde(self, marca: int = 0, limite: int = 1000) -> LoteAlteracoes:
+        """Traduções inseridas/atualizadas após a marca (checkpoint do log de alterações)."""
+        pass
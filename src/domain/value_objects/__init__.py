@@ -1,5 +1,18 @@
 # src/domain/value_objects/__init__.py
+from src.domain.value_objects.agregados_acervo import AgregadosAcervo
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
 from src.domain.value_objects.nome_russo import NomeRusso
+from src.domain.value_objects.resultado_busca import ResultadoBusca
+from src.domain.value_objects.resultado_upsert import ResultadoUpsert
+from src.domain.value_objects.resumo_documento import ResumoDocumento
 from src.domain.value_objects.tipo_documento import TipoDocumento
 
-__all__ = ["TipoDocumento", "NomeRusso"]
+__all__ = [
+    "TipoDocumento",
+    "NomeRusso",
+    "ResultadoBusca",
+    "ResultadoUpsert",
+    "ResumoDocumento",
+    "AgregadosAcervo",
+    "LoteAlteracoes",
+]
@@ -0,0 +1,33 @@
+"""
+Value Object: AgregadosAcervo
+Contagens agregadas do acervo calculadas pelo repositório.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class AgregadosAcervo:
+    """
+    Contagens do acervo (e das traduções) para os filtros informados.
+
+    Attributes:
+        total_documentos: Total de documentos
+        por_centro: Documentos por centro
+        por_tipo: Documentos por tipo, do mais frequente ao menos frequente
+        pessoas_frequentes: (pessoa_principal, contagem) mais frequentes
+        com_anexos: Documentos com anexos
+        total_traducoes: Total de traduções
+        traducoes_por_idioma: Traduções por idioma
+        custo_total_traducoes: Soma dos custos das traduções (USD)
+    """
+
+    total_documentos: int = 0
+    por_centro: Dict[str, int] = field(default_factory=dict)
+    por_tipo: Dict[str, int] = field(default_factory=dict)
+    pessoas_frequentes: List[Tuple[str, int]] = field(default_factory=list)
+    com_anexos: int = 0
+    total_traducoes: int = 0
+    traducoes_por_idioma: Dict[str, int] = field(default_factory=dict)
+    custo_total_traducoes: float = 0.0
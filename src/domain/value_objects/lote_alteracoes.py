@@ -0,0 +1,30 @@
+"""
+Value Object: LoteAlteracoes
+Registros alterados desde uma marca do log de alterações.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(frozen=True)
+class LoteAlteracoes:
+    """
+    Delta de uma tabela desde a última marca processada.
+
+    Cada registro aparece uma única vez, conforme sua última operação.
+
+    Attributes:
+        alterados: IDs inseridos ou atualizados (reprocessar)
+        removidos: IDs removidos (descartar resultados derivados)
+        marca: Marca a guardar como checkpoint e passar na próxima chamada
+    """
+
+    alterados: List[int] = field(default_factory=list)
+    removidos: List[int] = field(default_factory=list)
+    marca: int = 0
+
+    @property
+    def vazio(self) -> bool:
+        """Indica se não houve alterações desde a marca."""
+        return not self.alterados and not self.removidos
@@ -0,0 +1,37 @@
+"""
+Value Object: ResultadoBusca
+Representa um acerto da busca textual no acervo.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ResultadoBusca:
+    """
+    Acerto da busca textual, ordenado por relevância (bm25); um por documento.
+
+    Attributes:
+        documento_id: ID do documento encontrado
+        centro: Centro do documento
+        titulo: Título do documento
+        tipo: Tipo do documento (se classificado)
+        trecho: Trecho com os termos destacados entre <mark> e </mark>
+        relevancia: bm25 relativo ao melhor acerto do mesmo índice (original ou
+                    traduções), de -1.0 (o melhor) a 0; menor = mais relevante
+        idioma: None para o original, código do idioma para traduções
+    """
+
+    documento_id: int
+    centro: str
+    titulo: str
+    tipo: Optional[str]
+    trecho: str
+    relevancia: float
+    idioma: Optional[str] = None
+
+    @property
+    def em_traducao(self) -> bool:
+        """Indica se o acerto veio de uma tradução."""
+        return self.idioma is not None
@@ -0,0 +1,25 @@
+"""
+Value Object: ResultadoUpsert
+Resultado de uma gravação idempotente de documentos por URL.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(frozen=True)
+class ResultadoUpsert:
+    """
+    Contagens de uma recoleta gravada com upsert por URL.
+
+    Attributes:
+        ids: IDs dos documentos, na mesma ordem da entrada
+        inseridos: URLs novas
+        atualizados: URLs existentes cujo conteúdo mudou
+        inalterados: URLs existentes com o mesmo conteúdo (linha não tocada)
+    """
+
+    ids: List[int] = field(default_factory=list)
+    inseridos: int = 0
+    atualizados: int = 0
+    inalterados: int = 0
@@ -0,0 +1,33 @@
+"""
+Value Object: ResumoDocumento
+Projeção leve de um documento para listagens (sem o texto).
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ResumoDocumento:
+    """
+    Resumo de documento usado nas listagens.
+
+    Attributes:
+        id: ID do documento
+        centro: Centro do documento
+        titulo: Título do documento
+        data_original: Data original (se extraída)
+        tipo: Tipo do documento (se classificado)
+        tipo_descricao: Descrição do tipo
+        pessoa_principal: Pessoa principal (se identificada)
+        tamanho_caracteres: Tamanho do texto calculado no banco
+    """
+
+    id: int
+    centro: str
+    titulo: str
+    data_original: Optional[str] = None
+    tipo: Optional[str] = None
+    tipo_descricao: Optional[str] = None
+    pessoa_principal: Optional[str] = None
+    tamanho_caracteres: int = 0
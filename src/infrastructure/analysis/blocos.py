@@ -0,0 +1,67 @@
+# src/infrastructure/analysis/blocos.py
+"""
+Divisão de textos longos em blocos alinhados a parágrafos.
+
+O spaCy processa cada bloco separadamente (nlp.pipe), de modo que a memória
+usada depende do tamanho do bloco e não do tamanho do documento. Os blocos
+são contíguos e cobrem o texto inteiro: posições no bloco somadas ao
+deslocamento do bloco são posições no texto original.
+"""
+
+from typing import Iterator, Tuple
+
+# Caracteres por bloco. Os modelos *_sm usam cerca de 1 GB por 100 mil
+# caracteres com parser e NER; 20 mil mantém o pico baixo sem muitas chamadas.
+TAMANHO_BLOCO_PADRAO = 20000
+
+# Pontos de corte, do preferido ao último recurso
+_SEPARADORES = ("\n\n", "\n", ". ", " ")
+
+
+def _ponto_de_corte(texto: str, inicio: int, limite: int) -> int:
+    """
+    Posição (exclusiva) onde o bloco iniciado em `inicio` termina.
+
+    Corta logo após o último separador antes de `limite`, preferindo fim de
+    parágrafo. Separadores na primeira metade do bloco só valem se nenhum
+    melhor existir, para não gerar blocos pequenos demais.
+    """
+    metade = inicio + (limite - inicio) // 2
+    candidatos = []
+    for separador in _SEPARADORES:
+        posicao = texto.rfind(separador, inicio, limite)
+        if posicao < 0:
+            continue
+        fim = posicao + len(separador)
+        if fim > metade:
+            return fim
+        candidatos.append(fim)
+
+    # Só há separadores no início do bloco (ou nenhum): corte no primeiro
+    # encontrado na ordem de preferência, ou no limite (palavra gigante)
+    return candidatos[0] if candidatos else limite
+
+
+def dividir_em_blocos(texto: str, tamanho: int = TAMANHO_BLOCO_PADRAO) -> Iterator[Tuple[int, str]]:
+    """
+    Divide o texto em blocos de até `tamanho` caracteres.
+
+    Args:
+        texto: Texto completo
+        tamanho: Máximo de caracteres por bloco
+
+    Yields:
+        Pares (deslocamento, bloco), em ordem. Texto vazio gera um bloco vazio.
+
+    Raises:
+        ValueError: Se tamanho não for positivo
+    """
+    if tamanho <= 0:
+        raise ValueError(f"Tamanho de bloco deve ser positivo: {tamanho}")
+
+    inicio = 0
+    while len(texto) - inicio > tamanho:
+        fim = _ponto_de_corte(texto, inicio, inicio + tamanho)
+        yield inicio, texto[inicio:fim]
+        inicio = fim
+    yield inicio, texto[inicio:]
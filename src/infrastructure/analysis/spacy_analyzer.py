@@ -4,14 +4,13 @@ Integração com SpaCy para análise de texto multilíngue.
 Versão com lazy loading - modelos carregados sob demanda.
 """
 
+import hashlib
 import logging
-import re
 import time
 from collections import Counter
 from datetime import datetime  # <-- IMPORT ADICIONADO!
-from typing import Dict, List
-
-import spacy
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.domain.value_objects.analise_texto import (
     AnaliseTexto,
@@ -19,10 +18,56 @@ from src.domain.value_objects.analise_texto import (
     EstatisticasTexto,
     Sentimento,
 )
+from src.infrastructure.analysis.blocos import TAMANHO_BLOCO_PADRAO, dividir_em_blocos
+from src.infrastructure.analysis.spacy_models import MODELOS_PADRAO, ProvedorModelos
+from src.infrastructure.registry import ServiceRegistry
 
 logger = logging.getLogger(__name__)
 
 
+class _AcumuladorAnalise:
+    """
+    Resultados parciais de um documento processado em blocos.
+
+    Cada Doc é descartado depois de somado: guarda só contagens, o
+    vocabulário e as entidades (com posições no texto completo).
+    """
+
+    def __init__(self):
+        self.total_palavras = 0
+        self.total_frases = 0
+        self.soma_tamanhos = 0
+        self.formas = set()
+        self.frequencias = Counter()
+        self.entidades: List[Entidade] = []
+
+    def adicionar(self, doc, deslocamento: int) -> None:
+        """Soma um bloco iniciado em `deslocamento` no texto completo."""
+        for token in doc:
+            if token.is_punct or token.is_space:
+                continue
+            self.total_palavras += 1
+            self.soma_tamanhos += len(token.text)
+            self.formas.add(token.text)
+            if not token.is_stop and len(token.text) > 2:
+                self.frequencias[token.text.lower()] += 1
+
+        # A quebra de linha que encerra o bloco vira uma "frase" só de espaço
+        self.total_frases += sum(
+            1 for frase in doc.sents if not all(token.is_space for token in frase)
+        )
+        self.entidades.extend(
+            Entidade(
+                texto=ent.text,
+                tipo=ent.label_,
+                confianca=1.0,  # SpaCy não dá confidence score
+                posicao_inicio=deslocamento + ent.start_char,
+                posicao_fim=deslocamento + ent.end_char,
+            )
+            for ent in doc.ents
+        )
+
+
 class SpacyAnalyzer:
     """
     Analisador de texto usando SpaCy com lazy loading.
@@ -30,15 +75,12 @@ class SpacyAnalyzer:
     """
 
     # Mapeamento de idiomas para modelos SpaCy
-    MODELOS = {
-        "ru": "ru_core_news_sm",
-        "en": "en_core_web_sm",
-        "pt": "pt_core_news_sm",  # Opcional
-    }
+    MODELOS = MODELOS_PADRAO
 
     # Mapeamento de tipos de entidade para português
     TIPOS_ENTIDADE = {
         "PERSON": "Pessoa",
+        "PER": "Pessoa",  # rótulo dos modelos ru_core_news
         "ORG": "Organização",
         "LOC": "Local",
         "GPE": "Local (país/cidade)",
@@ -52,18 +94,47 @@ class SpacyAnalyzer:
         "LAW": "Lei",
     }
 
-    def __init__(self):
-        """Inicializa sem carregar modelos."""
-        self._models = {}  # Cache de modelos carregados
+    # Incrementar quando o cálculo do resultado mudar: invalida as análises gravadas
+    VERSAO_ANALISE = 2
+
+    # Perfil de pipeline mínimo para a análise: estatísticas precisam de frases
+    # (segmentador por regras) e só as entidades precisam de um componente
+    # treinado; parser, morfologia e lemas não são usados (ver spacy_models)
+    PERFIL_ANALISE = "ner"
+
+    def __init__(
+        self,
+        n_process: int = 1,
+        batch_size: int = 32,
+        modelos: Optional[ProvedorModelos] = None,
+        tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+    ):
+        """
+        Inicializa sem carregar modelos.
+
+        Args:
+            n_process: Processos usados por analisar_lote (-1 = todos os núcleos)
+            batch_size: Blocos de texto por lote enviados ao nlp.pipe
+            modelos: Provedor de modelos (padrão: o do ServiceRegistry, compartilhado)
+            tamanho_bloco: Caracteres por bloco; textos maiores são analisados
+                           em partes alinhadas a parágrafos (ver blocos)
+        """
+        self.n_process = n_process
+        self.batch_size = batch_size
+        self.tamanho_bloco = tamanho_bloco
+        self._provedor = modelos or ServiceRegistry().modelos_spacy
+        self._models = {}  # Modelos já obtidos do provedor, por (idioma, perfil)
+        self._versoes: Dict[str, str] = {}  # Versão do pacote de cada modelo
         self._stats = {lang: {"loaded": False, "time": None} for lang in self.MODELOS}
         logger.info("🔧 SpacyAnalyzer inicializado (modelos serão carregados sob demanda)")
 
-    def _get_model(self, idioma: str):
+    def _get_model(self, idioma: str, perfil: Optional[str] = None):
         """
         Carrega modelo sob demanda e mantém em cache.
 
         Args:
             idioma: Código do idioma (ru, en, pt)
+            perfil: Perfil de pipeline (padrão: PERFIL_ANALISE)
 
         Returns:
             Modelo spaCy carregado
@@ -71,21 +142,21 @@ class SpacyAnalyzer:
         if idioma not in self.MODELOS:
             raise ValueError(f"Idioma não suportado: {idioma}")
 
+        perfil = perfil or self.PERFIL_ANALISE
+
         # Retorna do cache se já carregado
-        if idioma in self._models:
-            return self._models[idioma]
+        if (idioma, perfil) in self._models:
+            return self._models[(idioma, perfil)]
 
         modelo_nome = self.MODELOS[idioma]
-        logger.info(f"🔄 Carregando modelo spaCy: {modelo_nome}")
 
         try:
             start = time.time()
-            modelo = spacy.load(modelo_nome)
+            modelo = self._provedor.obter(modelo_nome, perfil)
             elapsed = time.time() - start
 
-            self._models[idioma] = modelo
+            self._models[(idioma, perfil)] = modelo
             self._stats[idioma] = {"loaded": True, "time": elapsed}
-            logger.info(f"✅ Modelo {modelo_nome} carregado em {elapsed:.2f}s")
 
             return modelo
 
@@ -94,13 +165,14 @@ class SpacyAnalyzer:
             logger.info(f"   Instale com: python -m spacy download {modelo_nome}")
             raise
 
-    def _get_nlp(self, idioma: str):
+    def _get_nlp(self, idioma: str, perfil: Optional[str] = None):
         """Retorna modelo para o idioma (com lazy loading)."""
-        return self._get_model(idioma)
+        return self._get_model(idioma, perfil)
 
     def get_loaded_models(self) -> Dict[str, bool]:
-        """Retorna quais modelos estão carregados."""
-        return {lang: lang in self._models for lang in self.MODELOS}
+        """Retorna quais modelos estão carregados (em qualquer perfil)."""
+        carregados = {idioma for idioma, _perfil in self._models}
+        return {lang: lang in carregados for lang in self.MODELOS}
 
     def preload_model(self, idioma: str) -> bool:
         """
@@ -115,39 +187,55 @@ class SpacyAnalyzer:
         except Exception:
             return False
 
-    def _calcular_estatisticas(self, texto: str, doc) -> EstatisticasTexto:
-        """Calcula estatísticas do texto."""
-        # Limpeza básica
-        texto_limpo = re.sub(r"\s+", " ", texto)
-        palavras = [token.text for token in doc if not token.is_punct and not token.is_space]
-        frases = list(doc.sents)
+    def _versao_modelo(self, idioma: str, perfil: str) -> str:
+        """Versão do pacote do modelo, lida dos metadados instalados (sem carregá-lo)."""
+        modelo_nome = self.MODELOS[idioma]
+        if modelo_nome not in self._versoes:
+            try:
+                self._versoes[modelo_nome] = version(modelo_nome)
+            except PackageNotFoundError:
+                # Modelo fora de pacote pip (ex.: diretório): só o meta do modelo sabe
+                self._versoes[modelo_nome] = self._get_model(idioma, perfil).meta["version"]
+        return self._versoes[modelo_nome]
+
+    def identificar_modelo(self, idioma: str, perfil: Optional[str] = None) -> str:
+        """
+        Identificação do modelo usado para o idioma (pacote, versão e perfil).
+
+        Faz parte da chave das análises gravadas: trocar o pacote do modelo,
+        a configuração do perfil ou a VERSAO_ANALISE torna as análises
+        anteriores obsoletas. Não carrega o modelo (quando instalado como
+        pacote), então análises gravadas são servidas sem pagar a carga.
+        """
+        if idioma not in self.MODELOS:
+            raise ValueError(f"Idioma não suportado: {idioma}")
+
+        perfil = perfil or self.PERFIL_ANALISE
+        config = self._provedor.perfil(perfil)
+        assinatura = hashlib.sha1(repr(config).encode("utf-8")).hexdigest()[:8]
+        return (
+            f"{self.MODELOS[idioma]}-{self._versao_modelo(idioma, perfil)}"
+            f"[{perfil}:{assinatura}]/a{self.VERSAO_ANALISE}"
+        )
+
+    def _calcular_estatisticas(
+        self, texto: str, acumulador: _AcumuladorAnalise
+    ) -> EstatisticasTexto:
+        """Calcula estatísticas do texto a partir das contagens dos blocos."""
+        palavras = acumulador.total_palavras
+        frases = acumulador.total_frases
 
         return EstatisticasTexto(
             total_caracteres=len(texto),
-            total_palavras=len(palavras),
+            total_palavras=palavras,
             total_paragrafos=texto.count("\n") + 1,
-            total_frases=len(frases),
-            palavras_unicas=len(set(p.lower() for p in palavras)),
-            densidade_lexica=len(set(palavras)) / len(palavras) if palavras else 0,
-            tamanho_medio_palavra=sum(len(p) for p in palavras) / len(palavras) if palavras else 0,
-            tamanho_medio_frase=len(palavras) / len(frases) if frases else 0,
+            total_frases=frases,
+            palavras_unicas=len({forma.lower() for forma in acumulador.formas}),
+            densidade_lexica=len(acumulador.formas) / palavras if palavras else 0,
+            tamanho_medio_palavra=acumulador.soma_tamanhos / palavras if palavras else 0,
+            tamanho_medio_frase=palavras / frases if frases else 0,
         )
 
-    def _extrair_entidades(self, doc) -> List[Entidade]:
-        """Extrai entidades do documento."""
-        entidades = []
-        for ent in doc.ents:
-            entidades.append(
-                Entidade(
-                    texto=ent.text,
-                    tipo=ent.label_,
-                    confianca=1.0,  # SpaCy não dá confidence score
-                    posicao_inicio=ent.start_char,
-                    posicao_fim=ent.end_char,
-                )
-            )
-        return entidades
-
     def _agrupar_entidades(self, entidades: List[Entidade]) -> Dict[str, List[str]]:
         """Agrupa entidades por tipo."""
         grupos = {}
@@ -192,61 +280,125 @@ class SpacyAnalyzer:
             polaridade=polaridade, subjetividade=subjetividade, classificacao=classificacao
         )
 
-    def _palavras_frequentes(self, doc, limite: int = 20) -> List[tuple]:
-        """Extrai palavras mais frequentes (ignorando stopwords)."""
-        palavras = [
-            token.text.lower()
-            for token in doc
-            if not token.is_stop
-            and not token.is_punct
-            and not token.is_space
-            and len(token.text) > 2
-        ]
-
-        contador = Counter(palavras)
-        return contador.most_common(limite)
-
-    def analisar(self, texto: str, documento_id: int, idioma: str = "ru") -> AnaliseTexto:
+    def _blocos(self, texto: str) -> Iterator[Tuple[int, str]]:
+        """Blocos (deslocamento, trecho) do texto, alinhados a parágrafos."""
+        return dividir_em_blocos(texto, self.tamanho_bloco)
+
+    def _montar_analise(
+        self,
+        texto: str,
+        acumulador: _AcumuladorAnalise,
+        documento_id: int,
+        idioma: str,
+        inicio: float,
+        limite_frequentes: int = 20,
+    ) -> AnaliseTexto:
+        """Monta o resultado do documento a partir dos blocos acumulados."""
+        return AnaliseTexto(
+            documento_id=documento_id,
+            idioma=idioma,
+            data_analise=datetime.now(),
+            estatisticas=self._calcular_estatisticas(texto, acumulador),
+            entidades=acumulador.entidades,
+            entidades_por_tipo=self._agrupar_entidades(acumulador.entidades),
+            sentimento=self._analisar_sentimento(texto, idioma),
+            palavras_frequentes=acumulador.frequencias.most_common(limite_frequentes),
+            modelo_utilizado=f"spacy-{idioma}",
+            tempo_processamento=time.time() - inicio,
+        )
+
+    def analisar(
+        self, texto: str, documento_id: int, idioma: str = "ru", perfil: Optional[str] = None
+    ) -> AnaliseTexto:
         """
         Analisa texto completo.
-        O modelo é carregado sob demanda na primeira chamada.
+        O modelo é carregado sob demanda na primeira chamada. Textos maiores
+        que tamanho_bloco passam pelo modelo em blocos, um lote por vez.
+
+        Args:
+            perfil: Perfil de pipeline (padrão: PERFIL_ANALISE)
         """
         logger.info(f"🔍 Analisando documento {documento_id} em {idioma}")
         inicio = time.time()
 
         # Carregar modelo (lazy)
-        nlp = self._get_model(idioma)
-
-        # Processar texto (limitado por performance)
-        doc = nlp(texto[:100000])
+        nlp = self._get_model(idioma, perfil)
 
-        # Estatísticas
-        estatisticas = self._calcular_estatisticas(texto, doc)
+        acumulador = _AcumuladorAnalise()
+        for doc, deslocamento in nlp.pipe(
+            ((bloco, deslocamento) for deslocamento, bloco in self._blocos(texto)),
+            as_tuples=True,
+            batch_size=self.batch_size,
+        ):
+            acumulador.adicionar(doc, deslocamento)
+        analise = self._montar_analise(texto, acumulador, documento_id, idioma, inicio)
 
-        # Entidades
-        entidades = self._extrair_entidades(doc)
-        entidades_agrupadas = self._agrupar_entidades(entidades)
+        logger.info(
+            f"✅ Análise concluída em {analise.tempo_processamento:.2f}s - "
+            f"{len(analise.entidades)} entidades encontradas"
+        )
+        return analise
+
+    def analisar_lote(
+        self,
+        textos: Iterable[Tuple[int, str]],
+        idioma: str = "ru",
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+        perfil: Optional[str] = None,
+    ) -> Iterator[AnaliseTexto]:
+        """
+        Analisa vários textos com nlp.pipe, devolvendo cada resultado assim que fica pronto.
 
-        # Sentimento
-        sentimento = self._analisar_sentimento(texto, idioma)
+        Os textos são consumidos sob demanda (podem vir de um iterador do
+        repositório), divididos em blocos e processados em lotes,
+        opcionalmente em vários processos.
 
-        # Palavras frequentes
-        palavras_freq = self._palavras_frequentes(doc)
+        Args:
+            textos: Pares (documento_id, texto)
+            idioma: Código do idioma (ru, en, pt)
+            batch_size: Blocos por lote (padrão: configurado no analisador)
+            n_process: Processos de trabalho (padrão: configurado; -1 = todos os núcleos)
+            perfil: Perfil de pipeline (padrão: PERFIL_ANALISE)
 
-        tempo = time.time() - inicio
+        Yields:
+            AnaliseTexto de cada documento, na ordem de entrada
+        """
+        nlp = self._get_model(idioma, perfil)
+        batch_size = batch_size or self.batch_size
+        n_process = n_process or self.n_process
         logger.info(
-            f"✅ Análise concluída em {tempo:.2f}s - {len(entidades)} entidades encontradas"
+            f"🔍 Análise em lote ({idioma}, lotes de {batch_size}, {n_process} processo(s))"
         )
 
-        return AnaliseTexto(
-            documento_id=documento_id,
-            idioma=idioma,
-            data_analise=datetime.now(),
-            estatisticas=estatisticas,
-            entidades=entidades,
-            entidades_por_tipo=entidades_agrupadas,
-            sentimento=sentimento,
-            palavras_frequentes=palavras_freq,
-            modelo_utilizado=f"spacy-{idioma}",
-            tempo_processamento=tempo,
-        )
+        # Com n_process > 1 o contexto de cada bloco vai e volta dos processos
+        # de trabalho: leva só a posição do bloco. Os textos completos (para
+        # estatísticas e sentimento) ficam aqui, só enquanto estão em processamento.
+        pendentes: Dict[int, str] = {}
+
+        def entradas():
+            for indice, (documento_id, texto) in enumerate(textos):
+                pendentes[indice] = texto
+                blocos = self._blocos(texto)
+                deslocamento, bloco = next(blocos)
+                for proximo in blocos:
+                    yield bloco, (indice, documento_id, deslocamento, False)
+                    deslocamento, bloco = proximo
+                yield bloco, (indice, documento_id, deslocamento, True)
+
+        total = 0
+        inicio = time.time()
+        acumulador = _AcumuladorAnalise()
+        for doc, (indice, documento_id, deslocamento, ultimo) in nlp.pipe(
+            entradas(), as_tuples=True, batch_size=batch_size, n_process=n_process
+        ):
+            acumulador.adicionar(doc, deslocamento)
+            if not ultimo:
+                continue
+            total += 1
+            texto = pendentes.pop(indice)
+            yield self._montar_analise(texto, acumulador, documento_id, idioma, inicio)
+            acumulador = _AcumuladorAnalise()
+            inicio = time.time()
+
+        logger.info(f"✅ Análise em lote concluída - {total} documentos")
@@ -0,0 +1,246 @@
+# src/infrastructure/analysis/spacy_models.py
+"""
+Provedor de modelos spaCy compartilhado pelo processo.
+
+Cada combinação (modelo, configuração de pipeline) é carregada uma única vez
+e reutilizada por todos os componentes (SpacyAnalyzer, WordCloudGenerator).
+As configurações são nomeadas em perfis (PERFIS_PADRAO, ajustáveis em
+services.spacy.options.perfis). A instância do processo pertence ao
+ServiceRegistry (ServiceRegistry().modelos_spacy).
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+# Modelo usado para cada idioma
+MODELOS_PADRAO = {
+    "ru": "ru_core_news_sm",
+    "en": "en_core_web_sm",
+    "pt": "pt_core_news_sm",  # Opcional
+}
+
+# Componentes treinados dos pacotes *_core_news_sm / *_core_web_sm
+COMPONENTES_TREINADOS = (
+    "tok2vec",
+    "tagger",
+    "morphologizer",
+    "parser",
+    "senter",
+    "attribute_ruler",
+    "lemmatizer",
+    "ner",
+)
+
+
+@dataclass(frozen=True)
+class PerfilPipeline:
+    """
+    Configuração de pipeline para uma tarefa.
+
+    Attributes:
+        exclude: Componentes não carregados (nem ocupam memória)
+        disable: Componentes carregados mas não executados
+        sentencizer: Acrescenta o segmentador de frases por regras quando
+                     nenhum componente restante marca frases (parser/senter)
+    """
+
+    exclude: Tuple[str, ...] = ()
+    disable: Tuple[str, ...] = ()
+    sentencizer: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PerfilPipeline":
+        """Cria a partir da seção services.spacy.options.perfis do config.yaml."""
+        return cls(
+            exclude=tuple(sorted(set(data.get("exclude") or ()))),
+            disable=tuple(sorted(set(data.get("disable") or ()))),
+            sentencizer=bool(data.get("sentencizer", False)),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário (config.yaml e /status)."""
+        return {
+            "exclude": list(self.exclude),
+            "disable": list(self.disable),
+            "sentencizer": self.sentencizer,
+        }
+
+
+# Perfis do mais barato ao mais completo. Quem usa o modelo pede o perfil
+# mínimo para a sua tarefa:
+#   tokens    - tokenização e is_stop (nuvem de palavras, frequências)
+#   sentences - tokens + frases por regras (estatísticas)
+#   ner       - entidades + frases por regras (análise de documentos/acervo)
+#   full      - pipeline completo do pacote (lemas, morfologia, dependências)
+PERFIS_PADRAO: Dict[str, PerfilPipeline] = {
+    "tokens": PerfilPipeline(exclude=tuple(sorted(COMPONENTES_TREINADOS))),
+    "sentences": PerfilPipeline(exclude=tuple(sorted(COMPONENTES_TREINADOS)), sentencizer=True),
+    "ner": PerfilPipeline(
+        exclude=("attribute_ruler", "lemmatizer", "morphologizer", "parser", "senter", "tagger"),
+        sentencizer=True,
+    ),
+    "full": PerfilPipeline(),
+}
+
+# (nome do modelo, configuração do pipeline)
+ChaveModelo = Tuple[str, PerfilPipeline]
+
+
+def _carregar_spacy(nome: str, exclude: List[str], disable: List[str]):
+    """Carrega o modelo com spacy.load (import tardio: spaCy é pesado)."""
+    import spacy
+
+    return spacy.load(nome, exclude=exclude, disable=disable)
+
+
+@dataclass
+class ModeloCarregado:
+    """Modelo em memória e dados de uso."""
+
+    nlp: Any
+    tempo_carga: float
+    carregado_em: datetime = field(default_factory=datetime.now)
+    usos: int = 0
+    perfis: Set[str] = field(default_factory=set)
+
+
+class ProvedorModelos:
+    """
+    Cache thread-safe de modelos spaCy carregados.
+
+    Carregamentos concorrentes da mesma chave esperam o primeiro terminar
+    (um lock por chave), sem bloquear chaves diferentes. Perfis diferentes
+    com a mesma configuração compartilham o modelo.
+    """
+
+    def __init__(
+        self,
+        carregar: Optional[Callable] = None,
+        perfis: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """
+        Args:
+            carregar: Função (nome, exclude, disable) -> Language (padrão: spacy.load)
+            perfis: Perfis que substituem/acrescentam aos PERFIS_PADRAO
+        """
+        self._carregar = carregar or _carregar_spacy
+        self._modelos: Dict[ChaveModelo, ModeloCarregado] = {}
+        self._locks: Dict[ChaveModelo, Lock] = {}
+        self._lock = Lock()
+        self.perfis: Dict[str, PerfilPipeline] = dict(PERFIS_PADRAO)
+        self.configurar_perfis(perfis)
+
+    def configurar_perfis(self, perfis: Optional[Dict[str, Dict[str, Any]]]) -> None:
+        """
+        Define perfis a partir do config.yaml (nome -> exclude/disable/sentencizer).
+
+        Modelos já carregados continuam válidos para a configuração com que
+        foram carregados; um perfil alterado passa a usar outra chave.
+        """
+        for nome, dados in (perfis or {}).items():
+            self.perfis[nome] = PerfilPipeline.from_dict(dados or {})
+
+    def perfil(self, nome: str) -> PerfilPipeline:
+        """Configuração do perfil nomeado."""
+        if nome not in self.perfis:
+            disponiveis = ", ".join(self.perfis)
+            raise ValueError(f"Perfil de pipeline desconhecido: {nome}. Disponíveis: {disponiveis}")
+        return self.perfis[nome]
+
+    def obter(self, nome: str, perfil: Union[str, PerfilPipeline] = "full"):
+        """
+        Modelo carregado com a configuração de pipeline do perfil.
+
+        Args:
+            nome: Pacote do modelo (ex.: ru_core_news_sm)
+            perfil: Nome do perfil (ver PERFIS_PADRAO) ou configuração explícita
+
+        Raises:
+            ValueError: Se o perfil não existir
+            OSError: Se o modelo não estiver instalado
+        """
+        config = perfil if isinstance(perfil, PerfilPipeline) else self.perfil(perfil)
+        chave = (nome, config)
+        carregado = self._modelos.get(chave)
+        if carregado is None:
+            with self._lock:
+                lock = self._locks.setdefault(chave, Lock())
+            with lock:
+                carregado = self._modelos.get(chave)
+                if carregado is None:
+                    carregado = self._carregar_modelo(chave)
+
+        carregado.usos += 1
+        if isinstance(perfil, str):
+            carregado.perfis.add(perfil)
+        if _telemetry:
+            _telemetry.increment("spacy_models.uso")
+        return carregado.nlp
+
+    def _carregar_modelo(self, chave: ChaveModelo) -> ModeloCarregado:
+        nome, config = chave
+        logger.info(f"🔄 Carregando modelo spaCy: {nome} ({config.to_dict()})")
+        inicio = time.time()
+        try:
+            nlp = self._carregar(nome, exclude=list(config.exclude), disable=list(config.disable))
+        except Exception:
+            if _telemetry:
+                _telemetry.increment("spacy_models.erro_carga")
+            raise
+
+        marcam_frases = {"parser", "senter", "sentencizer"} & set(nlp.pipe_names)
+        if config.sentencizer and not marcam_frases:
+            nlp.add_pipe("sentencizer")
+
+        carregado = ModeloCarregado(nlp=nlp, tempo_carga=time.time() - inicio)
+        self._modelos[chave] = carregado
+        logger.info(
+            f"✅ Modelo {nome} carregado em {carregado.tempo_carga:.2f}s "
+            f"(componentes: {', '.join(nlp.pipe_names) or 'apenas tokenizador'})"
+        )
+        if _telemetry:
+            _telemetry.increment("spacy_models.carga")
+        return carregado
+
+    def carregado(self, nome: str, perfil: Union[str, PerfilPipeline] = "full") -> bool:
+        """Indica se o modelo já está em memória com a configuração do perfil."""
+        config = perfil if isinstance(perfil, PerfilPipeline) else self.perfil(perfil)
+        return (nome, config) in self._modelos
+
+    def estatisticas(self) -> List[Dict[str, Any]]:
+        """Modelos em memória (para /status)."""
+        return [
+            {
+                "modelo": nome,
+                "perfis": sorted(carregado.perfis),
+                **config.to_dict(),
+                "componentes": list(carregado.nlp.pipe_names),
+                "tempo_carga": round(carregado.tempo_carga, 3),
+                "carregado_em": carregado.carregado_em.isoformat(),
+                "usos": carregado.usos,
+            }
+            for (nome, config), carregado in list(self._modelos.items())
+        ]
+
+    def descarregar(self) -> None:
+        """Remove todos os modelos da memória (próximo uso recarrega)."""
+        with self._lock:
+            self._modelos.clear()
+            self._locks.clear()
+        logger.info("🧹 Modelos spaCy descarregados")
@@ -10,9 +10,12 @@ from pathlib import Path
 from typing import Optional
 
 import matplotlib.pyplot as plt
-import spacy
 from wordcloud import WordCloud
 
+from src.infrastructure.analysis.blocos import TAMANHO_BLOCO_PADRAO, dividir_em_blocos
+from src.infrastructure.analysis.spacy_models import MODELOS_PADRAO, ProvedorModelos
+from src.infrastructure.registry import ServiceRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,27 +25,36 @@ class WordCloudGenerator:
     Versão flexível que aceita configurações via kwargs.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, modelos: Optional[ProvedorModelos] = None, **kwargs):
         """
         Inicializa o gerador com configurações flexíveis.
 
         Args:
+            modelos: Provedor de modelos spaCy (padrão: o do ServiceRegistry,
+                     compartilhado com o SpacyAnalyzer)
             **kwargs: Qualquer parâmetro de configuração.
                      Os reconhecidos serão usados, outros serão ignorados.
         """
+        self._modelos = modelos or ServiceRegistry().modelos_spacy
+
         # Parâmetros reconhecidos com valores padrão
         self.default_size = kwargs.get("default_size", (800, 400))
         self.max_words = kwargs.get("max_words", 200)
         self.background_color = kwargs.get("background_color", "white")
         self.width = kwargs.get("width", self.default_size[0])
         self.height = kwargs.get("height", self.default_size[1])
+        self.tamanho_bloco = kwargs.get("tamanho_bloco", TAMANHO_BLOCO_PADRAO)
 
         # Armazenar kwargs extras para uso futuro (ignorados)
-        self._extra_kwargs = {
-            k: v
-            for k, v in kwargs.items()
-            if k not in ["default_size", "max_words", "background_color", "width", "height"]
+        reconhecidos = {
+            "default_size",
+            "max_words",
+            "background_color",
+            "width",
+            "height",
+            "tamanho_bloco",
         }
+        self._extra_kwargs = {k: v for k, v in kwargs.items() if k not in reconhecidos}
 
         # Carregar stopwords para múltiplos idiomas
         self.stopwords = self._carregar_stopwords()
@@ -133,26 +145,24 @@ class WordCloudGenerator:
 
         # Processar texto com SpaCy para melhor tokenização
         try:
-            if idioma == "ru":
-                nlp = spacy.load("ru_core_news_sm")
-            else:
-                nlp = spacy.load("en_core_web_sm")
-
-            doc = nlp(texto[:50000])  # Limitar tamanho
-
-            # Extrair palavras significativas
-            palavras = [
-                token.text.lower()
-                for token in doc
-                if not token.is_stop
-                and not token.is_punct
-                and not token.is_space
-                and len(token.text) > 2
-                and token.text.lower() not in self.stopwords
-            ]
-
-            # Contar frequências
-            frequencias = Counter(palavras)
+            # Só tokenização e is_stop: nenhum componente treinado é executado
+            nlp = self._modelos.obter(MODELOS_PADRAO["ru" if idioma == "ru" else "en"], "tokens")
+
+            # Texto inteiro, em blocos: a memória não cresce com o tamanho do texto
+            blocos = (bloco for _, bloco in dividir_em_blocos(texto, self.tamanho_bloco))
+
+            # Contar palavras significativas
+            frequencias = Counter()
+            for doc in nlp.pipe(blocos):
+                frequencias.update(
+                    token.text.lower()
+                    for token in doc
+                    if not token.is_stop
+                    and not token.is_punct
+                    and not token.is_space
+                    and len(token.text) > 2
+                    and token.text.lower() not in self.stopwords
+                )
 
         except Exception as e:
             logger.warning(f"Erro ao processar com spaCy: {e}. Usando método simples.")
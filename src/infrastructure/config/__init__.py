@@ -12,6 +12,9 @@ from typing import Any, Dict, Optional
 import yaml
 from dotenv import load_dotenv
 
+from src.infrastructure.analysis.blocos import TAMANHO_BLOCO_PADRAO
+from src.infrastructure.analysis.spacy_models import PERFIS_PADRAO
+
 # Carrega variáveis de ambiente
 load_dotenv()
 
@@ -45,11 +48,39 @@ class ServiceConfig:
         }
 
 
+@dataclass
+class CacheConfig:
+    """Configuração do cache de entidades na frente dos repositórios."""
+
+    enabled: bool = False
+    max_mb: float = 64
+    ttl: Optional[float] = 300  # segundos; None = sem expiração
+
+    @property
+    def max_bytes(self) -> int:
+        """Limite de memória em bytes."""
+        return int(self.max_mb * 1024 * 1024)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CacheConfig":
+        """Cria configuração a partir de dicionário."""
+        return cls(
+            enabled=data.get("enabled", False),
+            max_mb=data.get("max_mb", 64),
+            ttl=data.get("ttl", 300),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário."""
+        return {"enabled": self.enabled, "max_mb": self.max_mb, "ttl": self.ttl}
+
+
 @dataclass
 class ApplicationConfig:
     """Configuração completa da aplicação."""
 
     services: Dict[str, ServiceConfig] = field(default_factory=dict)
+    cache: CacheConfig = field(default_factory=CacheConfig)
     environment: str = "development"
     debug: bool = False
     data_dir: Path = Path("data")
@@ -96,6 +127,9 @@ class ApplicationConfig:
         if "debug" in data:
             config.debug = data["debug"]
 
+        if "cache" in data:
+            config.cache = CacheConfig.from_dict(data["cache"] or {})
+
         # Carrega serviços
         if "services" in data:
             for name, svc_data in data["services"].items():
@@ -119,6 +153,12 @@ class ApplicationConfig:
                     "models": {"ru": "ru_core_news_sm", "en": "en_core_web_sm"},
                     "preload": [],  # modelos a carregar na inicialização
                     "auto_download": False,
+                    "n_process": -1,  # análise em lote: todos os núcleos
+                    "batch_size": 32,
+                    # perfis de pipeline: componentes excluídos/desativados por tarefa
+                    "perfis": {nome: p.to_dict() for nome, p in PERFIS_PADRAO.items()},
+                    # textos longos são analisados em blocos alinhados a parágrafos
+                    "tamanho_bloco": TAMANHO_BLOCO_PADRAO,
                 },
             ),
             "wordcloud": ServiceConfig(
@@ -138,6 +178,7 @@ class ApplicationConfig:
             data = {
                 "environment": self.environment,
                 "debug": self.debug,
+                "cache": self.cache.to_dict(),
                 "services": {name: svc.to_dict() for name, svc in self.services.items()},
             }
 
@@ -24,6 +24,21 @@ class Settings:
     DB_PATH = BASE_DIR / "data" / "showtrials.db"
     DB_PATH.parent.mkdir(exist_ok=True)
 
+    # Pool de conexões SQLite (PRAGMAs de desempenho)
+    DB_CACHE_SIZE = int(os.getenv("DB_CACHE_SIZE", "-64000"))  # negativo = KiB (~64 MB)
+    DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+    # Textos comprimidos (zlib) no banco; aplicado/revertido na inicialização
+    DB_COMPRIMIR_TEXTO = os.getenv("DB_COMPRIMIR_TEXTO", "false").lower() in ("1", "true", "sim")
+
+    # Servidor web: leituras servidas por uma réplica do banco em memória
+    DB_REPLICA_MEMORIA = os.getenv("DB_REPLICA_MEMORIA", "false").lower() in ("1", "true", "sim")
+
+    # Backup online (API de backup do SQLite, em passos)
+    BACKUP_DIR = Path(os.getenv("BACKUP_DIR", str(BASE_DIR / "data" / "backups")))
+    BACKUP_PAGINAS_POR_PASSO = int(os.getenv("BACKUP_PAGINAS_POR_PASSO", "256"))
+    BACKUP_PAUSA = float(os.getenv("BACKUP_PAUSA", "0.005"))  # segundos entre passos
+
     # Google Cloud Translation
     GOOGLE_TRANSLATE_API_KEY: Optional[str] = os.getenv("GOOGLE_TRANSLATE_API_KEY")
     GOOGLE_APPLICATION_CREDENTIALS: Optional[str] = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
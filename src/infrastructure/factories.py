@@ -52,7 +52,7 @@ class MockSpacyAnalyzer:
         logger.info("🔄 Inicializando analisador MOCK")
         self._kwargs = kwargs
 
-    def analisar(self, texto: str, documento_id: int, idioma: str = "ru"):
+    def analisar(self, texto: str, documento_id: int, idioma: str = "ru", perfil=None):
         """Mock de análise com estatísticas consistentes."""
         from datetime import datetime
 
@@ -95,6 +95,17 @@ class MockSpacyAnalyzer:
             tempo_processamento=0.1,
         )
 
+    def identificar_modelo(self, idioma: str = "ru", perfil=None) -> str:
+        """Mock da identificação do modelo."""
+        return f"mock-{idioma}"
+
+    def analisar_lote(
+        self, textos, idioma: str = "ru", batch_size=None, n_process=None, perfil=None
+    ):
+        """Mock da análise em lote (sequencial)."""
+        for documento_id, texto in textos:
+            yield self.analisar(texto, documento_id, idioma)
+
 
 def create_translator(
     api_key: Optional[str] = None, simulate: bool = False, **kwargs
@@ -134,13 +145,26 @@ def create_translator(
         return MockTranslator(**kwargs)
 
 
-def create_spacy_analyzer(preload: Optional[list] = None, simulate: bool = False, **kwargs):
+def create_spacy_analyzer(
+    preload: Optional[list] = None,
+    simulate: bool = False,
+    n_process: int = 1,
+    batch_size: int = 32,
+    perfis: Optional[dict] = None,
+    tamanho_bloco: Optional[int] = None,
+    **kwargs,
+):
     """
     Factory para analisador spaCy.
 
     Args:
         preload: Lista de idiomas para pré-carregar
         simulate: Se True, usa mock
+        n_process: Processos da análise em lote (-1 = todos os núcleos)
+        batch_size: Textos por lote na análise em lote
+        perfis: Perfis de pipeline (nome -> exclude/disable/sentencizer), aplicados
+                ao provedor de modelos compartilhado
+        tamanho_bloco: Caracteres por bloco na análise de textos longos
         **kwargs: Configurações adicionais
 
     Returns:
@@ -154,7 +178,10 @@ def create_spacy_analyzer(preload: Optional[list] = None, simulate: bool = False
             _telemetry.increment("factory.spacy.mock")
         return MockSpacyAnalyzer(**kwargs)
 
-    analyzer = SpacyAnalyzer()
+    analyzer = SpacyAnalyzer(n_process=n_process, batch_size=batch_size)
+    if tamanho_bloco:
+        analyzer.tamanho_bloco = tamanho_bloco
+    analyzer._provedor.configurar_perfis(perfis)
 
     if _telemetry:
         _telemetry.increment("factory.spacy.real")
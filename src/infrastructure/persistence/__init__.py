@@ -1,5 +1,14 @@
 # src/infrastructure/persistence/__init__.py
-from src.infrastructure.persistence.migrations import criar_tabelas, migrar_banco_existente
+from src.infrastructure.persistence.migrations import (
+    aplicar_migracoes,
+    criar_tabelas,
+    migrar_banco_existente,
+)
 from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
 
-__all__ = ["SQLiteDocumentoRepository", "criar_tabelas", "migrar_banco_existente"]
+__all__ = [
+    "SQLiteDocumentoRepository",
+    "aplicar_migracoes",
+    "criar_tabelas",
+    "migrar_banco_existente",
+]
@@ -0,0 +1,220 @@
+"""
+Backup online do banco SQLite.
+
+Usa a API de backup do SQLite (sqlite3.Connection.backup) copiando poucas
+páginas por passo, com uma pausa entre passos: o lock de leitura sobre o
+banco em uso dura só um passo e as escritas da aplicação web seguem
+normalmente. A cópia pode ser compactada com VACUUM INTO (sobre a cópia,
+nunca sobre o banco em uso) e é verificada com PRAGMA quick_check antes de
+receber o nome final.
+"""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+Caminho = Union[str, Path]
+
+
+@dataclass
+class ResultadoBackup:
+    """
+    Resultado de um backup.
+
+    Attributes:
+        caminho: Arquivo de backup gerado
+        tamanho_bytes: Tamanho final do arquivo
+        paginas: Páginas copiadas do banco de origem
+        duracao: Duração total em segundos
+        compactado: Se a cópia passou por VACUUM INTO
+        problemas: Saída do quick_check (vazia = íntegro)
+    """
+
+    caminho: Path
+    tamanho_bytes: int = 0
+    paginas: int = 0
+    duracao: float = 0.0
+    compactado: bool = False
+    problemas: List[str] = field(default_factory=list)
+
+    @property
+    def integro(self) -> bool:
+        """Indica se a verificação não encontrou problemas."""
+        return not self.problemas
+
+
+def copiar_online(
+    destino: Caminho,
+    origem: Optional[Caminho] = None,
+    paginas_por_passo: Optional[int] = None,
+    pausa: Optional[float] = None,
+    progresso: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Copia o banco em uso para `destino` com a API de backup, em passos.
+
+    Args:
+        destino: Arquivo de destino (sobrescrito)
+        origem: Banco de origem (padrão: settings.DB_PATH)
+        paginas_por_passo: Páginas copiadas por passo
+        pausa: Segundos de espera entre passos (libera o banco para escritas)
+        progresso: Chamado a cada passo com (restantes, total)
+
+    Returns:
+        Total de páginas copiadas
+    """
+    origem = str(origem or settings.DB_PATH)
+    paginas_por_passo = paginas_por_passo or settings.BACKUP_PAGINAS_POR_PASSO
+    pausa = settings.BACKUP_PAUSA if pausa is None else pausa
+    total = 0
+
+    def passo(_status: int, restantes: int, total_paginas: int):
+        nonlocal total
+        total = total_paginas
+        if progresso:
+            progresso(restantes, total_paginas)
+        if restantes and pausa:
+            time.sleep(pausa)
+
+    # Conexões próprias: o backup não ocupa as conexões do pool
+    conn_origem = sqlite3.connect(origem, isolation_level=None)
+    conn_destino = sqlite3.connect(str(destino))
+    try:
+        # Escritas de outras conexões reiniciam a cópia a cada passo. No modo WAL
+        # uma transação de leitura aberta fixa um snapshot: a cópia termina e
+        # corresponde a um instante, sem impedir os escritores.
+        wal = conn_origem.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        if wal:
+            conn_origem.execute("BEGIN")
+            conn_origem.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        conn_origem.backup(conn_destino, pages=paginas_por_passo, progress=passo)
+        if wal:
+            conn_origem.execute("COMMIT")
+    finally:
+        conn_destino.close()
+        conn_origem.close()
+
+    return total
+
+
+def compactar(origem: Caminho, destino: Caminho) -> None:
+    """Grava em `destino` uma cópia desfragmentada de `origem` (VACUUM INTO)."""
+    conn = sqlite3.connect(str(origem))
+    try:
+        conn.execute("VACUUM INTO ?", (str(destino),))
+    finally:
+        conn.close()
+
+
+def verificar(caminho: Caminho) -> List[str]:
+    """
+    Roda PRAGMA quick_check no arquivo.
+
+    Returns:
+        Lista de problemas (vazia se o banco está íntegro)
+    """
+    conn = sqlite3.connect(f"file:{Path(caminho).as_posix()}?mode=ro", uri=True)
+    try:
+        linhas = [row[0] for row in conn.execute("PRAGMA quick_check")]
+    except sqlite3.DatabaseError as e:
+        return [str(e)]
+    finally:
+        conn.close()
+    return [] if linhas == ["ok"] else linhas
+
+
+def criar_backup(
+    diretorio: Optional[Caminho] = None,
+    origem: Optional[Caminho] = None,
+    compactado: bool = True,
+    paginas_por_passo: Optional[int] = None,
+    pausa: Optional[float] = None,
+    progresso: Optional[Callable[[int, int], None]] = None,
+) -> ResultadoBackup:
+    """
+    Gera um backup verificado do banco, seguro com a aplicação em uso.
+
+    A cópia é feita em um arquivo temporário no diretório de destino e só
+    recebe o nome final (showtrials_AAAAMMDD_HHMMSS.db) se passar no
+    quick_check; caso contrário é mantida com sufixo .corrompido.
+
+    Args:
+        diretorio: Diretório dos backups (padrão: settings.BACKUP_DIR)
+        origem: Banco de origem (padrão: settings.DB_PATH)
+        compactado: Aplicar VACUUM INTO na cópia
+        paginas_por_passo: Páginas copiadas por passo (ver copiar_online)
+        pausa: Segundos de espera entre passos
+        progresso: Chamado a cada passo com (restantes, total)
+    """
+    inicio = time.perf_counter()
+    diretorio = Path(diretorio or settings.BACKUP_DIR)
+    diretorio.mkdir(parents=True, exist_ok=True)
+
+    nome = f"showtrials_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    sequencia = 1
+    while (diretorio / f"{nome}.db").exists():
+        sequencia += 1
+        nome = f"{nome.split('-')[0]}-{sequencia}"
+    final = diretorio / f"{nome}.db"
+    copia = diretorio / f"{nome}.copia"
+    compacta = diretorio / f"{nome}.compacta"
+
+    if _telemetry:
+        _telemetry.increment("backup.iniciado")
+
+    try:
+        paginas = copiar_online(copia, origem, paginas_por_passo, pausa, progresso)
+        if compactado:
+            compactar(copia, compacta)
+            copia.unlink()
+            copia = compacta
+
+        problemas = verificar(copia)
+        if problemas:
+            final = final.with_suffix(".corrompido")
+            logger.error(f"❌ Backup com problemas no quick_check: {problemas[:5]}")
+        copia.replace(final)
+    finally:
+        for temporario in (diretorio / f"{nome}.copia", compacta):
+            temporario.unlink(missing_ok=True)
+
+    resultado = ResultadoBackup(
+        caminho=final,
+        tamanho_bytes=final.stat().st_size,
+        paginas=paginas,
+        duracao=time.perf_counter() - inicio,
+        compactado=compactado,
+        problemas=problemas,
+    )
+
+    if _telemetry:
+        _telemetry.increment("backup.concluido" if resultado.integro else "backup.corrompido")
+        _telemetry.timing("backup.duracao", resultado.duracao)
+
+    return resultado
+
+
+def listar_backups(diretorio: Optional[Caminho] = None) -> List[Path]:
+    """Backups existentes, do mais recente ao mais antigo."""
+    diretorio = Path(diretorio or settings.BACKUP_DIR)
+    if not diretorio.exists():
+        return []
+    return sorted(diretorio.glob("showtrials_*.db"), reverse=True)
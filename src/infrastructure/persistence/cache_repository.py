@@ -0,0 +1,369 @@
+"""
+Cache de entidades em memória na frente dos repositórios.
+
+Os decoradores implementam as mesmas interfaces do domínio e delegam ao
+repositório real; somente as buscas por id são guardadas. O limite de
+memória é dado em bytes de texto (documentos longos ocupam mais espaço que
+metadados), com expiração por TTL e invalidação a cada escrita.
+"""
+
+import copy
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.domain.entities.documento import Documento
+from src.domain.entities.traducao import Traducao
+from src.domain.interfaces.repositories import RepositorioDocumento
+from src.domain.interfaces.repositorio_traducao import RepositorioTraducao
+from src.domain.value_objects.agregados_acervo import AgregadosAcervo
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
+from src.domain.value_objects.resultado_busca import ResultadoBusca
+from src.domain.value_objects.resultado_upsert import ResultadoUpsert
+from src.domain.value_objects.resumo_documento import ResumoDocumento
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+# Custo fixo estimado por entidade (objeto, metadados e entrada do cache)
+TAMANHO_BASE = 512
+
+
+def tamanho_texto(*textos: Optional[str]) -> int:
+    """Bytes ocupados pelos textos em memória, mais o custo fixo da entidade."""
+    return TAMANHO_BASE + sum(sys.getsizeof(t) for t in textos if t)
+
+
+class CacheLRU:
+    """
+    Cache LRU limitado por bytes, com TTL, seguro entre threads.
+
+    Pode ser compartilhado por vários repositórios (chaves com prefixo), de
+    modo que o limite de memória vale para o conjunto.
+    """
+
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None):
+        """
+        Args:
+            max_bytes: Memória máxima ocupada pelas entradas
+            ttl: Segundos de validade de cada entrada (None = sem expiração)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entradas: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expiradas = 0
+        self.descartadas = 0
+        self.invalidacoes = 0
+
+    def obter(self, chave: Hashable) -> Optional[Any]:
+        """Retorna o valor guardado (None se ausente ou expirado)."""
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[2] < time.monotonic():
+                self._remover(chave)
+                self.expiradas += 1
+                entrada = None
+            if entrada is None:
+                self.misses += 1
+                if _telemetry:
+                    _telemetry.increment("cache_repositorio.miss")
+                return None
+            self._entradas.move_to_end(chave)
+            self.hits += 1
+        if _telemetry:
+            _telemetry.increment("cache_repositorio.hit")
+        return entrada[0]
+
+    def marca(self) -> int:
+        """Marca a capturar antes de ler do banco (ver guardar)."""
+        return self.invalidacoes
+
+    def guardar(self, chave: Hashable, valor: Any, tamanho: int, marca: int) -> None:
+        """
+        Guarda um valor lido do banco.
+
+        O valor é ignorado se houve invalidação desde `marca`: a leitura pode
+        ser anterior a uma escrita concorrente.
+        """
+        if tamanho > self.max_bytes:
+            return
+        expira_em = time.monotonic() + self.ttl if self.ttl else float("inf")
+        with self._lock:
+            if marca != self.invalidacoes:
+                return
+            self._remover(chave)
+            self._entradas[chave] = (valor, tamanho, expira_em)
+            self.bytes += tamanho
+            while self.bytes > self.max_bytes:
+                self._remover(next(iter(self._entradas)))
+                self.descartadas += 1
+
+    def invalidar(self, *chaves: Hashable) -> None:
+        """Remove as chaves do cache (chamado a cada escrita)."""
+        with self._lock:
+            self.invalidacoes += 1
+            for chave in chaves:
+                self._remover(chave)
+
+    def limpar(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            self.invalidacoes += 1
+            self._entradas.clear()
+            self.bytes = 0
+
+    def _remover(self, chave: Hashable) -> None:
+        entrada = self._entradas.pop(chave, None)
+        if entrada is not None:
+            self.bytes -= entrada[1]
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores de uso do cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "itens": len(self._entradas),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "expiradas": self.expiradas,
+            "descartadas": self.descartadas,
+            "invalidacoes": self.invalidacoes,
+        }
+
+
+def _copiar_documento(documento: Documento) -> Documento:
+    """Cópia entregue ao chamador: alterações não atingem a entrada do cache."""
+    copia = copy.copy(documento)
+    if documento.envolvidos is not None:
+        copia.envolvidos = list(documento.envolvidos)
+    return copia
+
+
+class CacheDocumentoRepository(RepositorioDocumento):
+    """
+    Decorador de RepositorioDocumento com cache de buscar_por_id.
+
+    Documentos sem o texto carregado também são guardados; um pedido com
+    texto encontra a entrada sem texto e a substitui pelo documento completo.
+    """
+
+    def __init__(self, repo: RepositorioDocumento, cache: CacheLRU):
+        self._repo = repo
+        self.cache = cache
+
+    def __getattr__(self, nome: str):
+        # Atributos específicos da implementação (ex.: db_path)
+        return getattr(self._repo, nome)
+
+    @staticmethod
+    def _chave(id: int) -> Tuple[str, int]:
+        return ("documento", id)
+
+    def _invalidar(self, ids: Iterable[Optional[int]]) -> None:
+        self.cache.invalidar(*(self._chave(id) for id in ids if id is not None))
+
+    def buscar_por_id(self, id: int, carregar_texto: bool = True) -> Optional[Documento]:
+        documento = self.cache.obter(self._chave(id))
+        if documento is not None and (documento.texto_carregado or not carregar_texto):
+            return _copiar_documento(documento)
+
+        marca = self.cache.marca()
+        documento = self._repo.buscar_por_id(id, carregar_texto=carregar_texto)
+        if documento is None:
+            return None
+        texto = documento.texto if documento.texto_carregado else None
+        self.cache.guardar(self._chave(id), documento, tamanho_texto(texto), marca)
+        return _copiar_documento(documento)
+
+    def obter_texto(self, documento_id: int) -> Optional[str]:
+        documento = self.cache.obter(self._chave(documento_id))
+        if documento is not None and documento.texto_carregado:
+            return documento.texto
+        return self._repo.obter_texto(documento_id)
+
+    def salvar(self, documento: Documento) -> int:
+        doc_id = self._repo.salvar(documento)
+        self._invalidar([documento.id, doc_id])
+        return doc_id
+
+    def salvar_em_lote(
+        self, documentos: Iterable[Documento], chunk_size: int = 500
+    ) -> List[Optional[int]]:
+        documentos = list(documentos)
+        ids = self._repo.salvar_em_lote(documentos, chunk_size=chunk_size)
+        self._invalidar([*(d.id for d in documentos), *ids])
+        return ids
+
+    def upsert_por_url(
+        self, documentos: Iterable[Documento], chunk_size: int = 500
+    ) -> ResultadoUpsert:
+        resultado = self._repo.upsert_por_url(documentos, chunk_size=chunk_size)
+        self._invalidar(resultado.ids)
+        return resultado
+
+    def remover(self, id: int) -> bool:
+        removido = self._repo.remover(id)
+        # As conexões não ativam foreign_keys (o CASCADE de traducoes não roda):
+        # a lista de traduções do documento é descartada e relida do banco
+        self.cache.invalidar(self._chave(id), ("traducoes", id))
+        return removido
+
+    # Demais operações: delegadas sem cache
+
+    def listar(
+        self,
+        offset: int = 0,
+        limite: int = 20,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        carregar_texto: bool = True,
+    ) -> List[Documento]:
+        return self._repo.listar(
+            offset=offset,
+            limite=limite,
+            centro=centro,
+            tipo=tipo,
+            after_id=after_id,
+            before_id=before_id,
+            carregar_texto=carregar_texto,
+        )
+
+    def listar_resumos(
+        self,
+        offset: int = 0,
+        limite: int = 20,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[ResumoDocumento]:
+        return self._repo.listar_resumos(
+            offset=offset,
+            limite=limite,
+            centro=centro,
+            tipo=tipo,
+            after_id=after_id,
+            before_id=before_id,
+        )
+
+    def documentos_por_pessoa(
+        self, nome: str, papel: Optional[str] = None
+    ) -> List[ResumoDocumento]:
+        return self._repo.documentos_por_pessoa(nome, papel=papel)
+
+    def iterar(
+        self,
+        batch_size: int = 500,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        colunas: Optional[Sequence[str]] = None,
+    ) -> Iterator[Documento]:
+        return self._repo.iterar(batch_size=batch_size, centro=centro, tipo=tipo, colunas=colunas)
+
+    def contar(self, centro: Optional[str] = None, tipo: Optional[str] = None) -> int:
+        return self._repo.contar(centro=centro, tipo=tipo)
+
+    def contar_por_tipo(self, centro: Optional[str] = None) -> Dict[str, int]:
+        return self._repo.contar_por_tipo(centro=centro)
+
+    def agregados(
+        self,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        limite_pessoas: int = 15,
+    ) -> AgregadosAcervo:
+        return self._repo.agregados(centro=centro, tipo=tipo, limite_pessoas=limite_pessoas)
+
+    def listar_alterados_desde(self, marca: int = 0, limite: int = 1000) -> LoteAlteracoes:
+        return self._repo.listar_alterados_desde(marca=marca, limite=limite)
+
+    def buscar_texto(
+        self,
+        query: str,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        limite: int = 20,
+        offset: int = 0,
+    ) -> List[ResultadoBusca]:
+        return self._repo.buscar_texto(
+            query, centro=centro, tipo=tipo, limite=limite, offset=offset
+        )
+
+
+class CacheTraducaoRepository(RepositorioTraducao):
+    """
+    Decorador de RepositorioTraducao com cache por documento.
+
+    As traduções de um documento são guardadas como lista; buscar_por_documento
+    é respondido a partir dela. buscar_por_id não é guardado: a entrada só
+    poderia ser invalidada por id, e a remoção de um documento conhece apenas
+    o id do documento.
+    """
+
+    def __init__(self, repo: RepositorioTraducao, cache: CacheLRU):
+        self._repo = repo
+        self.cache = cache
+
+    def __getattr__(self, nome: str):
+        return getattr(self._repo, nome)
+
+    def _invalidar(self, traducoes: Sequence[Traducao]) -> None:
+        self.cache.invalidar(*{("traducoes", t.documento_id) for t in traducoes})
+
+    def buscar_por_id(self, id: int) -> Optional[Traducao]:
+        return self._repo.buscar_por_id(id)
+
+    def listar_por_documento(self, documento_id: int) -> List[Traducao]:
+        traducoes = self.cache.obter(("traducoes", documento_id))
+        if traducoes is None:
+            marca = self.cache.marca()
+            traducoes = self._repo.listar_por_documento(documento_id)
+            tamanho = tamanho_texto(*(t.texto_traduzido for t in traducoes))
+            self.cache.guardar(("traducoes", documento_id), traducoes, tamanho, marca)
+        return [copy.copy(t) for t in traducoes]
+
+    def buscar_por_documento(self, documento_id: int, idioma: str) -> Optional[Traducao]:
+        for traducao in self.listar_por_documento(documento_id):
+            if traducao.idioma == idioma:
+                return traducao
+        return None
+
+    def contar_por_documento(self, documento_id: int) -> int:
+        traducoes = self.cache.obter(("traducoes", documento_id))
+        if traducoes is not None:
+            return len(traducoes)
+        return self._repo.contar_por_documento(documento_id)
+
+    def salvar(self, traducao: Traducao) -> int:
+        traducao_id = self._repo.salvar(traducao)
+        self._invalidar([traducao])
+        return traducao_id
+
+    def salvar_em_lote(
+        self, traducoes: Iterable[Traducao], chunk_size: int = 500
+    ) -> List[Optional[int]]:
+        traducoes = list(traducoes)
+        ids = self._repo.salvar_em_lote(traducoes, chunk_size=chunk_size)
+        self._invalidar(traducoes)
+        return ids
+
+    def idiomas_por_documento(self, documento_ids: Iterable[int]) -> Dict[int, Set[str]]:
+        return self._repo.idiomas_por_documento(documento_ids)
+
+    def listar_alterados_desde(self, marca: int = 0, limite: int = 1000) -> LoteAlteracoes:
+        return self._repo.listar_alterados_desde(marca=marca, limite=limite)
@@ -0,0 +1,75 @@
+"""
+Armazenamento comprimido (zlib) de textos longos no SQLite.
+
+Textos comprimidos são gravados como BLOB com um cabeçalho que guarda o
+número de caracteres; textos em claro continuam como TEXT. Como o SQLite
+tem tipagem dinâmica, as duas formas convivem na mesma coluna e a leitura
+decide pelo tipo do valor.
+"""
+
+import sqlite3
+import struct
+import zlib
+from typing import Optional, Union
+
+# Cabeçalho: marcador + número de caracteres do texto original
+_MARCADOR = b"ZTX1"
+_CABECALHO = struct.Struct("<4sI")
+
+NIVEL_COMPRESSAO = 6
+
+# Views usadas como conteúdo dos índices FTS5 no modo comprimido
+VIEWS_CONTEUDO = ("documentos_conteudo", "traducoes_conteudo")
+
+ValorTexto = Union[str, bytes, memoryview, None]
+
+
+def comprimir(texto: str, nivel: int = NIVEL_COMPRESSAO) -> bytes:
+    """Comprime um texto para gravação como BLOB."""
+    dados = zlib.compress(texto.encode("utf-8"), nivel)
+    return _CABECALHO.pack(_MARCADOR, len(texto)) + dados
+
+
+def _eh_comprimido(valor: ValorTexto) -> bool:
+    return isinstance(valor, (bytes, memoryview)) and bytes(valor[:4]) == _MARCADOR
+
+
+def descomprimir(valor: ValorTexto) -> Optional[str]:
+    """Retorna o texto original (valores TEXT são devolvidos sem alteração)."""
+    if _eh_comprimido(valor):
+        return zlib.decompress(bytes(valor[_CABECALHO.size :])).decode("utf-8")
+    if isinstance(valor, (bytes, memoryview)):
+        return bytes(valor).decode("utf-8")
+    return valor
+
+
+def tamanho_texto(valor: ValorTexto) -> int:
+    """Número de caracteres do texto, lido do cabeçalho sem descomprimir."""
+    if _eh_comprimido(valor):
+        return _CABECALHO.unpack_from(bytes(valor[: _CABECALHO.size]))[1]
+    return len(descomprimir(valor) or "")
+
+
+def para_armazenar(texto: str, comprimido: bool) -> ValorTexto:
+    """Valor a gravar na coluna de texto conforme o modo de armazenamento."""
+    return comprimir(texto) if comprimido and texto else texto
+
+
+def registrar_funcoes(conn: sqlite3.Connection) -> None:
+    """
+    Registra descomprimir() e tamanho_texto() como funções SQL.
+
+    São usadas pelos triggers/views do índice de busca no modo comprimido,
+    por isso toda conexão de escrita precisa delas.
+    """
+    conn.create_function("descomprimir", 1, descomprimir, deterministic=True)
+    conn.create_function("tamanho_texto", 1, tamanho_texto, deterministic=True)
+
+
+def compressao_ativa(conn: sqlite3.Connection) -> bool:
+    """Indica se o banco está no modo de texto comprimido."""
+    linha = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = ?",
+        (VIEWS_CONTEUDO[0],),
+    ).fetchone()
+    return linha is not None
@@ -0,0 +1,26 @@
+# src/infrastructure/persistence/consultas.py
+"""
+Consultas dos repositórios verificadas com EXPLAIN QUERY PLAN.
+
+Cada repositório expõe `consultas_planejadas()`, montadas pelos mesmos
+métodos/constantes que geram o SQL executado: a verificação
+(migrations.verificar_planos) acompanha o que os repositórios realmente rodam.
+"""
+
+from typing import NamedTuple
+
+
+class ConsultaPlanejada(NamedTuple):
+    """
+    Consulta de um repositório com parâmetros de exemplo.
+
+    Attributes:
+        sql: Comando exatamente como o repositório o executa
+        parametros: Valores de exemplo para os marcadores
+        varredura: Percorre a tabela por definição (ex.: contagem sem filtro);
+                   SCAN é esperado e só a validade do comando é verificada
+    """
+
+    sql: str
+    parametros: tuple
+    varredura: bool = False
@@ -2,48 +2,461 @@
 """
 Scripts de migração para o banco de dados.
 Gerencia a evolução do schema sem perder dados.
+
+As migrações são numeradas (MIGRACOES) e registradas na tabela
+schema_version; aplicar_migracoes() executa apenas as pendentes.
 """
 
 import sqlite3
-from typing import List
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
 
+from src.domain.entities.documento import contar_palavras, contar_paragrafos
 from src.infrastructure.config.settings import settings
-from src.infrastructure.persistence.models import DocumentoModel, TraducaoModel
+from src.infrastructure.persistence.compressao import (
+    compressao_ativa,
+    descomprimir,
+    para_armazenar,
+    registrar_funcoes,
+)
+from src.infrastructure.persistence.consultas import ConsultaPlanejada
+from src.infrastructure.persistence.models import (
+    AlteracaoModel,
+    AnaliseModel,
+    DocumentoModel,
+    PessoaModel,
+    TraducaoModel,
+    calcular_hash_conteudo,
+)
+from src.infrastructure.persistence.sqlite_analise_repository import SQLiteAnaliseRepository
+from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
+from src.infrastructure.persistence.sqlite_traducao_repository import SQLiteTraducaoRepository
 
 
 def conectar() -> sqlite3.Connection:
-    """Conecta ao banco de dados."""
-    return sqlite3.connect(settings.DB_PATH)
+    """Conecta ao banco de dados (com as funções SQL de texto comprimido)."""
+    conn = sqlite3.connect(settings.DB_PATH)
+    registrar_funcoes(conn)
+    return conn
 
 
 def criar_tabelas():
-    """Cria todas as tabelas se não existirem."""
-    with conectar() as conn:
-        cursor = conn.cursor()
+    """Cria todas as tabelas se não existirem (aplica as migrações pendentes)."""
+    aplicar_migracoes()
+    print("✅ Tabelas criadas/verificadas com sucesso.")
 
-        # Criar tabela documentos
-        DocumentoModel.criar_tabela(cursor)
 
-        # Criar tabela traducoes
-        TraducaoModel.criar_tabela(cursor)
+# Índices dos filtros usados pelos repositórios. Como o id é alias do rowid,
+# cada índice já termina em id: filtros por igualdade saem ordenados por id
+# (listar/iterar/cursores) e as contagens ficam cobertas pelo índice.
+INDICES_DOCUMENTOS: Dict[str, Tuple[str, ...]] = {
+    "idx_documentos_centro": ("centro",),
+    "idx_documentos_tipo": ("tipo_documento",),
+    "idx_documentos_centro_tipo": ("centro", "tipo_documento"),
+    "idx_documentos_pessoa_tipo": ("pessoa_principal", "tipo_documento"),
+}
 
-        conn.commit()
-    print("✅ Tabelas criadas/verificadas com sucesso.")
+
+def criar_indices(cursor: sqlite3.Cursor):
+    """
+    Cria os índices secundários de documentos.
+
+    Índices cujas colunas ainda não existem (banco sem a migração de
+    metadados) são ignorados e criados na próxima migração.
+    """
+    cursor.execute("PRAGMA table_info(documentos)")
+    colunas = {row[1] for row in cursor.fetchall()}
+
+    for nome, colunas_indice in INDICES_DOCUMENTOS.items():
+        if set(colunas_indice) <= colunas:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {nome} ON documentos ({', '.join(colunas_indice)})"
+            )
+
+
+# Índices FTS5: nome -> (tabela de origem, colunas indexadas, view do modo comprimido)
+INDICES_BUSCA: Dict[str, Tuple[str, Tuple[str, ...], str]] = {
+    "documentos_fts": ("documentos", ("titulo", "texto"), "documentos_conteudo"),
+    "traducoes_fts": ("traducoes", ("texto_traduzido",), "traducoes_conteudo"),
+}
+
+# Coluna de texto longo de cada tabela (comprimida no modo comprimido)
+COLUNAS_TEXTO = {"documentos": "texto", "traducoes": "texto_traduzido"}
+
+
+def criar_indice_busca(cursor: sqlite3.Cursor, comprimido: bool = False):
+    """
+    Cria os índices FTS5 (external content) de documentos e traduções.
+
+    Os triggers mantêm os índices sincronizados com as tabelas de origem.
+    Se o índice acabou de ser criado, é reconstruído a partir dos dados existentes.
+
+    No modo comprimido o conteúdo vem de uma view que aplica descomprimir()
+    e os triggers indexam o texto descomprimido.
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    existentes = {row[0] for row in cursor.fetchall()}
+
+    for indice, (tabela, colunas, view) in INDICES_BUSCA.items():
+        conteudo = tabela
+        comprimidas = {COLUNAS_TEXTO[tabela]} if comprimido else set()
+
+        def valor(prefixo: str, coluna: str, comprimidas=comprimidas) -> str:
+            if coluna in comprimidas:
+                return f"descomprimir({prefixo}.{coluna})"
+            return f"{prefixo}.{coluna}"
+
+        if comprimido:
+            selecao = ", ".join(valor(tabela, c) + f" AS {c}" for c in colunas)
+            cursor.execute(
+                f"CREATE VIEW IF NOT EXISTS {view} AS SELECT id, {selecao} FROM {tabela}"
+            )
+            conteudo = view
+
+        lista = ", ".join(colunas)
+        novos = ", ".join(valor("new", c) for c in colunas)
+        antigos = ", ".join(valor("old", c) for c in colunas)
+
+        cursor.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {indice} USING fts5(
+                {lista},
+                content='{conteudo}', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 0'
+            )
+        """
+        )
+        cursor.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {indice}_ai AFTER INSERT ON {tabela} BEGIN
+                INSERT INTO {indice} (rowid, {lista})
+                VALUES (new.id, {novos});
+            END;
+            CREATE TRIGGER IF NOT EXISTS {indice}_ad AFTER DELETE ON {tabela} BEGIN
+                INSERT INTO {indice} ({indice}, rowid, {lista})
+                VALUES ('delete', old.id, {antigos});
+            END;
+            CREATE TRIGGER IF NOT EXISTS {indice}_au
+            AFTER UPDATE OF {lista} ON {tabela} BEGIN
+                INSERT INTO {indice} ({indice}, rowid, {lista})
+                VALUES ('delete', old.id, {antigos});
+                INSERT INTO {indice} (rowid, {lista})
+                VALUES (new.id, {novos});
+            END;
+        """
+        )
+
+        # Popular índice recém-criado com os dados já existentes
+        if indice not in existentes:
+            cursor.execute(f"INSERT INTO {indice} ({indice}) VALUES ('rebuild')")
+
+
+def _remover_indice_busca(cursor: sqlite3.Cursor):
+    """Remove índices FTS5, triggers e views de conteúdo."""
+    for indice, (_tabela, _colunas, view) in INDICES_BUSCA.items():
+        for sufixo in ("ai", "ad", "au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {indice}_{sufixo}")
+        cursor.execute(f"DROP TABLE IF EXISTS {indice}")
+        cursor.execute(f"DROP VIEW IF EXISTS {view}")
+
+
+def configurar_compressao(conn: sqlite3.Connection, ativa: bool, chunk_size: int = 500) -> int:
+    """
+    Liga/desliga o armazenamento comprimido reescrevendo os textos existentes.
+
+    Os índices de busca são recriados para o novo modo (o conteúdo lógico
+    não muda). Ao ativar, roda VACUUM para devolver o espaço ao disco.
+
+    Returns:
+        Número de linhas reescritas
+    """
+    if compressao_ativa(conn) == ativa:
+        return 0
+
+    cursor = conn.cursor()
+    _remover_indice_busca(cursor)
+
+    tipo_origem = "text" if ativa else "blob"
+    reescritas = 0
+    for tabela, coluna in COLUNAS_TEXTO.items():
+        ultimo_id = 0
+        while True:
+            linhas = cursor.execute(
+                f"SELECT id, {coluna} FROM {tabela} "
+                f"WHERE id > ? AND typeof({coluna}) = ? ORDER BY id LIMIT ?",
+                (ultimo_id, tipo_origem, chunk_size),
+            ).fetchall()
+            if not linhas:
+                break
+            cursor.executemany(
+                f"UPDATE {tabela} SET {coluna} = ? WHERE id = ?",
+                [(para_armazenar(descomprimir(valor) or "", ativa), id_) for id_, valor in linhas],
+            )
+            reescritas += len(linhas)
+            ultimo_id = linhas[-1][0]
+
+    criar_indice_busca(cursor, comprimido=ativa)
+    conn.commit()
+
+    if ativa:
+        conn.execute("VACUUM")
+    return reescritas
 
 
 def migrar_banco_existente():
     """
     Adiciona colunas de metadados ao banco existente.
-    Usado após a FASE 1 para enriquecer dados antigos.
+    Mantido por compatibilidade: equivale a aplicar as migrações pendentes.
     """
-    with conectar() as conn:
-        cursor = conn.cursor()
+    aplicar_migracoes()
+    print("✅ Migração de metadados concluída.")
 
-        # Adicionar colunas de metadados
-        DocumentoModel.adicionar_colunas_metadados(cursor)
 
+def _criar_tabelas_base(cursor: sqlite3.Cursor):
+    """Migração 1: tabelas documentos e traducoes."""
+    DocumentoModel.criar_tabela(cursor)
+    TraducaoModel.criar_tabela(cursor)
+
+
+def _adicionar_tamanhos(cursor: sqlite3.Cursor, chunk_size: int = 500):
+    """
+    Migração 5: colunas num_caracteres/num_palavras/num_paragrafos.
+
+    Preenche as contagens dos documentos existentes em lotes por id; a
+    partir daí o repositório as grava junto com o texto.
+    """
+    DocumentoModel.adicionar_colunas_tamanho(cursor)
+
+    ultimo_id = 0
+    while True:
+        linhas = cursor.execute(
+            "SELECT id, texto FROM documentos "
+            "WHERE id > ? AND num_caracteres IS NULL ORDER BY id LIMIT ?",
+            (ultimo_id, chunk_size),
+        ).fetchall()
+        if not linhas:
+            break
+
+        atualizacoes = []
+        for id_, valor in linhas:
+            texto = descomprimir(valor) or ""
+            atualizacoes.append((len(texto), contar_palavras(texto), contar_paragrafos(texto), id_))
+        cursor.executemany(
+            "UPDATE documentos SET num_caracteres = ?, num_palavras = ?, num_paragrafos = ? "
+            "WHERE id = ?",
+            atualizacoes,
+        )
+        ultimo_id = linhas[-1][0]
+
+
+def _criar_indice_pessoas(cursor: sqlite3.Cursor, chunk_size: int = 500):
+    """
+    Migração 6: tabelas pessoas e documento_pessoas.
+
+    Os vínculos dos documentos existentes são extraídos das colunas
+    pessoa_principal, remetente, destinatario e envolvidos.
+    """
+    PessoaModel.criar_tabela(cursor)
+
+    ultimo_id = 0
+    while True:
+        linhas = cursor.execute(
+            "SELECT id, pessoa_principal, remetente, destinatario, envolvidos "
+            "FROM documentos WHERE id > ? ORDER BY id LIMIT ?",
+            (ultimo_id, chunk_size),
+        ).fetchall()
+        if not linhas:
+            break
+        PessoaModel.sincronizar(
+            cursor, {id_: PessoaModel.vinculos(*colunas) for id_, *colunas in linhas}
+        )
+        ultimo_id = linhas[-1][0]
+
+
+def _adicionar_hash_conteudo(cursor: sqlite3.Cursor, chunk_size: int = 500):
+    """
+    Migração 7: coluna hash_conteudo, usada pelo upsert por URL.
+
+    Calcula o hash dos documentos existentes para que a primeira recoleta
+    já reconheça as páginas inalteradas.
+    """
+    DocumentoModel.adicionar_coluna_hash(cursor)
+
+    # Bancos muito antigos não têm data_original
+    cursor.execute("PRAGMA table_info(documentos)")
+    data = "data_original" if "data_original" in {row[1] for row in cursor.fetchall()} else "NULL"
+
+    ultimo_id = 0
+    while True:
+        linhas = cursor.execute(
+            f"SELECT id, centro, titulo, {data}, texto FROM documentos "
+            "WHERE id > ? AND hash_conteudo IS NULL ORDER BY id LIMIT ?",
+            (ultimo_id, chunk_size),
+        ).fetchall()
+        if not linhas:
+            break
+        cursor.executemany(
+            "UPDATE documentos SET hash_conteudo = ? WHERE id = ?",
+            [
+                (calcular_hash_conteudo(centro, titulo, data, descomprimir(texto) or ""), id_)
+                for id_, centro, titulo, data, texto in linhas
+            ],
+        )
+        ultimo_id = linhas[-1][0]
+
+
+def _criar_controle_alteracoes(cursor: sqlite3.Cursor):
+    """
+    Migração 8: colunas updated_at e log de alterações.
+
+    Linhas existentes recebem updated_at da data de coleta/tradução e uma
+    entrada de inserção no log, de modo que a marca 0 cubra todo o acervo.
+    """
+    AlteracaoModel.criar_tabela(cursor)
+
+    for tabela, origem in (("documentos", "data_coleta"), ("traducoes", "data_traducao")):
+        try:
+            cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN updated_at TEXT")
+        except sqlite3.OperationalError:
+            pass  # Coluna já existe
+        cursor.execute(f"UPDATE {tabela} SET updated_at = {origem} WHERE updated_at IS NULL")
+        cursor.execute(
+            "INSERT INTO alteracoes (tabela, registro_id, operacao, alterado_em) "
+            f"SELECT '{tabela}', id, ?, updated_at FROM {tabela} "
+            f"WHERE id NOT IN (SELECT registro_id FROM alteracoes WHERE tabela = '{tabela}') "
+            "ORDER BY id",
+            (AlteracaoModel.INSERCAO,),
+        )
+
+
+# Migrações em ordem. Nunca altere uma migração já publicada: acrescente
+# uma nova versão. As quatro primeiras são idempotentes para que bancos
+# anteriores ao controle de versão possam ser adotados sem perda de dados.
+MIGRACOES: List[Tuple[int, str, Callable[[sqlite3.Cursor], None]]] = [
+    (1, "Tabelas documentos e traducoes", _criar_tabelas_base),
+    (2, "Colunas de metadados", DocumentoModel.adicionar_colunas_metadados),
+    (3, "Índices de busca textual (FTS5)", criar_indice_busca),
+    (4, "Índices secundários de documentos", criar_indices),
+    (5, "Contagens do texto (caracteres, palavras, parágrafos)", _adicionar_tamanhos),
+    (6, "Índice de pessoas por documento", _criar_indice_pessoas),
+    (7, "Hash do conteúdo coletado", _adicionar_hash_conteudo),
+    (8, "Controle de alterações (updated_at e log)", _criar_controle_alteracoes),
+    (9, "Cache persistente de análises de texto", AnaliseModel.criar_tabela),
+]
+
+VERSAO_ESQUEMA = MIGRACOES[-1][0]
+
+
+def versao_atual(cursor: sqlite3.Cursor) -> int:
+    """Versão do schema registrada no banco (0 se nunca migrado)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            versao INTEGER PRIMARY KEY,
+            descricao TEXT NOT NULL,
+            aplicada_em TEXT NOT NULL
+        )
+    """
+    )
+    cursor.execute("SELECT MAX(versao) FROM schema_version")
+    return cursor.fetchone()[0] or 0
+
+
+def aplicar_migracoes(
+    conn: Optional[sqlite3.Connection] = None, comprimir_texto: Optional[bool] = None
+) -> List[int]:
+    """
+    Aplica, em ordem, as migrações ainda não registradas em schema_version.
+
+    Em seguida ajusta o modo de armazenamento de texto (ver
+    configurar_compressao) se ele diferir do configurado.
+
+    Args:
+        conn: Conexão a usar (padrão: banco configurado em settings)
+        comprimir_texto: Modo de texto comprimido (padrão: settings.DB_COMPRIMIR_TEXTO)
+
+    Returns:
+        Versões aplicadas nesta chamada
+    """
+    propria = conn is None
+    if propria:
+        conn = conectar()
+
+    aplicadas = []
+    try:
+        cursor = conn.cursor()
+        atual = versao_atual(cursor)
         conn.commit()
-    print("✅ Migração de metadados concluída.")
+
+        for versao, descricao, migracao in MIGRACOES:
+            if versao <= atual:
+                continue
+            migracao(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (versao, descricao, aplicada_em) VALUES (?, ?, ?)",
+                (versao, descricao, datetime.now().isoformat()),
+            )
+            conn.commit()
+            aplicadas.append(versao)
+
+        if comprimir_texto is None:
+            comprimir_texto = settings.DB_COMPRIMIR_TEXTO
+        configurar_compressao(conn, comprimir_texto)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if propria:
+            conn.close()
+
+    return aplicadas
+
+
+def consultas_repositorios() -> Dict[str, ConsultaPlanejada]:
+    """
+    Consultas de leitura dos repositórios, verificadas com EXPLAIN QUERY PLAN.
+
+    Montadas pelos próprios repositórios (consultas_planejadas), com o mesmo
+    SQL que executam: uma consulta alterada no repositório é verificada como está.
+    """
+    consultas = {
+        "alteracoes.listar_desde": ConsultaPlanejada(
+            AlteracaoModel.SQL_LISTAR_DESDE, ("documentos", 0, 1000)
+        ),
+    }
+    consultas.update(SQLiteDocumentoRepository.consultas_planejadas())
+    consultas.update(SQLiteTraducaoRepository.consultas_planejadas())
+    consultas.update(SQLiteAnaliseRepository.consultas_planejadas())
+    return consultas
+
+
+def verificar_planos(cursor: sqlite3.Cursor) -> List[str]:
+    """
+    Roda EXPLAIN QUERY PLAN nas consultas dos repositórios.
+
+    Nenhuma deve percorrer uma tabela inteira, exceto as marcadas como
+    varredura (ex.: contagem sem filtro), das quais só se verifica a validade.
+    Percorrer o resultado de uma subconsulta ("SCAN (subquery-N)") não conta.
+
+    Returns:
+        Lista de problemas (consultas que caem em SCAN ou não executam)
+    """
+    problemas = []
+    for nome, consulta in consultas_repositorios().items():
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {consulta.sql}", consulta.parametros)
+            passos = [row[3] for row in cursor.fetchall()]
+        except sqlite3.OperationalError as e:
+            problemas.append(f"Consulta '{nome}' inválida: {e}")
+            continue
+
+        if consulta.varredura:
+            continue
+        for passo in passos:
+            if passo.startswith("SCAN") and not passo.startswith("SCAN ("):
+                problemas.append(f"Consulta '{nome}' sem índice: {passo}")
+
+    return problemas
 
 
 def verificar_integridade() -> List[str]:
@@ -66,6 +479,18 @@ def verificar_integridade() -> List[str]:
         if "traducoes" not in tabelas:
             problemas.append("Tabela 'traducoes' não existe")
 
+        if "schema_version" in tabelas:
+            cursor.execute("SELECT MAX(versao) FROM schema_version")
+            versao = cursor.fetchone()[0] or 0
+            if versao < VERSAO_ESQUEMA:
+                problemas.append(f"Schema na versão {versao}, esperada {VERSAO_ESQUEMA}")
+        else:
+            problemas.append("Tabela 'schema_version' não existe (migrações nunca aplicadas)")
+
+        for indice in ("documentos_fts", "traducoes_fts"):
+            if indice not in tabelas:
+                problemas.append(f"Índice de busca '{indice}' não existe")
+
         # Verificar colunas da documentos
         if "documentos" in tabelas:
             cursor.execute("PRAGMA table_info(documentos)")
@@ -79,12 +504,21 @@ def verificar_integridade() -> List[str]:
                 "destinatario",
                 "envolvidos",
                 "tem_anexos",
+                "num_caracteres",
+                "num_palavras",
+                "num_paragrafos",
+                "hash_conteudo",
+                "updated_at",
             ]
 
             for col in colunas_esperadas:
                 if col not in colunas:
                     problemas.append(f"Coluna '{col}' não encontrada em 'documentos'")
 
+        # Verificar planos de execução (só com o schema completo)
+        if not problemas:
+            problemas.extend(verificar_planos(cursor))
+
     return problemas
 
 
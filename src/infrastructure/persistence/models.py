@@ -4,10 +4,34 @@ Modelos SQLite para mapeamento objeto-relacional.
 Usamos SQLite puro (sem ORM) por simplicidade.
 """
 
+import hashlib
+import json
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from src.domain.value_objects.analise_texto import (
+    AnaliseTexto,
+    Entidade,
+    EstatisticasTexto,
+    Sentimento,
+)
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
+from src.infrastructure.persistence.compressao import comprimir, descomprimir, para_armazenar
+
+
+def calcular_hash_conteudo(
+    centro: str, titulo: str, data_original: Optional[str], texto: str
+) -> str:
+    """
+    Hash (SHA-256) do conteúdo coletado de um documento.
+
+    Cobre apenas o que vem da página de origem: metadados derivados
+    (classificação, pessoas) não alteram o hash.
+    """
+    partes = (centro, titulo, data_original or "", texto)
+    return hashlib.sha256("\x1f".join(partes).encode("utf-8")).hexdigest()
 
 
 @dataclass
@@ -22,7 +46,7 @@ class DocumentoModel:
     titulo: str
     data_original: Optional[str]
     url: str
-    texto: str
+    texto: Union[str, bytes, None]  # bytes no modo comprimido (ver compressao.py)
     data_coleta: str
 
     # Colunas adicionadas nas migrações
@@ -36,6 +60,13 @@ class DocumentoModel:
     tem_anexos: int = 0  # SQLite não tem boolean, usar 0/1
     tipo_en: Optional[str] = None
 
+    # Contagens do texto, calculadas na gravação (None = não calculadas)
+    num_caracteres: Optional[int] = None
+    num_palavras: Optional[int] = None
+    num_paragrafos: Optional[int] = None
+    hash_conteudo: Optional[str] = None
+    updated_at: Optional[str] = None
+
     @classmethod
     def criar_tabela(cls, cursor: sqlite3.Cursor):
         """Cria a tabela documentos se não existir."""
@@ -74,6 +105,23 @@ class DocumentoModel:
             except sqlite3.OperationalError:
                 pass  # Coluna já existe
 
+    @classmethod
+    def adicionar_colunas_tamanho(cls, cursor: sqlite3.Cursor):
+        """Adiciona as colunas de contagens do texto (migração)."""
+        for coluna in ("num_caracteres", "num_palavras", "num_paragrafos"):
+            try:
+                cursor.execute(f"ALTER TABLE documentos ADD COLUMN {coluna} INTEGER")
+            except sqlite3.OperationalError:
+                pass  # Coluna já existe
+
+    @classmethod
+    def adicionar_coluna_hash(cls, cursor: sqlite3.Cursor):
+        """Adiciona a coluna hash_conteudo (migração)."""
+        try:
+            cursor.execute("ALTER TABLE documentos ADD COLUMN hash_conteudo TEXT")
+        except sqlite3.OperationalError:
+            pass  # Coluna já existe
+
     def para_entidade(self):
         """
         Converte modelo para entidade do domínio.
@@ -86,13 +134,13 @@ class DocumentoModel:
         if self.envolvidos:
             envolvidos_list = [e.strip() for e in self.envolvidos.split(",")]
 
-        return Documento(
+        documento = Documento(
             id=self.id,
             centro=self.centro,
             titulo=self.titulo,
             data_original=self.data_original,
             url=self.url,
-            texto=self.texto,
+            texto=descomprimir(self.texto) or "",
             data_coleta=datetime.fromisoformat(self.data_coleta),
             tipo=self.tipo_documento,
             tipo_descricao=self.tipo_descricao,
@@ -103,19 +151,48 @@ class DocumentoModel:
             tem_anexos=bool(self.tem_anexos),
         )
 
+        tamanhos = (self.num_caracteres, self.num_palavras, self.num_paragrafos)
+        if None not in tamanhos:
+            documento.registrar_tamanhos(*tamanhos)
+        return documento
+
+    def vinculos_pessoas(self) -> List[Tuple[str, str]]:
+        """Pares (nome, papel) do documento para a tabela documento_pessoas."""
+        return PessoaModel.vinculos(
+            self.pessoa_principal, self.remetente, self.destinatario, self.envolvidos
+        )
+
     @classmethod
-    def de_entidade(cls, documento):
+    def de_entidade(cls, documento, comprimido: bool = False):
         """
         Converte entidade do domínio para modelo.
         Usado ao salvar dados no banco.
+
+        Args:
+            documento: Entidade Documento
+            comprimido: Gravar o texto comprimido (zlib)
+
+        Documentos com texto ainda não carregado (ver Documento.adiar_texto)
+        geram modelo com texto, contagens e hash None: o repositório grava só
+        os metadados.
         """
+        texto = num_caracteres = num_palavras = num_paragrafos = hash_conteudo = None
+        if documento.texto_carregado:
+            texto = para_armazenar(documento.texto, comprimido)
+            num_caracteres = documento.tamanho_caracteres
+            num_palavras = documento.tamanho_palavras
+            num_paragrafos = documento.tamanho_paragrafos
+            hash_conteudo = calcular_hash_conteudo(
+                documento.centro, documento.titulo, documento.data_original, documento.texto
+            )
+
         return cls(
             id=documento.id,
             centro=documento.centro,
             titulo=documento.titulo,
             data_original=documento.data_original,
             url=documento.url,
-            texto=documento.texto,
+            texto=texto,
             data_coleta=documento.data_coleta.isoformat(),
             tipo_documento=documento.tipo,
             tipo_descricao=documento.tipo_descricao,
@@ -124,6 +201,11 @@ class DocumentoModel:
             destinatario=documento.destinatario,
             envolvidos=", ".join(documento.envolvidos) if documento.envolvidos else None,
             tem_anexos=1 if documento.tem_anexos else 0,
+            num_caracteres=num_caracteres,
+            num_palavras=num_palavras,
+            num_paragrafos=num_paragrafos,
+            hash_conteudo=hash_conteudo,
+            updated_at=datetime.now().isoformat(),
         )
 
 
@@ -163,3 +245,290 @@ class TraducaoModel:
             ON traducoes (documento_id, idioma)
         """
         )
+
+
+@dataclass
+class PessoaModel:
+    """
+    Modelo de pessoa citada nos documentos.
+
+    A tabela documento_pessoas liga pessoas a documentos com o papel que
+    ocupam, permitindo buscar "documentos de X" por índice.
+    """
+
+    id: Optional[int]
+    nome: str
+
+    PAPEIS = ("principal", "remetente", "destinatario", "envolvido")
+
+    @classmethod
+    def criar_tabela(cls, cursor: sqlite3.Cursor):
+        """Cria as tabelas pessoas e documento_pessoas se não existirem."""
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pessoas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nome TEXT UNIQUE NOT NULL
+            )
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documento_pessoas (
+                documento_id INTEGER NOT NULL,
+                pessoa_id INTEGER NOT NULL,
+                papel TEXT NOT NULL,
+                PRIMARY KEY (documento_id, pessoa_id, papel),
+                FOREIGN KEY (documento_id) REFERENCES documentos (id) ON DELETE CASCADE,
+                FOREIGN KEY (pessoa_id) REFERENCES pessoas (id)
+            ) WITHOUT ROWID
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_documento_pessoas_pessoa
+            ON documento_pessoas (pessoa_id, papel, documento_id)
+        """
+        )
+
+        # As conexões não ativam foreign_keys: o CASCADE é feito por trigger
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS documento_pessoas_ad AFTER DELETE ON documentos BEGIN
+                DELETE FROM documento_pessoas WHERE documento_id = old.id;
+            END
+        """
+        )
+
+    @staticmethod
+    def vinculos(
+        principal: Optional[str],
+        remetente: Optional[str],
+        destinatario: Optional[str],
+        envolvidos: Optional[str],
+    ) -> List[Tuple[str, str]]:
+        """
+        Pares (nome, papel) a partir das colunas de pessoas de documentos.
+
+        Args:
+            envolvidos: Nomes separados por vírgula (formato da coluna)
+        """
+        pares = [(principal, "principal"), (remetente, "remetente"), (destinatario, "destinatario")]
+        if envolvidos:
+            pares.extend((nome.strip(), "envolvido") for nome in envolvidos.split(","))
+        return list(dict.fromkeys((nome, papel) for nome, papel in pares if nome))
+
+    @staticmethod
+    def sincronizar(cursor: sqlite3.Cursor, vinculos: Dict[int, List[Tuple[str, str]]]):
+        """
+        Substitui os vínculos de pessoas dos documentos informados.
+
+        Args:
+            vinculos: documento_id -> pares (nome, papel)
+        """
+        if not vinculos:
+            return
+
+        cursor.executemany(
+            "DELETE FROM documento_pessoas WHERE documento_id = ?",
+            [(documento_id,) for documento_id in vinculos],
+        )
+        nomes = {nome for pares in vinculos.values() for nome, _papel in pares}
+        cursor.executemany(
+            "INSERT OR IGNORE INTO pessoas (nome) VALUES (?)", [(nome,) for nome in nomes]
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO documento_pessoas (documento_id, pessoa_id, papel) "
+            "SELECT ?, id, ? FROM pessoas WHERE nome = ?",
+            [
+                (documento_id, papel, nome)
+                for documento_id, pares in vinculos.items()
+                for nome, papel in pares
+            ],
+        )
+
+
+@dataclass
+class AlteracaoModel:
+    """
+    Entrada do log de alterações (append-only) gravado pelos repositórios.
+
+    O id é crescente e serve de marca para processamento incremental.
+    """
+
+    id: Optional[int]
+    tabela: str
+    registro_id: int
+    operacao: str
+    alterado_em: str
+
+    INSERCAO = "insercao"
+    ATUALIZACAO = "atualizacao"
+    REMOCAO = "remocao"
+
+    @classmethod
+    def criar_tabela(cls, cursor: sqlite3.Cursor):
+        """Cria a tabela alteracoes se não existir."""
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS alteracoes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tabela TEXT NOT NULL,
+                registro_id INTEGER NOT NULL,
+                operacao TEXT NOT NULL,
+                alterado_em TEXT NOT NULL
+            )
+        """
+        )
+
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_alteracoes_tabela
+            ON alteracoes (tabela, id)
+        """
+        )
+
+    @staticmethod
+    def registrar(
+        cursor: sqlite3.Cursor,
+        tabela: str,
+        operacoes: Iterable[Tuple[int, str]],
+        alterado_em: Optional[str] = None,
+    ):
+        """
+        Acrescenta entradas ao log, na mesma transação da escrita.
+
+        Args:
+            operacoes: Pares (registro_id, operacao)
+            alterado_em: Momento da alteração (padrão: agora)
+        """
+        alterado_em = alterado_em or datetime.now().isoformat()
+        cursor.executemany(
+            "INSERT INTO alteracoes (tabela, registro_id, operacao, alterado_em) "
+            "VALUES (?, ?, ?, ?)",
+            [(tabela, registro_id, operacao, alterado_em) for registro_id, operacao in operacoes],
+        )
+
+    SQL_LISTAR_DESDE = (
+        "SELECT id, registro_id, operacao FROM alteracoes "
+        "WHERE tabela = ? AND id > ? ORDER BY id LIMIT ?"
+    )
+
+    @classmethod
+    def listar_desde(
+        cls, cursor: sqlite3.Cursor, tabela: str, marca: int, limite: int
+    ) -> LoteAlteracoes:
+        """
+        Lê até `limite` entradas do log após a marca e consolida por registro.
+
+        Registros cuja última operação é remoção vão para `removidos`.
+        """
+        cursor.execute(cls.SQL_LISTAR_DESDE, (tabela, marca, limite))
+        entradas = cursor.fetchall()
+        if not entradas:
+            return LoteAlteracoes(marca=marca)
+
+        ultima_operacao = {registro_id: operacao for _id, registro_id, operacao in entradas}
+        return LoteAlteracoes(
+            alterados=[r for r, op in ultima_operacao.items() if op != cls.REMOCAO],
+            removidos=[r for r, op in ultima_operacao.items() if op == cls.REMOCAO],
+            marca=entradas[-1][0],
+        )
+
+
+@dataclass
+class AnaliseModel:
+    """
+    Análise de texto gravada (cache persistente do AnalisarDocumento).
+
+    Vale enquanto o texto (hash_texto) e o modelo forem os mesmos; há no
+    máximo uma análise por documento e idioma. O resultado é o AnaliseTexto
+    em JSON comprimido.
+    """
+
+    documento_id: int
+    idioma: str
+    hash_texto: str
+    modelo: str
+    resultado: bytes
+    criado_em: str
+
+    @classmethod
+    def criar_tabela(cls, cursor: sqlite3.Cursor):
+        """Cria a tabela analises e os triggers que a invalidam."""
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS analises (
+                documento_id INTEGER NOT NULL,
+                idioma TEXT NOT NULL,
+                hash_texto TEXT NOT NULL,
+                modelo TEXT NOT NULL,
+                resultado BLOB NOT NULL,
+                criado_em TEXT NOT NULL,
+                PRIMARY KEY (documento_id, idioma, hash_texto, modelo)
+            )
+        """
+        )
+
+        # Invalidação na mesma transação de qualquer escrita do texto analisado
+        # (o original é analisado como 'ru'; traduções, pelo próprio idioma)
+        triggers = {
+            "analises_documentos_au": (
+                "AFTER UPDATE OF texto ON documentos",
+                "DELETE FROM analises WHERE documento_id = old.id AND idioma = 'ru';",
+            ),
+            "analises_documentos_ad": (
+                "AFTER DELETE ON documentos",
+                "DELETE FROM analises WHERE documento_id = old.id;",
+            ),
+            "analises_traducoes_ai": (
+                "AFTER INSERT ON traducoes",
+                "DELETE FROM analises "
+                "WHERE documento_id = new.documento_id AND idioma = new.idioma;",
+            ),
+            "analises_traducoes_au": (
+                "AFTER UPDATE ON traducoes",
+                "DELETE FROM analises "
+                "WHERE documento_id = old.documento_id AND idioma IN (old.idioma, new.idioma);",
+            ),
+            "analises_traducoes_ad": (
+                "AFTER DELETE ON traducoes",
+                "DELETE FROM analises "
+                "WHERE documento_id = old.documento_id AND idioma = old.idioma;",
+            ),
+        }
+        for nome, (evento, corpo) in triggers.items():
+            cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {nome} {evento} BEGIN {corpo} END")
+
+    @classmethod
+    def de_entidade(cls, analise: AnaliseTexto, hash_texto: str, modelo: str) -> "AnaliseModel":
+        """Serializa a análise para gravação."""
+        dados = asdict(analise)
+        dados["data_analise"] = analise.data_analise.isoformat()
+        return cls(
+            documento_id=analise.documento_id,
+            idioma=analise.idioma,
+            hash_texto=hash_texto,
+            modelo=modelo,
+            resultado=comprimir(json.dumps(dados, ensure_ascii=False)),
+            criado_em=datetime.now().isoformat(),
+        )
+
+    @staticmethod
+    def para_entidade(resultado: Union[bytes, memoryview]) -> AnaliseTexto:
+        """Reconstrói o AnaliseTexto a partir da coluna resultado."""
+        dados = json.loads(descomprimir(resultado) or "{}")
+        return AnaliseTexto(
+            documento_id=dados["documento_id"],
+            idioma=dados["idioma"],
+            data_analise=datetime.fromisoformat(dados["data_analise"]),
+            estatisticas=EstatisticasTexto(**dados["estatisticas"]),
+            entidades=[Entidade(**entidade) for entidade in dados["entidades"]],
+            entidades_por_tipo=dados["entidades_por_tipo"],
+            sentimento=Sentimento(**dados["sentimento"]),
+            palavras_frequentes=[tuple(par) for par in dados["palavras_frequentes"]],
+            modelo_utilizado=dados["modelo_utilizado"],
+            tempo_processamento=dados["tempo_processamento"],
+        )
@@ -0,0 +1,161 @@
+"""
+Pool de conexões SQLite compartilhado pelos repositórios.
+Mantém uma conexão viva por thread e aplica PRAGMAs de desempenho.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.persistence.compressao import registrar_funcoes
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+class PoolConexoes:
+    """
+    Pool de conexões SQLite por thread.
+
+    Cada thread reutiliza a sua própria conexão, aberta na primeira
+    requisição com WAL, synchronous=NORMAL e cache/mmap configuráveis.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        cache_size: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            db_path: Caminho do arquivo do banco
+            cache_size: Valor do PRAGMA cache_size (negativo = KiB)
+            mmap_size: Valor do PRAGMA mmap_size em bytes
+        """
+        self.db_path = db_path
+        self.cache_size = settings.DB_CACHE_SIZE if cache_size is None else cache_size
+        self.mmap_size = settings.DB_MMAP_SIZE if mmap_size is None else mmap_size
+
+        self._local = threading.local()
+        self._conexoes: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _abrir(self) -> sqlite3.Connection:
+        """Abre e configura uma nova conexão."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Retorna dicionários
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        registrar_funcoes(conn)
+        return conn
+
+    def obter(self) -> sqlite3.Connection:
+        """Retorna a conexão da thread atual (abre se necessário)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self.hits += 1
+            if _telemetry:
+                _telemetry.increment("sqlite_pool.hit")
+            return conn
+
+        conn = self._abrir()
+        self._local.conn = conn
+        with self._lock:
+            self._conexoes.append(conn)
+        self.misses += 1
+        if _telemetry:
+            _telemetry.increment("sqlite_pool.miss")
+        return conn
+
+    def _conexao_transacao(self):
+        """Conexão entregue por conexao() no bloco mais externo da thread."""
+        return self.obter()
+
+    @contextmanager
+    def conexao(self):
+        """
+        Gerenciador de contexto: commit ao sair, rollback em caso de erro.
+
+        Blocos aninhados na mesma thread recebem a conexão do bloco externo e
+        fazem parte da mesma transação: só o mais externo faz commit/rollback.
+        """
+        profundidade = getattr(self._local, "profundidade", 0)
+        conn = self._local.transacao if profundidade else self._conexao_transacao()
+        self._local.transacao = conn
+        self._local.profundidade = profundidade + 1
+        try:
+            yield conn
+            if not profundidade:
+                conn.commit()
+        except Exception:
+            if not profundidade:
+                conn.rollback()
+            raise
+        finally:
+            self._local.profundidade = profundidade
+            if not profundidade:
+                self._local.transacao = None
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores de uso do pool."""
+        return {"hits": self.hits, "misses": self.misses, "conexoes": len(self._conexoes)}
+
+    def fechar(self) -> None:
+        """Fecha todas as conexões abertas pelo pool."""
+        with self._lock:
+            for conn in self._conexoes:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._conexoes.clear()
+            self._local = threading.local()
+
+
+_pools: Dict[str, PoolConexoes] = {}
+_pools_lock = threading.Lock()
+
+
+def obter_pool(db_path: str) -> PoolConexoes:
+    """Retorna o pool compartilhado para um arquivo de banco."""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = PoolConexoes(db_path)
+            _pools[db_path] = pool
+        return pool
+
+
+def registrar_pool(db_path: str, pool: PoolConexoes) -> None:
+    """
+    Define o pool usado pelos repositórios para um arquivo de banco.
+
+    Substitui (e fecha) o pool anterior; repositórios criados depois passam
+    a usar o novo pool (ex.: réplica em memória, ver replica.py).
+    """
+    with _pools_lock:
+        anterior = _pools.get(db_path)
+        _pools[db_path] = pool
+    if anterior is not None and anterior is not pool:
+        anterior.fechar()
+
+
+def fechar_pools() -> None:
+    """Fecha todos os pools (útil para testes e encerramento)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.fechar()
+        _pools.clear()
@@ -0,0 +1,378 @@
+"""
+Réplica de leitura em memória do banco SQLite.
+
+Na inicialização o banco em disco é copiado (API de backup) para um banco
+`:memory:` com cache compartilhado. Leituras são servidas pela réplica;
+escritas vão para o arquivo e, após o commit, são reaplicadas na réplica na
+mesma ordem. Os triggers (índice de busca, pessoas, etc.) rodam nos dois
+bancos, então a réplica acompanha o arquivo sem cópias adicionais.
+
+Cada comando de leitura na réplica é executado e tem as linhas lidas sob uma
+trava compartilhada; a reaplicação de uma transação segura a mesma trava em
+modo exclusivo. Um comando enxerga a réplica antes ou depois de uma transação
+inteira, nunca no meio (nem linhas de uma reaplicação desfeita). Comandos
+distintos de um mesmo bloco podem ver estados diferentes, como no arquivo
+em modo autocommit.
+
+A réplica supõe que o processo é o único escritor do arquivo: alterações
+feitas por outros processos (CLI, scripts) só aparecem após `recarregar()`.
+"""
+
+import itertools
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.infrastructure.persistence.compressao import registrar_funcoes
+from src.infrastructure.persistence.pool import PoolConexoes, registrar_pool
+
+logger = logging.getLogger(__name__)
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+# Comandos servidos pela réplica enquanto a transação não escreveu nada
+_COMANDOS_LEITURA = ("SELECT", "WITH", "VALUES", "EXPLAIN")
+
+_sequencia_replicas = itertools.count(1)
+
+# (método do cursor, sql, parâmetros) de uma escrita a reaplicar na réplica
+Operacao = Tuple[str, str, Any]
+
+
+class _TravaLeituraEscrita:
+    """Trava com vários leitores ou um escritor; escritores à espera têm prioridade."""
+
+    def __init__(self):
+        self._condicao = threading.Condition()
+        self._leitores = 0
+        self._escrevendo = False
+        self._escritores_esperando = 0
+
+    @contextmanager
+    def leitura(self):
+        with self._condicao:
+            while self._escrevendo or self._escritores_esperando:
+                self._condicao.wait()
+            self._leitores += 1
+        try:
+            yield
+        finally:
+            with self._condicao:
+                self._leitores -= 1
+                if not self._leitores:
+                    self._condicao.notify_all()
+
+    @contextmanager
+    def escrita(self):
+        with self._condicao:
+            self._escritores_esperando += 1
+            while self._escrevendo or self._leitores:
+                self._condicao.wait()
+            self._escritores_esperando -= 1
+            self._escrevendo = True
+        try:
+            yield
+        finally:
+            with self._condicao:
+                self._escrevendo = False
+                self._condicao.notify_all()
+
+
+def _somente_leitura(sql: str) -> bool:
+    """Classifica o comando pela primeira palavra."""
+    partes = sql.lstrip().split(None, 1)
+    return bool(partes) and partes[0].upper() in _COMANDOS_LEITURA
+
+
+class _CursorReplicado:
+    """
+    Cursor que encaminha cada comando para a conexão adequada.
+
+    Usa um cursor sqlite3 por lado (réplica/arquivo), criado no primeiro
+    comando e reutilizado: lastrowid sobrevive a um executemany seguinte,
+    como num cursor comum. Leituras na réplica são lidas por inteiro sob a
+    trava de leitura do pool e servidas da memória.
+    """
+
+    def __init__(self, conexao: "ConexaoReplicada"):
+        self._conexao = conexao
+        self._cursores: Dict[str, Tuple[sqlite3.Connection, sqlite3.Cursor]] = {}
+        self._cursor: Optional[sqlite3.Cursor] = None
+        self._linhas: Optional[Iterator] = None
+
+    def _cursor_de(self, lado: str, conn: sqlite3.Connection) -> sqlite3.Cursor:
+        atual = self._cursores.get(lado)
+        if atual is None or atual[0] is not conn:
+            atual = self._cursores[lado] = (conn, conn.cursor())
+        return atual[1]
+
+    def _executar(self, metodo: str, sql: str, parametros: Any) -> "_CursorReplicado":
+        lado, conn, parametros = self._conexao._destino(metodo, sql, parametros)
+        self._cursor = self._cursor_de(lado, conn)
+        self._linhas = None
+        if lado == "replica":
+            with self._conexao._pool._replicacao.leitura():
+                getattr(self._cursor, metodo)(sql, parametros)
+                self._linhas = iter(self._cursor.fetchall())
+        else:
+            getattr(self._cursor, metodo)(sql, parametros)
+        return self
+
+    def execute(self, sql: str, parametros: Any = ()) -> "_CursorReplicado":
+        return self._executar("execute", sql, parametros)
+
+    def executemany(self, sql: str, parametros: Any) -> "_CursorReplicado":
+        return self._executar("executemany", sql, parametros)
+
+    def fetchone(self):
+        if self._linhas is not None:
+            return next(self._linhas, None)
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size: int = 1):
+        if self._linhas is not None:
+            return list(itertools.islice(self._linhas, size))
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self):
+        if self._linhas is not None:
+            return list(self._linhas)
+        return self._cursor.fetchall()
+
+    def __iter__(self):
+        if self._linhas is not None:
+            return self._linhas
+        return iter(self._cursor)
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        for _conn, cursor in self._cursores.values():
+            cursor.close()
+        self._cursores.clear()
+
+
+class ConexaoReplicada:
+    """
+    Conexão vista pelos repositórios no modo réplica (uma por thread).
+
+    Enquanto a transação só lê, os comandos vão para a réplica. A partir da
+    primeira escrita a transação passa para o arquivo (leituras seguintes
+    enxergam as próprias escritas) e segura a trava de escrita do pool até o
+    commit, para que a réplica receba as transações na ordem do arquivo.
+    """
+
+    def __init__(
+        self,
+        replica: sqlite3.Connection,
+        obter_arquivo: Callable[[], sqlite3.Connection],
+        pool: "PoolReplica",
+    ):
+        self._replica = replica
+        self._obter_arquivo = obter_arquivo
+        self._pool = pool
+        self._arquivo: Optional[sqlite3.Connection] = None
+        self._operacoes: List[Operacao] = []
+
+    @property
+    def escrevendo(self) -> bool:
+        """Indica se a transação atual já escreveu no arquivo."""
+        return self._arquivo is not None
+
+    def cursor(self) -> _CursorReplicado:
+        return _CursorReplicado(self)
+
+    def execute(self, sql: str, parametros: Any = ()) -> _CursorReplicado:
+        return self.cursor().execute(sql, parametros)
+
+    def executemany(self, sql: str, parametros: Any) -> _CursorReplicado:
+        return self.cursor().executemany(sql, parametros)
+
+    def _destino(
+        self, metodo: str, sql: str, parametros: Any
+    ) -> Tuple[str, sqlite3.Connection, Any]:
+        """Conexão que executa o comando: (lado, conexão, parâmetros)."""
+        if not self.escrevendo and _somente_leitura(sql):
+            return "replica", self._replica, parametros
+
+        if not self.escrevendo:
+            self._pool._escrita.acquire()
+            self._arquivo = self._obter_arquivo()
+        if metodo == "executemany":
+            # Geradores seriam consumidos pela primeira execução
+            parametros = list(parametros)
+        if not _somente_leitura(sql):
+            self._operacoes.append((metodo, sql, parametros))
+        return "arquivo", self._arquivo, parametros
+
+    def commit(self) -> None:
+        if not self.escrevendo:
+            self._replica.commit()
+            return
+        try:
+            self._arquivo.commit()
+        except Exception:
+            self.rollback()
+            raise
+        try:
+            self._pool._replicar(self._replica, self._operacoes)
+        finally:
+            self._encerrar()
+
+    def rollback(self) -> None:
+        try:
+            if self.escrevendo:
+                self._arquivo.rollback()
+            self._replica.rollback()
+        finally:
+            self._encerrar()
+
+    def _encerrar(self) -> None:
+        if self.escrevendo:
+            self._arquivo = None
+            self._operacoes = []
+            self._pool._escrita.release()
+
+
+class PoolReplica(PoolConexoes):
+    """
+    Pool cujas conexões leem de uma réplica em memória do banco.
+
+    Mantém uma conexão âncora (o banco em memória existe enquanto houver
+    conexão aberta) e um pool comum para o arquivo, usado nas escritas.
+    """
+
+    def __init__(self, db_path: str, **kwargs):
+        super().__init__(db_path, **kwargs)
+        self._arquivo = PoolConexoes(db_path, **kwargs)
+        self._escrita = threading.RLock()
+        # Leituras na réplica (compartilhada) x reaplicação (exclusiva)
+        self._replicacao = _TravaLeituraEscrita()
+        self._geracao = 0
+        self._uri = ""
+        self._ancora: Optional[sqlite3.Connection] = None
+        self.transacoes_replicadas = 0
+        self.recarregar()
+
+    def _abrir(self) -> sqlite3.Connection:
+        """Abre uma conexão com a réplica."""
+        conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Leitores não disputam travas de tabela do cache compartilhado; a
+        # trava de replicação impede que leiam uma transação pela metade
+        conn.execute("PRAGMA read_uncommitted=1")
+        registrar_funcoes(conn)
+        return conn
+
+    def recarregar(self) -> None:
+        """
+        Copia o arquivo para uma nova réplica e passa a usá-la.
+
+        As conexões da réplica anterior são substituídas em cada thread na
+        próxima requisição.
+        """
+        with self._escrita:
+            self._geracao += 1
+            uri = f"file:replica_{next(_sequencia_replicas)}?mode=memory&cache=shared"
+            ancora = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            origem = sqlite3.connect(self.db_path)
+            try:
+                origem.backup(ancora)
+            finally:
+                origem.close()
+            anterior, self._ancora, self._uri = self._ancora, ancora, uri
+            if anterior is not None:
+                anterior.close()
+        logger.info(f"✅ Réplica em memória carregada ({self.db_path})")
+        if _telemetry:
+            _telemetry.increment("sqlite_replica.carga")
+
+    def obter(self) -> sqlite3.Connection:
+        """Conexão da réplica atual para a thread (reabre após recarregar)."""
+        if getattr(self._local, "geracao", self._geracao) != self._geracao:
+            antiga = self._local.conn
+            with self._lock:
+                self._conexoes.remove(antiga)
+            antiga.close()
+            self._local.conn = None
+            self._local.replicada = None
+        conn = super().obter()
+        self._local.geracao = self._geracao
+        return conn
+
+    def _conexao_transacao(self) -> ConexaoReplicada:
+        """Conexão replicada da thread (ver PoolConexoes.conexao)."""
+        replica = self.obter()
+        replicada = getattr(self._local, "replicada", None)
+        if replicada is None:
+            replicada = ConexaoReplicada(replica, self._arquivo.obter, self)
+            self._local.replicada = replicada
+        return replicada
+
+    def _replicar(self, replica: sqlite3.Connection, operacoes: List[Operacao]) -> None:
+        """Reaplica na réplica uma transação já gravada no arquivo (sem leitores)."""
+        try:
+            with self._replicacao.escrita():
+                try:
+                    for metodo, sql, parametros in operacoes:
+                        getattr(replica, metodo)(sql, parametros).fetchall()
+                    replica.commit()
+                except sqlite3.Error:
+                    replica.rollback()
+                    raise
+        except sqlite3.Error as e:
+            logger.error(f"❌ Falha ao replicar transação ({e}); recarregando réplica")
+            if _telemetry:
+                _telemetry.increment("sqlite_replica.divergencia")
+            self.recarregar()
+            return
+        self.transacoes_replicadas += 1
+        if _telemetry:
+            _telemetry.increment("sqlite_replica.transacao")
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores do pool, incluindo os da réplica."""
+        return {
+            **super().estatisticas(),
+            "geracao": self._geracao,
+            "transacoes_replicadas": self.transacoes_replicadas,
+        }
+
+    def fechar(self) -> None:
+        """Fecha réplica, âncora e conexões com o arquivo."""
+        super().fechar()
+        self._arquivo.fechar()
+        if self._ancora is not None:
+            self._ancora.close()
+            self._ancora = None
+
+
+def ativar_replica(db_path: str) -> PoolReplica:
+    """
+    Carrega a réplica em memória e a registra como pool do arquivo.
+
+    Deve ser chamada antes de criar os repositórios.
+    """
+    pool = PoolReplica(db_path)
+    registrar_pool(db_path, pool)
+    return pool
@@ -0,0 +1,112 @@
+# src/infrastructure/persistence/sqlite_analise_repository.py
+"""
+Implementação SQLite do repositório de análises (cache persistente) com telemetria.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from src.domain.interfaces.repositorio_analise import RepositorioAnalise
+from src.domain.value_objects.analise_texto import AnaliseTexto
+from src.infrastructure.config.settings import settings
+from src.infrastructure.persistence.consultas import ConsultaPlanejada
+from src.infrastructure.persistence.models import AnaliseModel
+from src.infrastructure.persistence.pool import obter_pool
+
+logger = logging.getLogger(__name__)
+
+# Telemetria opcional
+_telemetry = None
+
+
+def configure_telemetry(telemetry_instance=None):
+    """Configura telemetria para este módulo (usado apenas em testes)."""
+    global _telemetry
+    _telemetry = telemetry_instance
+
+
+class SQLiteAnaliseRepository(RepositorioAnalise):
+    """
+    Repositório SQLite para análises de texto.
+
+    A invalidação quando documentos e traduções mudam é feita por triggers
+    (ver AnaliseModel.criar_tabela), na mesma transação da escrita.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or str(settings.DB_PATH)
+        self._pool = obter_pool(self.db_path)
+
+    @contextmanager
+    def _conexao(self):
+        """Gerenciador de contexto para conexões (reutilizadas pelo pool)."""
+        try:
+            with self._pool.conexao() as conn:
+                yield conn
+        except Exception:
+            if _telemetry:
+                _telemetry.increment("sqlite_analise.erro_conexao")
+            raise
+
+    _SQL_BUSCAR = (
+        "SELECT resultado FROM analises "
+        "WHERE documento_id = ? AND idioma = ? AND hash_texto = ? AND modelo = ?"
+    )
+
+    def buscar(
+        self, documento_id: int, idioma: str, hash_texto: str, modelo: str
+    ) -> Optional[AnaliseTexto]:
+        """Análise gravada para o texto e o modelo informados."""
+        with self._conexao() as conn:
+            row = conn.execute(
+                self._SQL_BUSCAR, (documento_id, idioma, hash_texto, modelo)
+            ).fetchone()
+
+        if _telemetry:
+            _telemetry.increment("sqlite_analise.hit" if row else "sqlite_analise.miss")
+        return AnaliseModel.para_entidade(row[0]) if row else None
+
+    def salvar(self, analise: AnaliseTexto, hash_texto: str, modelo: str) -> None:
+        """Grava a análise, descartando a anterior do mesmo documento e idioma."""
+        model = AnaliseModel.de_entidade(analise, hash_texto, modelo)
+        with self._conexao() as conn:
+            conn.execute(
+                "DELETE FROM analises WHERE documento_id = ? AND idioma = ?",
+                (model.documento_id, model.idioma),
+            )
+            conn.execute(
+                "INSERT INTO analises "
+                "(documento_id, idioma, hash_texto, modelo, resultado, criado_em) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    model.documento_id,
+                    model.idioma,
+                    model.hash_texto,
+                    model.modelo,
+                    model.resultado,
+                    model.criado_em,
+                ),
+            )
+
+        if _telemetry:
+            _telemetry.increment("sqlite_analise.salva")
+
+    def remover_por_documento(self, documento_id: int) -> int:
+        """Remove as análises de um documento (todos os idiomas)."""
+        with self._conexao() as conn:
+            cursor = conn.execute("DELETE FROM analises WHERE documento_id = ?", (documento_id,))
+            removidas = cursor.rowcount
+
+        if _telemetry:
+            _telemetry.increment("sqlite_analise.removidas", value=removidas)
+        return removidas
+
+    @classmethod
+    def consultas_planejadas(cls) -> Dict[str, ConsultaPlanejada]:
+        """Consultas de leitura do repositório com parâmetros de exemplo."""
+        return {
+            "analises.buscar": ConsultaPlanejada(
+                cls._SQL_BUSCAR, (1, "ru", "0" * 64, "ru_core_news_sm-3.8.0")
+            ),
+        }
@@ -3,14 +3,27 @@
 Implementação concreta do repositório usando SQLite.
 """
 
+import logging
 import sqlite3
 from contextlib import contextmanager
-from typing import List, Optional
+from datetime import datetime
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from src.domain.entities.documento import Documento
 from src.domain.interfaces.repositories import RepositorioDocumento
+from src.domain.value_objects.agregados_acervo import AgregadosAcervo
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
+from src.domain.value_objects.resultado_busca import ResultadoBusca
+from src.domain.value_objects.resultado_upsert import ResultadoUpsert
+from src.domain.value_objects.resumo_documento import ResumoDocumento
 from src.infrastructure.config.settings import settings
-from src.infrastructure.persistence.models import DocumentoModel
+from src.infrastructure.persistence.compressao import compressao_ativa, descomprimir
+from src.infrastructure.persistence.consultas import ConsultaPlanejada
+from src.infrastructure.persistence.models import AlteracaoModel, DocumentoModel, PessoaModel
+from src.infrastructure.persistence.pool import obter_pool
+
+logger = logging.getLogger(__name__)
 
 
 class SQLiteDocumentoRepository(RepositorioDocumento):
@@ -21,49 +34,197 @@ class SQLiteDocumentoRepository(RepositorioDocumento):
 
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or str(settings.DB_PATH)
+        self._pool = obter_pool(self.db_path)
+        self._comprimido: Optional[bool] = None
 
     @contextmanager
     def _conexao(self):
-        """Gerenciador de contexto para conexões SQLite."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Retorna dicionários
-        try:
+        """Gerenciador de contexto para conexões SQLite (reutilizadas pelo pool)."""
+        with self._pool.conexao() as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
-    # CORREÇÃO: substituir row.get() por verificação com 'in'
+    def _texto_comprimido(self) -> bool:
+        """Modo de armazenamento do banco (consultado na primeira escrita)."""
+        if self._comprimido is None:
+            with self._conexao() as conn:
+                self._comprimido = compressao_ativa(conn)
+        return self._comprimido
+
+    # Colunas gravadas por salvar/salvar_em_lote (na ordem dos parâmetros)
+    _COLUNAS_ESCRITA = (
+        "centro",
+        "titulo",
+        "data_original",
+        "url",
+        "texto",
+        "data_coleta",
+        "tipo_documento",
+        "tipo_descricao",
+        "pessoa_principal",
+        "remetente",
+        "destinatario",
+        "envolvidos",
+        "tem_anexos",
+        "num_caracteres",
+        "num_palavras",
+        "num_paragrafos",
+        "hash_conteudo",
+        "updated_at",
+    )
+
+    _SQL_INSERT = (
+        f"INSERT INTO documentos ({', '.join(_COLUNAS_ESCRITA)}) "
+        f"VALUES ({', '.join('?' for _ in _COLUNAS_ESCRITA)})"
+    )
+
+    _SQL_UPDATE = (
+        f"UPDATE documentos SET {', '.join(f'{c} = ?' for c in _COLUNAS_ESCRITA)} WHERE id = ?"
+    )
+
+    # Texto e valores derivados dele: gravados sempre juntos
+    _COLUNAS_CONTEUDO = (
+        "texto",
+        "num_caracteres",
+        "num_palavras",
+        "num_paragrafos",
+        "hash_conteudo",
+    )
+
+    # Atualização de documentos com texto não carregado: preserva o texto gravado
+    _COLUNAS_METADADOS = tuple(
+        sorted(set(_COLUNAS_ESCRITA) - set(_COLUNAS_CONTEUDO), key=_COLUNAS_ESCRITA.index)
+    )
+    _SQL_UPDATE_METADADOS = (
+        f"UPDATE documentos SET {', '.join(f'{c} = ?' for c in _COLUNAS_METADADOS)} WHERE id = ?"
+    )
+
+    # Colunas lidas pelo mapeador posicional: id seguido das colunas de escrita.
+    # O schema é garantido pelas migrações versionadas (ver migrations.py).
+    _COLUNAS_LEITURA = ("id", *_COLUNAS_ESCRITA)
+    _SELECAO_COMPLETA = ", ".join(_COLUNAS_LEITURA)
+
+    # Colunas sempre carregadas por iterar()
+    _COLUNAS_BASE = ("id", "centro", "titulo", "url", "data_coleta")
+
+    # Valor usado no lugar de colunas não carregadas (ver _selecao)
+    _PADROES_COLUNAS = {"texto": "''", "tem_anexos": "0"}
+
+    # Campo da entidade de cada coluna de metadados (quando o nome difere)
+    _CAMPOS_COLUNAS = {"tipo_documento": "tipo"}
+
+    @classmethod
+    def _selecao(cls, colunas: Optional[Sequence[str]] = None) -> str:
+        """
+        Lista de seleção na ordem de _COLUNAS_LEITURA.
+
+        Colunas fora de `colunas` (além das sempre carregadas) viram literais
+        padrão, mantendo as posições esperadas por _row_para_entidade.
+        """
+        if colunas is None:
+            return cls._SELECAO_COMPLETA
+        carregadas = {*cls._COLUNAS_BASE, *colunas}
+        return ", ".join(
+            c if c in carregadas else cls._PADROES_COLUNAS.get(c, "NULL")
+            for c in cls._COLUNAS_LEITURA
+        )
 
-    def _row_para_entidade(self, row: sqlite3.Row) -> Documento:
-        """Converte linha do banco para entidade Documento.
+    @classmethod
+    def _metadados_omitidos(cls, colunas: Optional[Sequence[str]]) -> Tuple[str, ...]:
+        """Campos da entidade cujas colunas _selecao(colunas) substitui por padrões."""
+        if colunas is None:
+            return ()
+        carregadas = {*cls._COLUNAS_BASE, *colunas, "updated_at"}
+        return tuple(
+            cls._CAMPOS_COLUNAS.get(c, c) for c in cls._COLUNAS_METADADOS if c not in carregadas
+        )
 
-        NOTA: sqlite3.Row não tem método .get()
-        Usamos 'if coluna in row.keys()' para verificar existência.
+    @staticmethod
+    def _recusar_parciais(documentos: Iterable[Documento]) -> None:
+        """Impede que metadados não carregados sejam gravados com valores padrão."""
+        for documento in documentos:
+            if documento.parcial:
+                raise ValueError(
+                    f"Documento {documento.id} carregado sem "
+                    f"{', '.join(documento.campos_omitidos)}: busque-o completo para salvar"
+                )
+
+    @classmethod
+    def _selecao_sem_texto(cls) -> str:
+        """Seleção completa com texto vazio (as contagens são carregadas)."""
+        return cls._selecao([c for c in cls._COLUNAS_ESCRITA if c != "texto"])
+
+    def _row_para_entidade_adiada(self, row: Sequence) -> Documento:
+        """Converte linha de _selecao_sem_texto; o texto é buscado no primeiro acesso."""
+        documento = self._row_para_entidade(row)
+        return documento.adiar_texto(partial(self.obter_texto, row[0]))
+
+    @staticmethod
+    def _row_para_entidade(row: Sequence) -> Documento:
         """
-        # Verificar quais colunas existem
-        colunas = row.keys()
+        Converte linha do banco (na ordem de _COLUNAS_LEITURA) para Documento.
 
-        modelo = DocumentoModel(
-            id=row["id"],
-            centro=row["centro"],
-            titulo=row["titulo"],
-            data_original=row["data_original"] if "data_original" in colunas else None,
-            url=row["url"],
-            texto=row["texto"],
-            data_coleta=row["data_coleta"],
-            tipo_documento=row["tipo_documento"] if "tipo_documento" in colunas else None,
-            tipo_descricao=row["tipo_descricao"] if "tipo_descricao" in colunas else None,
-            pessoa_principal=row["pessoa_principal"] if "pessoa_principal" in colunas else None,
-            remetente=row["remetente"] if "remetente" in colunas else None,
-            destinatario=row["destinatario"] if "destinatario" in colunas else None,
-            envolvidos=row["envolvidos"] if "envolvidos" in colunas else None,
-            tem_anexos=row["tem_anexos"] if "tem_anexos" in colunas else 0,
+        Caminho de carga em massa: monta a entidade direto da linha, sem
+        DocumentoModel intermediário e sem revalidar (Documento.reconstituir),
+        pois as linhas foram gravadas a partir de entidades válidas. As
+        conversões são as mesmas de DocumentoModel.para_entidade.
+        """
+        texto, envolvidos = row[5], row[12]
+        campos = {
+            "id": row[0],
+            "centro": row[1],
+            "titulo": row[2],
+            "data_original": row[3],
+            "url": row[4],
+            "texto": texto if type(texto) is str else descomprimir(texto) or "",
+            "data_coleta": datetime.fromisoformat(row[6]),
+            "tipo": row[7],
+            "tipo_descricao": row[8],
+            "pessoa_principal": row[9],
+            "remetente": row[10],
+            "destinatario": row[11],
+            "envolvidos": [e.strip() for e in envolvidos.split(",")] if envolvidos else [],
+            "tem_anexos": bool(row[13]),
+        }
+        tamanhos = row[14:17]
+        if None not in tamanhos:
+            campos["_tamanhos"] = tuple(tamanhos)
+        return Documento.reconstituir(campos)
+
+    @staticmethod
+    def _parametros(modelo: DocumentoModel) -> tuple:
+        """Valores do modelo na ordem de _COLUNAS_ESCRITA."""
+        return (
+            modelo.centro,
+            modelo.titulo,
+            modelo.data_original,
+            modelo.url,
+            modelo.texto,
+            modelo.data_coleta,
+            modelo.tipo_documento,
+            modelo.tipo_descricao,
+            modelo.pessoa_principal,
+            modelo.remetente,
+            modelo.destinatario,
+            modelo.envolvidos,
+            modelo.tem_anexos,
+            modelo.num_caracteres,
+            modelo.num_palavras,
+            modelo.num_paragrafos,
+            modelo.hash_conteudo,
+            modelo.updated_at,
         )
-        return modelo.para_entidade()
+
+    def _comando_update(self, modelo: DocumentoModel) -> Tuple[str, tuple]:
+        """UPDATE do modelo; sem texto carregado, só os metadados são gravados."""
+        parametros = self._parametros(modelo)
+        if modelo.texto is None:
+            metadados = (
+                valor
+                for coluna, valor in zip(self._COLUNAS_ESCRITA, parametros)
+                if coluna not in self._COLUNAS_CONTEUDO
+            )
+            return self._SQL_UPDATE_METADADOS, (*metadados, modelo.id)
+        return self._SQL_UPDATE, (*parametros, modelo.id)
 
     def salvar(self, documento: Documento) -> int:
         """
@@ -75,86 +236,290 @@ class SQLiteDocumentoRepository(RepositorioDocumento):
         Returns:
             int: ID do documento salvo
         """
-        modelo = DocumentoModel.de_entidade(documento)
+        self._recusar_parciais([documento])
+        modelo = DocumentoModel.de_entidade(documento, comprimido=self._texto_comprimido())
 
         with self._conexao() as conn:
             cursor = conn.cursor()
 
             if documento.id:  # Update
-                cursor.execute(
-                    """
-                    UPDATE documentos SET
-                        centro = ?,
-                        titulo = ?,
-                        data_original = ?,
-                        url = ?,
-                        texto = ?,
-                        data_coleta = ?,
-                        tipo_documento = ?,
-                        tipo_descricao = ?,
-                        pessoa_principal = ?,
-                        remetente = ?,
-                        destinatario = ?,
-                        envolvidos = ?,
-                        tem_anexos = ?
-                    WHERE id = ?
-                """,
-                    (
-                        modelo.centro,
-                        modelo.titulo,
-                        modelo.data_original,
-                        modelo.url,
-                        modelo.texto,
-                        modelo.data_coleta,
-                        modelo.tipo_documento,
-                        modelo.tipo_descricao,
-                        modelo.pessoa_principal,
-                        modelo.remetente,
-                        modelo.destinatario,
-                        modelo.envolvidos,
-                        modelo.tem_anexos,
-                        modelo.id,
-                    ),
-                )
-                return documento.id
+                cursor.execute(*self._comando_update(modelo))
+                doc_id, operacao = documento.id, AlteracaoModel.ATUALIZACAO
             else:  # Insert
-                cursor.execute(
-                    """
-                    INSERT INTO documentos (
-                        centro, titulo, data_original, url, texto, data_coleta,
-                        tipo_documento, tipo_descricao, pessoa_principal, remetente,
-                        destinatario, envolvidos, tem_anexos
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        modelo.centro,
-                        modelo.titulo,
-                        modelo.data_original,
-                        modelo.url,
-                        modelo.texto,
-                        modelo.data_coleta,
-                        modelo.tipo_documento,
-                        modelo.tipo_descricao,
-                        modelo.pessoa_principal,
-                        modelo.remetente,
-                        modelo.destinatario,
-                        modelo.envolvidos,
-                        modelo.tem_anexos,
-                    ),
+                cursor.execute(self._SQL_INSERT, self._parametros(modelo))
+                doc_id, operacao = cursor.lastrowid, AlteracaoModel.INSERCAO
+
+            PessoaModel.sincronizar(cursor, {doc_id: modelo.vinculos_pessoas()})
+            AlteracaoModel.registrar(cursor, "documentos", [(doc_id, operacao)], modelo.updated_at)
+            return doc_id
+
+    def salvar_em_lote(
+        self, documentos: Iterable[Documento], chunk_size: int = 500
+    ) -> List[Optional[int]]:
+        """
+        Insere/atualiza documentos em lotes, um lote por transação.
+
+        Um lote com erro é desfeito por inteiro (seus IDs retornam como None);
+        os demais lotes são gravados normalmente.
+
+        Args:
+            documentos: Entidades a gravar
+            chunk_size: Quantidade de documentos por transação
+
+        Returns:
+            List[Optional[int]]: IDs na mesma ordem da entrada
+        """
+        documentos = list(documentos)
+        self._recusar_parciais(documentos)
+        ids: List[Optional[int]] = []
+
+        for inicio in range(0, len(documentos), chunk_size):
+            lote = documentos[inicio : inicio + chunk_size]
+            try:
+                ids.extend(self._salvar_lote(lote))
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"⚠️ Lote {inicio}-{inicio + len(lote) - 1} desfeito ao salvar documentos: {e}"
                 )
-                return cursor.lastrowid
+                ids.extend([None] * len(lote))
+
+        return ids
+
+    def _salvar_lote(self, lote: List[Documento]) -> List[int]:
+        """Grava um lote em uma única transação (executemany)."""
+        comprimido = self._texto_comprimido()
+        modelos = [DocumentoModel.de_entidade(doc, comprimido=comprimido) for doc in lote]
+        atualizacoes: Dict[str, List[tuple]] = {}
+        for modelo in modelos:
+            if modelo.id:
+                sql, parametros = self._comando_update(modelo)
+                atualizacoes.setdefault(sql, []).append(parametros)
+        insercoes = [self._parametros(m) for m in modelos if not m.id]
 
-    def buscar_por_id(self, id: int) -> Optional[Documento]:
-        """Busca documento pelo ID."""
         with self._conexao() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM documentos WHERE id = ?", (id,))
-            row = cursor.fetchone()
+            for sql, parametros in atualizacoes.items():
+                cursor.executemany(sql, parametros)
+
+            novos_ids: List[int] = []
+            if insercoes:
+                cursor.executemany(self._SQL_INSERT, insercoes)
+                # Dentro da transação (lock de escrita) os IDs AUTOINCREMENT são contíguos
+                ultimo = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                novos_ids = list(range(ultimo - len(insercoes) + 1, ultimo + 1))
+
+            proximo = iter(novos_ids)
+            ids = [m.id if m.id else next(proximo) for m in modelos]
+            PessoaModel.sincronizar(
+                cursor, {doc_id: m.vinculos_pessoas() for doc_id, m in zip(ids, modelos)}
+            )
+            AlteracaoModel.registrar(
+                cursor,
+                "documentos",
+                [
+                    (doc_id, AlteracaoModel.ATUALIZACAO if m.id else AlteracaoModel.INSERCAO)
+                    for doc_id, m in zip(ids, modelos)
+                ],
+            )
 
-            if not row:
-                return None
+        return ids
 
+    # Upsert por URL: linhas existentes só são reescritas se o conteúdo mudou
+    _SQL_UPSERT = (
+        f"{_SQL_INSERT} ON CONFLICT(url) DO UPDATE SET "
+        f"{', '.join(f'{c} = excluded.{c}' for c in _COLUNAS_ESCRITA if c != 'url')} "
+        "WHERE documentos.hash_conteudo IS NOT excluded.hash_conteudo"
+    )
+
+    def upsert_por_url(
+        self, documentos: Iterable[Documento], chunk_size: int = 500
+    ) -> ResultadoUpsert:
+        """
+        Grava documentos recoletados usando a URL como chave, um lote por transação.
+
+        URLs novas são inseridas; as existentes só são reescritas quando o
+        hash do conteúdo (centro, título, data e texto) mudou. Páginas
+        inalteradas não tocam a linha, os triggers nem os índices de busca.
+        Documentos reescritos recebem todos os campos da entidade informada
+        (numa recoleta, sem classificação: ficam prontos para reclassificar).
+
+        Um lote com erro é desfeito por inteiro (seus IDs retornam como None).
+
+        Args:
+            documentos: Entidades com o texto carregado
+            chunk_size: Quantidade de documentos por transação
+
+        Returns:
+            ResultadoUpsert com os IDs na ordem da entrada e as contagens
+        """
+        documentos = list(documentos)
+        self._recusar_parciais(documentos)
+        if not all(doc.texto_carregado for doc in documentos):
+            raise ValueError("upsert_por_url exige documentos com o texto carregado")
+
+        comprimido = self._texto_comprimido()
+        ids: List[Optional[int]] = []
+        contagens = {"inseridos": 0, "atualizados": 0, "inalterados": 0}
+
+        for inicio in range(0, len(documentos), chunk_size):
+            lote = documentos[inicio : inicio + chunk_size]
+            modelos = [DocumentoModel.de_entidade(doc, comprimido=comprimido) for doc in lote]
+            try:
+                ids_lote, contagens_lote = self._upsert_lote(modelos)
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"⚠️ Lote {inicio}-{inicio + len(lote) - 1} desfeito no upsert por URL: {e}"
+                )
+                ids.extend([None] * len(lote))
+                continue
+            ids.extend(ids_lote)
+            for chave, total in contagens_lote.items():
+                contagens[chave] += total
+
+        return ResultadoUpsert(ids=ids, **contagens)
+
+    def _upsert_lote(self, modelos: List[DocumentoModel]) -> Tuple[List[int], Dict[str, int]]:
+        """Upsert de um lote em uma única transação (ver upsert_por_url)."""
+        urls = [m.url for m in modelos]
+
+        with self._conexao() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._sql_por_urls("url, hash_conteudo", len(urls)), urls)
+            hashes = dict(cursor.fetchall())
+
+            gravar = [m for m in modelos if hashes.get(m.url) != m.hash_conteudo]
+            if gravar:
+                cursor.executemany(self._SQL_UPSERT, [self._parametros(m) for m in gravar])
+
+            cursor.execute(self._sql_por_urls("url, id", len(urls)), urls)
+            ids_por_url = dict(cursor.fetchall())
+            PessoaModel.sincronizar(
+                cursor, {ids_por_url[m.url]: m.vinculos_pessoas() for m in gravar}
+            )
+            AlteracaoModel.registrar(
+                cursor,
+                "documentos",
+                [
+                    (
+                        ids_por_url[m.url],
+                        AlteracaoModel.ATUALIZACAO if m.url in hashes else AlteracaoModel.INSERCAO,
+                    )
+                    for m in gravar
+                ],
+            )
+
+        inseridos = sum(1 for m in gravar if m.url not in hashes)
+        contagens = {
+            "inseridos": inseridos,
+            "atualizados": len(gravar) - inseridos,
+            "inalterados": len(modelos) - len(gravar),
+        }
+        return [ids_por_url[url] for url in urls], contagens
+
+    @staticmethod
+    def _sql_por_urls(colunas: str, quantidade: int) -> str:
+        """Consulta de `colunas` dos documentos com uma das `quantidade` URLs."""
+        marcadores = ", ".join("?" for _ in range(quantidade))
+        return f"SELECT {colunas} FROM documentos WHERE url IN ({marcadores})"
+
+    _SQL_BUSCAR_POR_ID = "SELECT {selecao} FROM documentos WHERE id = ?"
+
+    def buscar_por_id(self, id: int, carregar_texto: bool = True) -> Optional[Documento]:
+        """
+        Busca documento pelo ID.
+
+        Com carregar_texto=False o texto só é lido no primeiro acesso a
+        `documento.texto`; as propriedades tamanho_* vêm do banco.
+        """
+        selecao = self._SELECAO_COMPLETA if carregar_texto else self._selecao_sem_texto()
+        with self._conexao() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_BUSCAR_POR_ID.format(selecao=selecao), (id,))
+            row = cursor.fetchone()
+
+        if not row:
+            return None
+        if carregar_texto:
             return self._row_para_entidade(row)
+        return self._row_para_entidade_adiada(row)
+
+    def obter_texto(self, documento_id: int) -> Optional[str]:
+        """Retorna apenas o texto do documento (None se não existir)."""
+        with self._conexao() as conn:
+            row = conn.execute(
+                "SELECT texto FROM documentos WHERE id = ?", (documento_id,)
+            ).fetchone()
+        return descomprimir(row[0]) if row else None
+
+    @staticmethod
+    def _filtros(centro: Optional[str], tipo: Optional[str], prefixo: str = "") -> Tuple[str, List]:
+        """Condições de centro/tipo (a anexar a um WHERE) e seus parâmetros."""
+        filtro = ""
+        params: List = []
+        if centro:
+            filtro += f" AND {prefixo}centro = ?"
+            params.append(centro)
+        if tipo:
+            filtro += f" AND {prefixo}tipo_documento = ?"
+            params.append(tipo)
+        return filtro, params
+
+    @classmethod
+    def _sql_pagina(
+        cls,
+        selecao: str,
+        offset: int,
+        limite: int,
+        centro: Optional[str],
+        tipo: Optional[str],
+        after_id: Optional[int],
+        before_id: Optional[int],
+    ) -> Tuple[str, List]:
+        """
+        Consulta de listagem com filtros e paginação.
+
+        Com after_id/before_id usa paginação por chave (keyset): o custo não
+        depende da profundidade da página e o offset é ignorado.
+        """
+        filtro, params = cls._filtros(centro, tipo)
+        query = f"SELECT {selecao} FROM documentos WHERE 1=1{filtro}"
+
+        if before_id is not None:
+            # Busca para trás e inverte, mantendo a ordem crescente de id
+            query += " AND id < ? ORDER BY id DESC LIMIT ?"
+            params.extend([before_id, limite])
+        elif after_id is not None:
+            query += " AND id > ? ORDER BY id LIMIT ?"
+            params.extend([after_id, limite])
+        else:
+            query += " ORDER BY id LIMIT ? OFFSET ?"
+            params.extend([limite, offset])
+
+        return query, params
+
+    def _consultar_pagina(
+        self,
+        selecao: str,
+        offset: int,
+        limite: int,
+        centro: Optional[str],
+        tipo: Optional[str],
+        after_id: Optional[int],
+        before_id: Optional[int],
+    ) -> List[sqlite3.Row]:
+        """
+        Executa a consulta de listagem com filtros e paginação (ver _sql_pagina).
+        """
+        with self._conexao() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                *self._sql_pagina(selecao, offset, limite, centro, tipo, after_id, before_id)
+            )
+            rows = cursor.fetchall()
+            if before_id is not None:
+                rows.reverse()
+
+            return rows
 
     def listar(
         self,
@@ -162,55 +527,385 @@ class SQLiteDocumentoRepository(RepositorioDocumento):
         limite: int = 20,
         centro: Optional[str] = None,
         tipo: Optional[str] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        carregar_texto: bool = True,
     ) -> List[Documento]:
-        """Lista documentos com filtros."""
+        """
+        Lista documentos com filtros (ver _consultar_pagina).
+
+        Com carregar_texto=False os textos são buscados sob demanda.
+        """
+        if carregar_texto:
+            rows = self._consultar_pagina(
+                self._SELECAO_COMPLETA, offset, limite, centro, tipo, after_id, before_id
+            )
+            return [self._row_para_entidade(row) for row in rows]
+
+        rows = self._consultar_pagina(
+            self._selecao_sem_texto(), offset, limite, centro, tipo, after_id, before_id
+        )
+        return [self._row_para_entidade_adiada(row) for row in rows]
+
+    # Projeção das listagens: nunca transfere a coluna texto
+    _SELECAO_RESUMO = (
+        "id, centro, titulo, data_original, tipo_documento, tipo_descricao, "
+        "pessoa_principal, num_caracteres AS tamanho"
+    )
+
+    def listar_resumos(
+        self,
+        offset: int = 0,
+        limite: int = 20,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[ResumoDocumento]:
+        """Lista resumos de documentos sem carregar o texto."""
+        rows = self._consultar_pagina(
+            self._SELECAO_RESUMO, offset, limite, centro, tipo, after_id, before_id
+        )
+        return [self._row_para_resumo(row) for row in rows]
+
+    @staticmethod
+    def _row_para_resumo(row: sqlite3.Row) -> ResumoDocumento:
+        """Converte linha de _SELECAO_RESUMO para ResumoDocumento."""
+        return ResumoDocumento(
+            id=row["id"],
+            centro=row["centro"],
+            titulo=row["titulo"],
+            data_original=row["data_original"],
+            tipo=row["tipo_documento"],
+            tipo_descricao=row["tipo_descricao"],
+            pessoa_principal=row["pessoa_principal"],
+            tamanho_caracteres=row["tamanho"] or 0,
+        )
+
+    def documentos_por_pessoa(
+        self, nome: str, papel: Optional[str] = None
+    ) -> List[ResumoDocumento]:
+        """
+        Documentos em que a pessoa aparece, via índice documento_pessoas.
+
+        Args:
+            nome: Nome da pessoa (como gravado, ex.: 'Л.В. Николаев')
+            papel: 'principal', 'remetente', 'destinatario' ou 'envolvido'
+                (None = qualquer papel)
+        """
+        if papel is not None and papel not in PessoaModel.PAPEIS:
+            raise ValueError(f"Papel inválido: {papel}")
+
         with self._conexao() as conn:
-            cursor = conn.cursor()
+            rows = conn.execute(*self._sql_por_pessoa(nome, papel)).fetchall()
 
-            query = "SELECT * FROM documentos WHERE 1=1"
-            params = []
+        return [self._row_para_resumo(row) for row in rows]
 
-            if centro:
-                query += " AND centro = ?"
-                params.append(centro)
+    @classmethod
+    def _sql_por_pessoa(cls, nome: str, papel: Optional[str]) -> Tuple[str, List]:
+        """Consulta de documentos_por_pessoa e seus parâmetros."""
+        subconsulta = (
+            "SELECT dp.documento_id FROM documento_pessoas dp "
+            "JOIN pessoas p ON p.id = dp.pessoa_id WHERE p.nome = ?"
+        )
+        params: List = [nome]
+        if papel is not None:
+            subconsulta += " AND dp.papel = ?"
+            params.append(papel)
+        query = (
+            f"SELECT {cls._SELECAO_RESUMO} FROM documentos "
+            f"WHERE id IN ({subconsulta}) ORDER BY id"
+        )
+        return query, params
 
-            if tipo:
-                query += " AND tipo_documento = ?"
-                params.append(tipo)
+    def iterar(
+        self,
+        batch_size: int = 500,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        colunas: Optional[Sequence[str]] = None,
+    ) -> Iterator[Documento]:
+        """
+        Percorre todos os documentos em lotes, com paginação por chave (id).
 
-            query += " ORDER BY id LIMIT ? OFFSET ?"
-            params.extend([limite, offset])
+        Cada lote é uma consulta `WHERE id > ? ORDER BY id LIMIT ?`, então o
+        custo por lote é constante e nenhuma conexão fica presa entre lotes.
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+        Args:
+            batch_size: Documentos por consulta
+            centro: Filtrar por centro
+            tipo: Filtrar por tipo de documento
+            colunas: Colunas extras a carregar (None = todas). Sem "texto", o
+                texto é buscado no primeiro acesso; metadados omitidos ficam com
+                valor padrão e o documento é marcado como parcial (não pode ser
+                salvo, ver Documento.marcar_parcial).
+        """
+        if colunas is not None:
+            desconhecidas = set(colunas) - set(self._COLUNAS_ESCRITA)
+            if desconhecidas:
+                raise ValueError(f"Colunas desconhecidas: {', '.join(sorted(desconhecidas))}")
+        selecao = self._selecao(colunas)
+        omitidos = self._metadados_omitidos(colunas)
+        if colunas is None or "texto" in colunas:
+            hidratar = self._row_para_entidade
+        else:
+            hidratar = self._row_para_entidade_adiada
+
+        query, filtros = self._sql_iterar(selecao, centro, tipo)
+
+        ultimo_id = 0
+        while True:
+            with self._conexao() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, [ultimo_id, *filtros, batch_size])
+                rows = cursor.fetchall()
+                lote = [hidratar(row) for row in rows]
+
+            if omitidos:
+                for documento in lote:
+                    documento.marcar_parcial(omitidos)
+            yield from lote
+
+            if len(rows) < batch_size:
+                return
+            ultimo_id = rows[-1][0]
+
+    @classmethod
+    def _sql_iterar(
+        cls, selecao: str, centro: Optional[str], tipo: Optional[str]
+    ) -> Tuple[str, List]:
+        """
+        Consulta de um lote de iterar e os parâmetros dos filtros.
 
-            return [self._row_para_entidade(row) for row in rows]
+        Os parâmetros completos são [último id, *filtros, tamanho do lote].
+        """
+        filtro, filtros = cls._filtros(centro, tipo)
+        return f"SELECT {selecao} FROM documentos WHERE id > ?{filtro} ORDER BY id LIMIT ?", filtros
 
     def contar(self, centro: Optional[str] = None, tipo: Optional[str] = None) -> int:
         """Conta documentos com filtros."""
         with self._conexao() as conn:
             cursor = conn.cursor()
+            cursor.execute(*self._sql_contar(centro, tipo))
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def _sql_contar(cls, centro: Optional[str], tipo: Optional[str]) -> Tuple[str, List]:
+        """Consulta de contar e seus parâmetros."""
+        filtro, params = cls._filtros(centro, tipo)
+        return f"SELECT COUNT(*) FROM documentos WHERE 1=1{filtro}", params
+
+    def contar_por_tipo(self, centro: Optional[str] = None) -> Dict[str, int]:
+        """Contagem por tipo com um único GROUP BY (mais frequentes primeiro)."""
+        with self._conexao() as conn:
+            return dict(conn.execute(*self._sql_contar_por_tipo(centro)).fetchall())
+
+    @classmethod
+    def _sql_contar_por_tipo(cls, centro: Optional[str]) -> Tuple[str, List]:
+        """Consulta de contar_por_tipo e seus parâmetros."""
+        filtro, params = cls._filtros(centro, None)
+        query = (
+            f"SELECT tipo_documento, COUNT(*) AS total FROM documentos "
+            f"WHERE tipo_documento IS NOT NULL{filtro} "
+            f"GROUP BY tipo_documento ORDER BY total DESC, tipo_documento"
+        )
+        return query, params
 
-            query = "SELECT COUNT(*) FROM documentos WHERE 1=1"
-            params = []
+    def agregados(
+        self,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        limite_pessoas: int = 15,
+    ) -> AgregadosAcervo:
+        """
+        Calcula as contagens do acervo com GROUP BY, em uma única consulta.
 
-            if centro:
-                query += " AND centro = ?"
-                params.append(centro)
+        Cada linha do resultado é (dimensão, chave, contagem, custo).
+        """
+        query, params = self._sql_agregados(centro, tipo, limite_pessoas)
 
-            if tipo:
-                query += " AND tipo_documento = ?"
-                params.append(tipo)
+        por_centro: dict = {}
+        por_tipo: dict = {}
+        pessoas = []
+        por_idioma: dict = {}
+        com_anexos = 0
+        custo = 0.0
 
-            cursor.execute(query, params)
-            return cursor.fetchone()[0]
+        with self._conexao() as conn:
+            for dimensao, chave, total, soma in conn.execute(query, params):
+                if dimensao == "centro":
+                    por_centro[chave] = total
+                elif dimensao == "tipo":
+                    por_tipo[chave] = total
+                elif dimensao == "anexos":
+                    com_anexos = total
+                elif dimensao == "pessoa":
+                    pessoas.append((chave, total))
+                else:
+                    por_idioma[chave] = total
+                    custo += soma
+
+        return AgregadosAcervo(
+            total_documentos=sum(por_centro.values()),
+            por_centro=por_centro,
+            por_tipo=dict(sorted(por_tipo.items(), key=lambda item: -item[1])),
+            pessoas_frequentes=pessoas,
+            com_anexos=com_anexos,
+            total_traducoes=sum(por_idioma.values()),
+            traducoes_por_idioma=por_idioma,
+            custo_total_traducoes=custo,
+        )
+
+    @classmethod
+    def _sql_agregados(
+        cls, centro: Optional[str], tipo: Optional[str], limite_pessoas: int
+    ) -> Tuple[str, List]:
+        """Consulta de agregados e seus parâmetros."""
+        filtro, params_filtro = cls._filtros(centro, tipo, prefixo="d.")
+
+        query = f"""
+            SELECT 'centro', d.centro, COUNT(*), NULL
+            FROM documentos d WHERE 1=1{filtro}
+            GROUP BY d.centro
+            UNION ALL
+            SELECT 'tipo', d.tipo_documento, COUNT(*), NULL
+            FROM documentos d WHERE d.tipo_documento IS NOT NULL{filtro}
+            GROUP BY d.tipo_documento
+            UNION ALL
+            SELECT 'anexos', NULL, COUNT(*), NULL
+            FROM documentos d WHERE d.tem_anexos = 1{filtro}
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'pessoa', d.pessoa_principal, COUNT(*) AS total, NULL
+                FROM documentos d WHERE d.pessoa_principal IS NOT NULL{filtro}
+                GROUP BY d.pessoa_principal
+                ORDER BY total DESC, d.pessoa_principal
+                LIMIT ?
+            )
+            UNION ALL
+            SELECT 'idioma', t.idioma, COUNT(*), COALESCE(SUM(t.custo), 0)
+            FROM traducoes t JOIN documentos d ON d.id = t.documento_id
+            WHERE 1=1{filtro}
+            GROUP BY t.idioma
+        """
+        params = params_filtro * 3 + params_filtro + [limite_pessoas] + params_filtro
+        return query, params
 
     def remover(self, id: int) -> bool:
         """Remove um documento pelo ID."""
         with self._conexao() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM documentos WHERE id = ?", (id,))
-            return cursor.rowcount > 0
+            if cursor.rowcount == 0:
+                return False
+            AlteracaoModel.registrar(cursor, "documentos", [(id, AlteracaoModel.REMOCAO)])
+            return True
+
+    def listar_alterados_desde(self, marca: int = 0, limite: int = 1000) -> LoteAlteracoes:
+        """
+        Documentos alterados depois da marca (checkpoint) informada.
+
+        Processe o lote e guarde `lote.marca`; repita até o lote vir vazio.
+
+        Args:
+            marca: Marca retornada pela chamada anterior (0 = desde o início)
+            limite: Máximo de entradas do log lidas por chamada
+        """
+        with self._conexao() as conn:
+            return AlteracaoModel.listar_desde(conn.cursor(), "documentos", marca, limite)
+
+    @staticmethod
+    def _consulta_fts(query: str) -> str:
+        """
+        Converte a consulta do usuário em expressão FTS5 segura.
+
+        Cada termo vira uma frase entre aspas (evita erros de sintaxe com
+        hífens, aspas etc.); um '*' final é preservado como busca por prefixo.
+        """
+        termos = []
+        for termo in query.split():
+            prefixo = termo.endswith("*")
+            termo = termo.rstrip("*").replace('"', '""')
+            if termo:
+                termos.append(f'"{termo}"' + ("*" if prefixo else ""))
+        return " ".join(termos)
+
+    def buscar_texto(
+        self,
+        query: str,
+        centro: Optional[str] = None,
+        tipo: Optional[str] = None,
+        limite: int = 20,
+        offset: int = 0,
+    ) -> List[ResultadoBusca]:
+        """
+        Busca textual (FTS5) em documentos e traduções, um acerto por documento.
+
+        As pontuações bm25 dos dois índices não são comparáveis (corpora e
+        pesos diferentes): cada uma é dividida pela melhor do seu índice, de
+        modo que o melhor acerto de cada índice vale -1.0. Um documento
+        encontrado no original e em traduções aparece uma vez, com o acerto
+        mais relevante (empate: o original). Ordem: relevância, depois id.
+        """
+        consulta = self._consulta_fts(query)
+        if not consulta:
+            return []
+
+        filtros, params_filtro = self._filtros(centro, tipo, prefixo="d.")
+
+        # Título pesa mais que o corpo do texto; fonte 0 = original, 1 = tradução
+        sql = f"""
+            WITH acertos AS (
+                SELECT d.id, d.centro, d.titulo, d.tipo_documento, NULL AS idioma,
+                       snippet(documentos_fts, -1, '<mark>', '</mark>', '…', 16) AS trecho,
+                       bm25(documentos_fts, 10.0, 1.0) AS pontos, 0 AS fonte
+                FROM documentos_fts
+                JOIN documentos d ON d.id = documentos_fts.rowid
+                WHERE documentos_fts MATCH ?{filtros}
+                UNION ALL
+                SELECT d.id, d.centro, d.titulo, d.tipo_documento, t.idioma,
+                       snippet(traducoes_fts, 0, '<mark>', '</mark>', '…', 16) AS trecho,
+                       bm25(traducoes_fts) AS pontos, 1 AS fonte
+                FROM traducoes_fts
+                JOIN traducoes t ON t.id = traducoes_fts.rowid
+                JOIN documentos d ON d.id = t.documento_id
+                WHERE traducoes_fts MATCH ?{filtros}
+            ),
+            normalizados AS (
+                SELECT *, -COALESCE(
+                    pontos / NULLIF(MIN(pontos) OVER (PARTITION BY fonte), 0), 1.0
+                ) AS relevancia
+                FROM acertos
+            ),
+            melhores AS (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY id ORDER BY relevancia, fonte, idioma
+                ) AS posicao
+                FROM normalizados
+            )
+            SELECT id, centro, titulo, tipo_documento, idioma, trecho, relevancia
+            FROM melhores
+            WHERE posicao = 1
+            ORDER BY relevancia, fonte, id
+            LIMIT ? OFFSET ?
+        """
+        params = [consulta, *params_filtro, consulta, *params_filtro, limite, offset]
+
+        with self._conexao() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            return [
+                ResultadoBusca(
+                    documento_id=row[0],
+                    centro=row[1],
+                    titulo=row[2],
+                    tipo=row[3],
+                    idioma=row[4],
+                    trecho=row[5],
+                    relevancia=row[6],
+                )
+                for row in cursor.fetchall()
+            ]
 
     def listar_traducoes(self, documento_id: int) -> List[dict]:
         """Lista traduções de um documento."""
@@ -231,3 +926,57 @@ class SQLiteDocumentoRepository(RepositorioDocumento):
                 {"idioma": row[0], "data_traducao": row[1], "modelo": row[2], "custo": row[3]}
                 for row in rows
             ]
+
+    @classmethod
+    def consultas_planejadas(cls) -> Dict[str, ConsultaPlanejada]:
+        """
+        Consultas de leitura do repositório, montadas pelos mesmos métodos que
+        as executam, com parâmetros de exemplo (ver migrations.verificar_planos).
+        """
+        centro, tipo, pessoa = "lencenter", "interrogatorio", "Л.В. Николаев"
+        sem_texto = cls._selecao_sem_texto()
+        consultas = {
+            "documentos.buscar_por_id": ConsultaPlanejada(
+                cls._SQL_BUSCAR_POR_ID.format(selecao=sem_texto), (1,)
+            ),
+            "documentos.hashes_por_url": ConsultaPlanejada(
+                cls._sql_por_urls("url, hash_conteudo", 2), ("http://a", "http://b")
+            ),
+        }
+
+        paginas = {
+            "listar": (None, None, None, None, True),
+            "listar_centro": (centro, None, None, None, False),
+            "listar_tipo": (None, tipo, None, None, False),
+            "listar_centro_tipo_cursor": (centro, tipo, 0, None, False),
+            "listar_tipo_anterior": (None, tipo, None, 100, False),
+        }
+        for nome, (c, t, after_id, before_id, varredura) in paginas.items():
+            sql, params = cls._sql_pagina(cls._SELECAO_RESUMO, 0, 20, c, t, after_id, before_id)
+            consultas[f"documentos.{nome}"] = ConsultaPlanejada(sql, tuple(params), varredura)
+
+        for nome, c, t, varredura in (
+            ("contar", None, None, True),
+            ("contar_centro", centro, None, False),
+            ("contar_tipo", None, tipo, False),
+        ):
+            sql, params = cls._sql_contar(c, t)
+            consultas[f"documentos.{nome}"] = ConsultaPlanejada(sql, tuple(params), varredura)
+
+        for nome, c, t in (("iterar", None, None), ("iterar_centro_tipo", centro, tipo)):
+            sql, filtros = cls._sql_iterar(sem_texto, c, t)
+            consultas[f"documentos.{nome}"] = ConsultaPlanejada(sql, (0, *filtros, 500))
+
+        for nome, c in (("contar_por_tipo", None), ("contar_por_tipo_centro", centro)):
+            sql, params = cls._sql_contar_por_tipo(c)
+            consultas[f"documentos.{nome}"] = ConsultaPlanejada(sql, tuple(params))
+
+        for nome, c, varredura in (("agregados", None, True), ("agregados_centro", centro, False)):
+            sql, params = cls._sql_agregados(c, None, 15)
+            consultas[f"documentos.{nome}"] = ConsultaPlanejada(sql, tuple(params), varredura)
+
+        for nome, papel in (("documentos_por_pessoa", None), ("documentos_por_papel", "remetente")):
+            sql, params = cls._sql_por_pessoa(pessoa, papel)
+            consultas[f"documentos.{nome}"] = ConsultaPlanejada(sql, tuple(params))
+
+        return consultas
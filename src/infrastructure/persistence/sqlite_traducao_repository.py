@@ -3,14 +3,26 @@
 Implementação SQLite do repositório de traduções com telemetria.
 """
 
+import logging
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
 from src.domain.entities.traducao import Traducao
 from src.domain.interfaces.repositorio_traducao import RepositorioTraducao
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
 from src.infrastructure.config.settings import settings
+from src.infrastructure.persistence.compressao import (
+    compressao_ativa,
+    descomprimir,
+    para_armazenar,
+)
+from src.infrastructure.persistence.consultas import ConsultaPlanejada
+from src.infrastructure.persistence.models import AlteracaoModel
+from src.infrastructure.persistence.pool import obter_pool
+
+logger = logging.getLogger(__name__)
 
 # Telemetria opcional
 _telemetry = None
@@ -27,22 +39,26 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
 
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or str(settings.DB_PATH)
+        self._pool = obter_pool(self.db_path)
+        self._comprimido: Optional[bool] = None
 
     @contextmanager
     def _conexao(self):
-        """Gerenciador de contexto para conexões."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Gerenciador de contexto para conexões (reutilizadas pelo pool)."""
         try:
-            yield conn
-            conn.commit()
-        except Exception as e:
+            with self._pool.conexao() as conn:
+                yield conn
+        except Exception:
             if _telemetry:
                 _telemetry.increment("sqlite_traducao.erro_conexao")
-            conn.rollback()
             raise
-        finally:
-            conn.close()
+
+    def _texto_para_banco(self, texto: str):
+        """Texto traduzido no formato de armazenamento do banco."""
+        if self._comprimido is None:
+            with self._conexao() as conn:
+                self._comprimido = compressao_ativa(conn)
+        return para_armazenar(texto, self._comprimido)
 
     def _row_para_entidade(self, row: sqlite3.Row) -> Traducao:
         """Converte linha do banco para entidade."""
@@ -50,7 +66,7 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
             id=row["id"],
             documento_id=row["documento_id"],
             idioma=row["idioma"],
-            texto_traduzido=row["texto_traduzido"],
+            texto_traduzido=descomprimir(row["texto_traduzido"]) or "",
             modelo=row["modelo"],
             custo=row["custo"],
             data_traducao=datetime.fromisoformat(row["data_traducao"]),
@@ -58,6 +74,7 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
 
     def salvar(self, traducao: Traducao) -> int:
         """Salva uma tradução."""
+        agora = datetime.now().isoformat()
         with self._conexao() as conn:
             cursor = conn.cursor()
 
@@ -70,18 +87,23 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
                         texto_traduzido = ?,
                         modelo = ?,
                         custo = ?,
-                        data_traducao = ?
+                        data_traducao = ?,
+                        updated_at = ?
                     WHERE id = ?
                 """,
                     (
                         traducao.idioma,
-                        traducao.texto_traduzido,
+                        self._texto_para_banco(traducao.texto_traduzido),
                         traducao.modelo,
                         traducao.custo,
                         traducao.data_traducao.isoformat(),
+                        agora,
                         traducao.id,
                     ),
                 )
+                AlteracaoModel.registrar(
+                    cursor, "traducoes", [(traducao.id, AlteracaoModel.ATUALIZACAO)], agora
+                )
                 if _telemetry:
                     _telemetry.increment("sqlite_traducao.atualizacao")
                 return traducao.id
@@ -90,27 +112,141 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
                 cursor.execute(
                     """
                     INSERT INTO traducoes
-                    (documento_id, idioma, texto_traduzido, modelo, custo, data_traducao)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    (documento_id, idioma, texto_traduzido, modelo, custo, data_traducao,
+                     updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         traducao.documento_id,
                         traducao.idioma,
-                        traducao.texto_traduzido,
+                        self._texto_para_banco(traducao.texto_traduzido),
                         traducao.modelo,
                         traducao.custo,
                         traducao.data_traducao.isoformat(),
+                        agora,
                     ),
                 )
+                traducao_id = cursor.lastrowid
+                AlteracaoModel.registrar(
+                    cursor, "traducoes", [(traducao_id, AlteracaoModel.INSERCAO)], agora
+                )
                 if _telemetry:
                     _telemetry.increment("sqlite_traducao.insercao")
-                return cursor.lastrowid
+                return traducao_id
+
+    def salvar_em_lote(
+        self, traducoes: Iterable[Traducao], chunk_size: int = 500
+    ) -> List[Optional[int]]:
+        """
+        Insere/atualiza traduções em lotes, um lote por transação.
+
+        Um lote com erro é desfeito por inteiro (seus IDs retornam como None).
+        """
+        traducoes = list(traducoes)
+        ids: List[Optional[int]] = []
+
+        for inicio in range(0, len(traducoes), chunk_size):
+            lote = traducoes[inicio : inicio + chunk_size]
+            try:
+                ids.extend(self._salvar_lote(lote))
+                if _telemetry:
+                    _telemetry.increment("sqlite_traducao.lote", value=len(lote))
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"⚠️ Lote {inicio}-{inicio + len(lote) - 1} desfeito ao salvar traduções: {e}"
+                )
+                if _telemetry:
+                    _telemetry.increment("sqlite_traducao.lote_erro")
+                ids.extend([None] * len(lote))
+
+        return ids
+
+    def _salvar_lote(self, lote: List[Traducao]) -> List[int]:
+        """Grava um lote em uma única transação (executemany)."""
+        agora = datetime.now().isoformat()
+        atualizacoes = [
+            (
+                t.idioma,
+                self._texto_para_banco(t.texto_traduzido),
+                t.modelo,
+                t.custo,
+                t.data_traducao.isoformat(),
+                agora,
+                t.id,
+            )
+            for t in lote
+            if t.id
+        ]
+        insercoes = [
+            (
+                t.documento_id,
+                t.idioma,
+                self._texto_para_banco(t.texto_traduzido),
+                t.modelo,
+                t.custo,
+                t.data_traducao.isoformat(),
+                agora,
+            )
+            for t in lote
+            if not t.id
+        ]
+
+        with self._conexao() as conn:
+            cursor = conn.cursor()
+            if atualizacoes:
+                cursor.executemany(
+                    """
+                    UPDATE traducoes SET
+                        idioma = ?,
+                        texto_traduzido = ?,
+                        modelo = ?,
+                        custo = ?,
+                        data_traducao = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                """,
+                    atualizacoes,
+                )
+
+            novos_ids: List[int] = []
+            if insercoes:
+                cursor.executemany(
+                    """
+                    INSERT INTO traducoes
+                    (documento_id, idioma, texto_traduzido, modelo, custo, data_traducao,
+                     updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    insercoes,
+                )
+                # Dentro da transação (lock de escrita) os IDs AUTOINCREMENT são contíguos
+                ultimo = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                novos_ids = list(range(ultimo - len(insercoes) + 1, ultimo + 1))
+
+            proximo = iter(novos_ids)
+            ids = [t.id if t.id else next(proximo) for t in lote]
+            AlteracaoModel.registrar(
+                cursor,
+                "traducoes",
+                [
+                    (id_, AlteracaoModel.ATUALIZACAO if t.id else AlteracaoModel.INSERCAO)
+                    for id_, t in zip(ids, lote)
+                ],
+                agora,
+            )
+
+        return ids
+
+    _SQL_BUSCAR_POR_ID = "SELECT * FROM traducoes WHERE id = ?"
+    _SQL_BUSCAR_POR_DOCUMENTO = "SELECT * FROM traducoes WHERE documento_id = ? AND idioma = ?"
+    _SQL_LISTAR_POR_DOCUMENTO = "SELECT * FROM traducoes WHERE documento_id = ? ORDER BY idioma"
+    _SQL_CONTAR_POR_DOCUMENTO = "SELECT COUNT(*) FROM traducoes WHERE documento_id = ?"
 
     def buscar_por_id(self, id: int) -> Optional[Traducao]:
         """Busca tradução por ID."""
         with self._conexao() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM traducoes WHERE id = ?", (id,))
+            cursor.execute(self._SQL_BUSCAR_POR_ID, (id,))
             row = cursor.fetchone()
             if _telemetry:
                 _telemetry.increment("sqlite_traducao.busca_por_id")
@@ -120,13 +256,7 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
         """Busca tradução específica de um documento."""
         with self._conexao() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM traducoes
-                WHERE documento_id = ? AND idioma = ?
-            """,
-                (documento_id, idioma),
-            )
+            cursor.execute(self._SQL_BUSCAR_POR_DOCUMENTO, (documento_id, idioma))
             row = cursor.fetchone()
             if _telemetry:
                 _telemetry.increment("sqlite_traducao.busca_por_documento")
@@ -136,14 +266,7 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
         """Lista todas as traduções de um documento."""
         with self._conexao() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM traducoes
-                WHERE documento_id = ?
-                ORDER BY idioma
-            """,
-                (documento_id,),
-            )
+            cursor.execute(self._SQL_LISTAR_POR_DOCUMENTO, (documento_id,))
             resultados = cursor.fetchall()
             if _telemetry:
                 _telemetry.increment("sqlite_traducao.listagem", value=len(resultados))
@@ -153,14 +276,69 @@ class SQLiteTraducaoRepository(RepositorioTraducao):
         """Conta traduções de um documento."""
         with self._conexao() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT COUNT(*) FROM traducoes
-                WHERE documento_id = ?
-            """,
-                (documento_id,),
-            )
+            cursor.execute(self._SQL_CONTAR_POR_DOCUMENTO, (documento_id,))
             count = cursor.fetchone()[0]
             if _telemetry:
                 _telemetry.increment("sqlite_traducao.contagem")
             return count
+
+    # Limite de parâmetros por consulta (compatível com SQLITE_MAX_VARIABLE_NUMBER antigo)
+    _MAX_PARAMETROS = 900
+
+    def idiomas_por_documento(self, documento_ids: Iterable[int]) -> Dict[int, Set[str]]:
+        """Idiomas traduzidos de vários documentos em uma consulta por lote de IDs."""
+        ids = list(dict.fromkeys(documento_ids))
+        idiomas: Dict[int, Set[str]] = {}
+        if not ids:
+            return idiomas
+
+        with self._conexao() as conn:
+            for inicio in range(0, len(ids), self._MAX_PARAMETROS):
+                lote = ids[inicio : inicio + self._MAX_PARAMETROS]
+                cursor = conn.execute(self._sql_idiomas(len(lote)), lote)
+                for documento_id, idioma in cursor:
+                    idiomas.setdefault(documento_id, set()).add(idioma)
+
+        if _telemetry:
+            _telemetry.increment("sqlite_traducao.idiomas_por_documento")
+        return idiomas
+
+    @staticmethod
+    def _sql_idiomas(quantidade: int) -> str:
+        """Consulta de idiomas_por_documento para `quantidade` IDs."""
+        marcadores = ", ".join("?" for _ in range(quantidade))
+        return (
+            f"SELECT DISTINCT documento_id, idioma FROM traducoes "
+            f"WHERE documento_id IN ({marcadores})"
+        )
+
+    def listar_alterados_desde(self, marca: int = 0, limite: int = 1000) -> LoteAlteracoes:
+        """
+        Traduções alteradas depois da marca (checkpoint) informada.
+
+        Args:
+            marca: Marca retornada pela chamada anterior (0 = desde o início)
+            limite: Máximo de entradas do log lidas por chamada
+        """
+        with self._conexao() as conn:
+            lote = AlteracaoModel.listar_desde(conn.cursor(), "traducoes", marca, limite)
+        if _telemetry:
+            _telemetry.increment("sqlite_traducao.alterados_desde")
+        return lote
+
+    @classmethod
+    def consultas_planejadas(cls) -> Dict[str, ConsultaPlanejada]:
+        """Consultas de leitura do repositório com parâmetros de exemplo."""
+        return {
+            "traducoes.buscar_por_id": ConsultaPlanejada(cls._SQL_BUSCAR_POR_ID, (1,)),
+            "traducoes.buscar_por_documento_idioma": ConsultaPlanejada(
+                cls._SQL_BUSCAR_POR_DOCUMENTO, (1, "en")
+            ),
+            "traducoes.listar_por_documento": ConsultaPlanejada(
+                cls._SQL_LISTAR_POR_DOCUMENTO, (1,)
+            ),
+            "traducoes.contar_por_documento": ConsultaPlanejada(
+                cls._SQL_CONTAR_POR_DOCUMENTO, (1,)
+            ),
+            "traducoes.idiomas_por_documento": ConsultaPlanejada(cls._sql_idiomas(2), (1, 2)),
+        }
@@ -11,6 +11,8 @@ from datetime import datetime
 from threading import Lock
 from typing import Any, Callable, Dict, Optional
 
+from src.infrastructure.analysis.spacy_models import ProvedorModelos
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +47,7 @@ class ServiceRegistry:
     - Suporte a serviços eager e lazy
     - Cache de instâncias após primeira inicialização
     - Estatísticas de uso por serviço
+    - Modelos spaCy do processo (modelos_spacy), compartilhados pelos serviços
     """
 
     _instance = None
@@ -68,6 +71,7 @@ class ServiceRegistry:
         self._instances: Dict[str, Any] = {}
         self._stats: Dict[str, ServiceStats] = {}
         self._lock = Lock()
+        self.modelos_spacy = ProvedorModelos()
         self._initialized = True
         logger.info("🔧 Service Registry inicializado")
 
@@ -214,6 +218,7 @@ class ServiceRegistry:
             self._services.clear()
             self._instances.clear()
             self._stats.clear()
+            self.modelos_spacy.descarregar()
             logger.info("🔄 Registry resetado")
 
     def clear_cache(self, name: Optional[str] = None) -> None:
@@ -23,7 +23,8 @@ from src.infrastructure.factories import (
     create_translator,
     create_wordcloud_generator,
 )
-from src.infrastructure.persistence.migrations import criar_tabelas, migrar_banco_existente
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.sqlite_analise_repository import SQLiteAnaliseRepository
 from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
 from src.infrastructure.persistence.sqlite_traducao_repository import SQLiteTraducaoRepository
 from src.infrastructure.registry import ServiceRegistry
@@ -71,7 +72,9 @@ class ShowTrialsApp:
         # =====================================================
 
         # Casos que não precisam de registry
-        self.listar_use_case = ListarDocumentos(self.repo).com_traducao_nomes(True)
+        self.listar_use_case = ListarDocumentos(self.repo, self.repo_traducao).com_traducao_nomes(
+            True
+        )
         self.obter_use_case = ObterDocumento(self.repo, self.repo_traducao).com_traducao_nomes(True)
         self.estatisticas_use_case = ObterEstatisticas(self.repo)
         self.exportar_use_case = ExportarDocumento(self.repo, self.repo_traducao)
@@ -88,6 +91,7 @@ class ShowTrialsApp:
             repo_doc=self.repo,
             repo_trad=self.repo_traducao,
             registry=self.registry,  # ← Corrigido também (opcional, mas consistente)
+            repo_analise=SQLiteAnaliseRepository(),
         )
 
         self.analisar_acervo_use_case = AnalisarAcervo(
@@ -123,9 +127,10 @@ class ShowTrialsApp:
         self.menu_centro = MenuCentro()
 
     def inicializar_banco(self):
-        """Garante que o banco está pronto."""
-        criar_tabelas()
-        migrar_banco_existente()
+        """Garante que o banco está pronto (aplica só as migrações pendentes)."""
+        aplicadas = aplicar_migracoes()
+        if aplicadas:
+            console.print(f"[green]✅ Migrações aplicadas: {aplicadas}[/green]")
         console.print("[green]✅ Banco de dados pronto[/green]")
 
     def run(self):
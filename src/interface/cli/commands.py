@@ -20,15 +20,19 @@ class ComandoListar:
         """Executa listagem interativa."""
         pagina = 1
         limite = 15
+        cursor = None
+        total = None
 
         while True:
             limpar_tela()
             cabecalho(f"📋 Documentos - {centro or 'Todos'}")
 
-            # Buscar documentos
+            # Buscar documentos (navegação por cursor após a primeira página;
+            # o total contado na primeira é reaproveitado)
             resultados = self.listar_use_case.executar(
-                pagina=pagina, limite=limite, centro=centro, tipo=tipo
+                pagina=pagina, limite=limite, centro=centro, tipo=tipo, cursor=cursor, total=total
             )
+            total = resultados["total"]
 
             # Mostrar tabela
             self.presenter.tabela_documentos(resultados)
@@ -43,9 +47,11 @@ class ComandoListar:
 
             cmd = input("\nComando: ").strip().lower()
 
-            if cmd == "n" and pagina < resultados["total_paginas"]:
+            if cmd == "n" and resultados["cursor_proximo"]:
+                cursor = resultados["cursor_proximo"]
                 pagina += 1
-            elif cmd == "p" and pagina > 1:
+            elif cmd == "p" and resultados["cursor_anterior"]:
+                cursor = resultados["cursor_anterior"]
                 pagina -= 1
             elif cmd == "m":
                 break
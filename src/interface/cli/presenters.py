@@ -53,8 +53,12 @@ class DocumentoPresenter:
         table.add_column("🌐", width=8, justify="center")
 
         for item in resultados["items"]:
-            # Badge de tradução baseado no campo tem_traducao
-            if item.tem_traducao:
+            # Badge de tradução: idiomas disponíveis (ou ✓ sem detalhe)
+            if item.idiomas:
+                trad_badge = (
+                    "[bold green]" + " ".join(i.upper() for i in item.idiomas) + "[/bold green]"
+                )
+            elif item.tem_traducao:
                 trad_badge = "[bold green]✓[/bold green]"
             else:
                 trad_badge = "[dim]—[/dim]"
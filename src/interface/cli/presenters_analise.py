@@ -108,9 +108,9 @@ class AnalisePresenter:
             console.print(f"  • {categoria}: {total}")
 
         # Top pessoas
-        if stats["top_pessoas"]:
+        if stats["pessoas_mais_citadas"]:
             console.print("\n[bold]👤 PESSOAS MAIS CITADAS[/bold]")
-            for pessoa, freq in stats["top_pessoas"][:10]:
+            for pessoa, freq in stats["pessoas_mais_citadas"][:10]:
                 console.print(f"  • {pessoa}: {freq}")
 
         # Top locais
@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from src.application.use_cases.analisar_acervo import AnalisarAcervo
 from src.application.use_cases.analisar_texto import AnalisarDocumento
+from src.application.use_cases.buscar_documentos import BuscarDocumentos
 from src.application.use_cases.estatisticas import ObterEstatisticas
 from src.application.use_cases.listar_documentos import ListarDocumentos
 from src.application.use_cases.obter_documento import ObterDocumento
@@ -23,7 +24,16 @@ from src.application.use_cases.traduzir_documento import (  # <-- ADICIONAR ESTA
     TraduzirDocumento,
 )
 from src.infrastructure.config import ApplicationConfig
+from src.infrastructure.config.settings import settings
 from src.infrastructure.factories import SERVICE_FACTORIES
+from src.infrastructure.persistence.cache_repository import (
+    CacheDocumentoRepository,
+    CacheLRU,
+    CacheTraducaoRepository,
+)
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.replica import ativar_replica
+from src.infrastructure.persistence.sqlite_analise_repository import SQLiteAnaliseRepository
 from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
 from src.infrastructure.persistence.sqlite_traducao_repository import SQLiteTraducaoRepository
 from src.infrastructure.registry import ServiceRegistry
@@ -67,27 +77,49 @@ def create_app(config_path: str = "config.yaml"):
         )
         logger.info(f"✅ Serviço {name} registrado (lazy={svc_config.lazy})")
 
+    # Perfis de pipeline spaCy valem para todos os serviços que usam modelos
+    # (aplicados antes de qualquer carga, mesmo que a nuvem de palavras venha primeiro)
+    if "spacy" in config.services:
+        registry.modelos_spacy.configurar_perfis(config.services["spacy"].options.get("perfis"))
+
     # 4. Inicializar serviços eager
     eager_times = registry.start_eager_services()
     if eager_times:
         logger.info(f"🚀 Serviços eager inicializados: {eager_times}")
 
-    # 5. Inicializar repositórios (sempre eager)
+    # 5. Inicializar repositórios (sempre eager), com o schema atualizado
+    aplicadas = aplicar_migracoes()
+    if aplicadas:
+        logger.info(f"✅ Migrações aplicadas: {aplicadas}")
+    if settings.DB_REPLICA_MEMORIA:
+        ativar_replica(str(settings.DB_PATH))
     repo_doc = SQLiteDocumentoRepository()
     repo_trad = SQLiteTraducaoRepository()
+    cache = None
+    if config.cache.enabled:
+        # Um único cache: o limite de memória vale para documentos e traduções
+        cache = CacheLRU(config.cache.max_bytes, config.cache.ttl)
+        repo_doc = CacheDocumentoRepository(repo_doc, cache)
+        repo_trad = CacheTraducaoRepository(repo_trad, cache)
     logger.info("✅ Repositórios inicializados")
 
     # 6. Inicializar casos de uso (com registry)
-    listar_use_case = ListarDocumentos(repo_doc).com_traducao_nomes(True)
+    listar_use_case = ListarDocumentos(repo_doc, repo_trad).com_traducao_nomes(True)
     obter_use_case = ObterDocumento(repo_doc, repo_trad).com_traducao_nomes(True)
     estatisticas_use_case = ObterEstatisticas(repo_doc)
+    buscar_use_case = BuscarDocumentos(repo_doc)
 
     # Casos que usam serviços (COM registry)
     analisar_doc_use_case = AnalisarDocumento(
-        repo_doc=repo_doc, repo_trad=repo_trad, registry=registry
+        repo_doc=repo_doc,
+        repo_trad=repo_trad,
+        registry=registry,
+        repo_analise=SQLiteAnaliseRepository(),
     )
 
-    analisar_acervo_use_case = AnalisarAcervo(repo_doc=repo_doc, registry=registry)
+    # Um só processo: o servidor é multi-thread e segura conexões SQLite do pool,
+    # então fork() dos workers do nlp.pipe arrisca deadlocks
+    analisar_acervo_use_case = AnalisarAcervo(repo_doc=repo_doc, registry=registry, n_process=1)
 
     traduzir_use_case = TraduzirDocumento(repo_doc=repo_doc, repo_trad=repo_trad, registry=registry)
 
@@ -116,9 +148,11 @@ def create_app(config_path: str = "config.yaml"):
     app.state.config = config
     app.state.repo_doc = repo_doc
     app.state.repo_trad = repo_trad
+    app.state.cache = cache
     app.state.listar_use_case = listar_use_case
     app.state.obter_use_case = obter_use_case
     app.state.estatisticas_use_case = estatisticas_use_case
+    app.state.buscar_use_case = buscar_use_case
     app.state.analisar_doc_use_case = analisar_doc_use_case
     app.state.analisar_acervo_use_case = analisar_acervo_use_case
 
@@ -130,6 +164,7 @@ def create_app(config_path: str = "config.yaml"):
             "status": "running",
             "environment": config.environment,
             "services": registry.get_status(),
+            "modelos_spacy": registry.modelos_spacy.estatisticas(),
         }
 
     # 12. Rota principal
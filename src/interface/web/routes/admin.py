@@ -8,6 +8,10 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.templating import Jinja2Templates
 
+from src.infrastructure.persistence.backup import criar_backup
+from src.infrastructure.persistence.pool import obter_pool
+from src.infrastructure.persistence.replica import PoolReplica
+
 router = APIRouter()
 templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates")
 
@@ -59,3 +63,71 @@ async def preload_service(request: Request, name: str, lang: str = None):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/backup")
+def criar_backup_banco(request: Request, compactado: bool = True):
+    """
+    Gera um backup verificado do banco em uso.
+
+    Função síncrona: o FastAPI a executa no threadpool, sem bloquear o loop
+    enquanto a cópia avança em passos.
+    """
+    try:
+        resultado = criar_backup(origem=request.app.state.repo_doc.db_path, compactado=compactado)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not resultado.integro:
+        raise HTTPException(
+            status_code=500,
+            detail={"arquivo": str(resultado.caminho), "problemas": resultado.problemas[:10]},
+        )
+
+    return {
+        "status": "ok",
+        "arquivo": str(resultado.caminho),
+        "tamanho_bytes": resultado.tamanho_bytes,
+        "paginas": resultado.paginas,
+        "duracao": round(resultado.duracao, 3),
+        "compactado": resultado.compactado,
+    }
+
+
+@router.post("/replica/recarregar")
+def recarregar_replica(request: Request):
+    """
+    Recarrega a réplica em memória a partir do arquivo.
+
+    Necessário após escritas feitas fora do servidor (CLI, scripts).
+    """
+    pool = obter_pool(request.app.state.repo_doc.db_path)
+    if not isinstance(pool, PoolReplica):
+        raise HTTPException(status_code=409, detail="Réplica em memória desativada")
+
+    pool.recarregar()
+    return {"status": "ok", **pool.estatisticas()}
+
+
+@router.get("/cache")
+async def cache_status(request: Request):
+    """
+    Estatísticas do cache de entidades.
+    """
+    cache = request.app.state.cache
+    if cache is None:
+        return {"status": "desativado"}
+    return {"status": "ok", **cache.estatisticas()}
+
+
+@router.post("/cache/limpar")
+async def limpar_cache(request: Request):
+    """
+    Esvazia o cache de entidades (ex.: após escritas feitas pelo CLI).
+    """
+    cache = request.app.state.cache
+    if cache is None:
+        raise HTTPException(status_code=409, detail="Cache de entidades desativado")
+
+    cache.limpar()
+    return {"status": "ok", "message": "Cache de entidades limpo"}
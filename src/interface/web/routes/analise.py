@@ -13,9 +13,12 @@ templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates"
 
 
 @router.get("/acervo")
-async def analisar_acervo(request: Request):
+def analisar_acervo(request: Request):
     """
     Análise global do acervo.
+
+    Síncrona: o FastAPI a executa no threadpool, e a análise de entidades
+    do acervo não bloqueia o event loop.
     """
     try:
         repo_doc = request.app.state.repo_doc
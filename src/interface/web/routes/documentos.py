@@ -7,21 +7,46 @@ from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup, escape
 
 router = APIRouter()
 templates = Jinja2Templates(directory=Path(__file__).parent.parent / "templates")
 
 
+def _destacar(trecho: str) -> Markup:
+    """Escapa o trecho da busca preservando apenas os marcadores <mark>."""
+    seguro = str(escape(trecho or ""))
+    return Markup(seguro.replace("&lt;mark&gt;", "<mark>").replace("&lt;/mark&gt;", "</mark>"))
+
+
+templates.env.filters["destacar"] = _destacar
+
+
 @router.get("/")
 async def listar_documentos(
-    request: Request, pagina: int = 1, centro: str = None, tipo: str = None
+    request: Request,
+    pagina: int = 1,
+    centro: str = None,
+    tipo: str = None,
+    cursor: str = None,
+    total: int = None,
 ):
     """
-    Lista documentos com paginação.
+    Lista documentos com paginação (por cursor nos links anterior/próxima).
+
+    O total contado na primeira página segue nos links, evitando recontar
+    o acervo a cada página.
     """
     use_case = request.app.state.listar_use_case
 
-    resultados = use_case.executar(pagina=pagina, limite=15, centro=centro, tipo=tipo)
+    resultados = use_case.executar(
+        pagina=max(pagina, 1),
+        limite=15,
+        centro=centro,
+        tipo=tipo,
+        cursor=cursor or None,
+        total=total,
+    )
 
     return templates.TemplateResponse(
         "documentos/lista.html",
@@ -31,6 +56,37 @@ async def listar_documentos(
             "total": resultados["total"],
             "pagina": resultados["pagina"],
             "total_paginas": resultados["total_paginas"],
+            "cursor_proximo": resultados["cursor_proximo"],
+            "cursor_anterior": resultados["cursor_anterior"],
+            "centro": centro,
+            "tipo": tipo,
+        },
+    )
+
+
+@router.get("/busca")
+async def buscar_documentos(
+    request: Request,
+    q: str = "",
+    pagina: int = 1,
+    centro: str = None,
+    tipo: str = None,
+):
+    """
+    Busca textual em títulos, textos e traduções.
+    """
+    use_case = request.app.state.buscar_use_case
+
+    resultados = use_case.executar(q, pagina=pagina, limite=15, centro=centro, tipo=tipo)
+
+    return templates.TemplateResponse(
+        "documentos/busca.html",
+        {
+            "request": request,
+            "resultados": resultados["items"],
+            "q": resultados["query"],
+            "pagina": resultados["pagina"],
+            "tem_proxima": resultados["tem_proxima"],
             "centro": centro,
             "tipo": tipo,
         },
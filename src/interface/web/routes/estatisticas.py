@@ -38,6 +38,8 @@ async def estatisticas_json(request: Request):
         "total_traducoes": stats.total_traducoes,
         "por_centro": stats.documentos_por_centro,
         "por_tipo": stats.documentos_por_tipo,
+        "traducoes_por_idioma": stats.traducoes_por_idioma,
+        "custo_total_traducoes": stats.custo_total_traducoes,
         "pessoas_frequentes": [
             {"nome": nome_en, "frequencia": count}
             for nome_ru, count, nome_en in stats.pessoas_frequentes[:10]
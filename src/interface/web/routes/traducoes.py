@@ -32,8 +32,8 @@ async def listar_traducoes(request: Request, documento_id: int):
         repo_trad = request.app.state.repo_trad
         repo_doc = request.app.state.repo_doc
 
-        # Buscar documento
-        documento = repo_doc.buscar_por_id(documento_id)
+        # Buscar documento (só o título é exibido)
+        documento = repo_doc.buscar_por_id(documento_id, carregar_texto=False)
         if not documento:
             return templates.TemplateResponse(
                 "erro.html",
@@ -91,8 +91,8 @@ async def ver_traducao(request: Request, documento_id: int, idioma: str):
                 status_code=404,
             )
 
-        # Buscar documento original
-        documento = repo_doc.buscar_por_id(documento_id)
+        # Buscar documento original (só metadados são exibidos)
+        documento = repo_doc.buscar_por_id(documento_id, carregar_texto=False)
 
         return templates.TemplateResponse(
             "traducoes/detalhe.html",
@@ -4,21 +4,39 @@ Testes de lógica para o caso de uso AnalisarAcervo.
 """
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.application.use_cases.analisar_acervo import AnalisarAcervo
 from src.domain.entities.documento import Documento
+from src.domain.value_objects.analise_texto import Entidade
+from src.domain.value_objects.lote_alteracoes import LoteAlteracoes
 from src.infrastructure.registry import ServiceRegistry
 
 
 class MockSpacyAnalyzer:
     """Mock do analisador spaCy."""
 
+    def __init__(self):
+        self.analisados = []
+        self.n_process = []
+
     def analisar(self, texto, doc_id, idioma):
         return Mock()
 
+    def analisar_lote(self, textos, idioma="ru", batch_size=None, n_process=None):
+        """Entidades no formato "TIPO:texto" separadas por espaço."""
+        self.n_process.append(n_process)
+        for doc_id, texto in textos:
+            self.analisados.append(doc_id)
+            entidades = [
+                Entidade(texto=nome, tipo=tipo, confianca=1.0, posicao_inicio=0, posicao_fim=1)
+                for tipo, nome in (item.split(":") for item in texto.split() if ":" in item)
+            ]
+            yield SimpleNamespace(documento_id=doc_id, entidades=entidades)
+
 
 class MockWordCloudGenerator:
     """Mock do gerador de wordcloud."""
@@ -37,6 +55,8 @@ class TestAnalisarAcervo:
         for i in range(10):
             doc = Mock(spec=Documento)
             doc.texto = "palavra " * 200  # ~400 palavras
+            doc.tamanho_palavras = len(doc.texto.split())
+            doc.tamanho_caracteres = len(doc.texto)
             doc.id = i
             docs.append(doc)
         return docs
@@ -45,7 +65,7 @@ class TestAnalisarAcervo:
     def setup_mocks(self, documentos_mock):
         """Fixture com mocks configurados."""
         mock_repo_doc = Mock()
-        mock_repo_doc.listar.return_value = documentos_mock
+        mock_repo_doc.iterar.return_value = documentos_mock
 
         mock_registry = Mock(spec=ServiceRegistry)
         mock_registry.get.side_effect = lambda name: {
@@ -70,6 +90,21 @@ class TestAnalisarAcervo:
         assert stats["media_palavras_por_doc"] > 0
         assert "documentos_por_tamanho" in stats
 
+    @pytest.mark.parametrize("n_process, esperado", [(None, None), (1, 1)])
+    def test_n_process_em_acervo_grande(self, n_process, esperado):
+        """Acervos grandes usam os processos configurados (a web fixa um só)."""
+        doc = SimpleNamespace(id=1, texto="PER:Киров", tamanho_palavras=1, tamanho_caracteres=9)
+        repo = Mock()
+        repo.iterar.side_effect = lambda **kwargs: iter([doc] * 250)
+        repo.listar_alterados_desde.return_value = LoteAlteracoes(marca=0)
+        analyzer = MockSpacyAnalyzer()
+        registry = Mock(spec=ServiceRegistry)
+        registry.get.return_value = analyzer
+
+        AnalisarAcervo(repo, registry, n_process=n_process).estatisticas_globais()
+
+        assert analyzer.n_process == [esperado]
+
     def test_estatisticas_com_documentos_variados(self):
         """Deve classificar documentos por tamanho corretamente."""
         mock_repo = Mock()
@@ -80,19 +115,25 @@ class TestAnalisarAcervo:
         # Documento pequeno: 500 palavras
         doc_pequeno = Mock(spec=Documento)
         doc_pequeno.texto = "palavra " * 500
+        doc_pequeno.tamanho_palavras = len(doc_pequeno.texto.split())
+        doc_pequeno.tamanho_caracteres = len(doc_pequeno.texto)
         docs.append(doc_pequeno)
 
         # Documento médio: 2000 palavras
         doc_medio = Mock(spec=Documento)
         doc_medio.texto = "palavra " * 2000
+        doc_medio.tamanho_palavras = len(doc_medio.texto.split())
+        doc_medio.tamanho_caracteres = len(doc_medio.texto)
         docs.append(doc_medio)
 
         # Documento grande: 6000 palavras
         doc_grande = Mock(spec=Documento)
         doc_grande.texto = "palavra " * 6000
+        doc_grande.tamanho_palavras = len(doc_grande.texto.split())
+        doc_grande.tamanho_caracteres = len(doc_grande.texto)
         docs.append(doc_grande)
 
-        mock_repo.listar.return_value = docs
+        mock_repo.iterar.return_value = docs
 
         caso_uso = AnalisarAcervo(repo_doc=mock_repo)
         stats = caso_uso.estatisticas_globais()
@@ -104,7 +145,7 @@ class TestAnalisarAcervo:
     def test_estatisticas_sem_analyzer(self, documentos_mock):
         """Deve funcionar mesmo sem analyzer disponível."""
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         # Registry que falha ao obter analyzer
         mock_registry = Mock(spec=ServiceRegistry)
@@ -148,3 +189,72 @@ class TestAnalisarAcervo:
 
         with pytest.raises(Exception, match="Falha na geração"):
             caso_uso.gerar_wordcloud_geral()
+
+
+class TestEntidadesDoAcervo:
+    """Agregação de entidades de todo o acervo via analisar_lote."""
+
+    @staticmethod
+    def _doc(doc_id, texto):
+        doc = Mock(spec=Documento)
+        doc.id = doc_id
+        doc.texto = texto
+        doc.tamanho_palavras = len(texto.split())
+        doc.tamanho_caracteres = len(texto)
+        return doc
+
+    @pytest.fixture
+    def acervo(self):
+        """Três documentos com pessoas, locais e organizações."""
+        docs = {
+            1: self._doc(1, "PER:Киров LOC:Ленинград ORG:НКВД"),
+            2: self._doc(2, "PER:Киров PER:Николаев"),
+            3: self._doc(3, "PERSON:Зиновьев GPE:Москва MISC:Разное"),
+        }
+        analyzer = MockSpacyAnalyzer()
+        registry = Mock(spec=ServiceRegistry)
+        registry.get.return_value = analyzer
+        repo = Mock()
+        repo.iterar.side_effect = lambda **kwargs: list(docs.values())
+        repo.buscar_por_id.side_effect = lambda doc_id: docs.get(doc_id)
+        repo.listar_alterados_desde.return_value = LoteAlteracoes(marca=0)
+        caso_uso = AnalisarAcervo(repo_doc=repo, registry=registry)
+        return SimpleNamespace(caso_uso=caso_uso, docs=docs, analyzer=analyzer, repo=repo)
+
+    def test_agrega_todo_o_acervo(self, acervo):
+        """Todos os documentos entram nas listas de mais citados."""
+        stats = acervo.caso_uso.estatisticas_globais()
+
+        assert stats["pessoas_mais_citadas"][0] == ("Киров", 2)
+        assert set(dict(stats["pessoas_mais_citadas"])) == {"Киров", "Николаев", "Зиновьев"}
+        assert set(dict(stats["top_locais"])) == {"Ленинград", "Москва"}
+        assert stats["top_organizacoes"] == [("НКВД", 1)]
+        assert sorted(acervo.analyzer.analisados) == [1, 2, 3]
+
+    def test_reanalisa_apenas_documentos_alterados(self, acervo):
+        """Chamadas seguintes processam só o delta do log de alterações."""
+        acervo.caso_uso.estatisticas_globais()
+        acervo.analyzer.analisados.clear()
+
+        acervo.docs[1] = self._doc(1, "PER:Ягода")
+        del acervo.docs[2]
+        acervo.repo.listar_alterados_desde.side_effect = [
+            LoteAlteracoes(alterados=[1], removidos=[2], marca=7),
+            LoteAlteracoes(marca=7),
+        ]
+        stats = acervo.caso_uso.estatisticas_globais()
+
+        assert acervo.analyzer.analisados == [1]
+        assert dict(stats["pessoas_mais_citadas"]) == {"Ягода": 1, "Зиновьев": 1}
+        assert stats["top_locais"] == [("Москва", 1)]
+        assert stats["top_organizacoes"] == []
+        acervo.repo.listar_alterados_desde.assert_called_with(7, limite=5000)
+
+    def test_erro_na_analise_nao_interrompe_estatisticas(self, acervo):
+        """Falha do analisador mantém as estatísticas básicas."""
+        acervo.analyzer.analisar_lote = Mock(side_effect=RuntimeError("modelo"))
+
+        stats = acervo.caso_uso.estatisticas_globais()
+
+        assert stats["total_docs"] == 3
+        assert stats["pessoas_mais_citadas"] == []
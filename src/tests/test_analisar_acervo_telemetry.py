@@ -24,6 +24,8 @@ class TestAnalisarAcervoTelemetry:
         for i in range(5):
             doc = Mock()
             doc.texto = "palavra " * 100
+            doc.tamanho_palavras = len(doc.texto.split())
+            doc.tamanho_caracteres = len(doc.texto)
             doc.id = i
             docs.append(doc)
         return docs
@@ -36,7 +38,7 @@ class TestAnalisarAcervoTelemetry:
         from src.application.use_cases.analisar_acervo import AnalisarAcervo
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         caso_uso = AnalisarAcervo(repo_doc=mock_repo)
         stats = caso_uso.estatisticas_globais()
@@ -54,7 +56,7 @@ class TestAnalisarAcervoTelemetry:
         from src.infrastructure.registry import ServiceRegistry
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         mock_registry = Mock(spec=ServiceRegistry)
         mock_registry.get.return_value = Mock()
@@ -77,7 +79,7 @@ class TestAnalisarAcervoTelemetry:
         from src.infrastructure.registry import ServiceRegistry
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         mock_registry = Mock(spec=ServiceRegistry)
         mock_registry.get.side_effect = Exception("Indisponível")
@@ -100,7 +102,7 @@ class TestAnalisarAcervoTelemetry:
         from src.infrastructure.registry import ServiceRegistry
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         mock_registry = Mock(spec=ServiceRegistry)
 
@@ -131,7 +133,7 @@ class TestAnalisarAcervoTelemetry:
         from src.infrastructure.registry import ServiceRegistry
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         mock_registry = Mock(spec=ServiceRegistry)
 
@@ -157,7 +159,7 @@ class TestAnalisarAcervoTelemetry:
         from src.application.use_cases.analisar_acervo import AnalisarAcervo
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = documentos_mock
+        mock_repo.iterar.return_value = documentos_mock
 
         caso_uso = AnalisarAcervo(repo_doc=mock_repo)
         stats = caso_uso.estatisticas_globais()
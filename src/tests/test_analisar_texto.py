@@ -33,6 +33,9 @@ class MockSpacyAnalyzer:
         analise.sentimento = sentimento
         return analise
 
+    def identificar_modelo(self, idioma):
+        return f"mock-{idioma}"
+
 
 class MockWordCloudGenerator:
     """Mock do gerador de wordcloud."""
@@ -186,3 +189,59 @@ class TestAnalisarDocumento:
         assert resultado is not None
         # Verificar se o wordcloud foi chamado (indiretamente)
         setup_mocks["registry"].get.assert_called_with("wordcloud")
+
+
+class TestAnalisarDocumentoComCache:
+    """Leitura através do repositório de análises."""
+
+    @pytest.fixture
+    def caso_uso(self):
+        """Caso de uso com repositório de análises simulado."""
+        repo_doc = Mock()
+        repo_doc.buscar_por_id.return_value = Documento(
+            id=1,
+            centro="lencenter",
+            titulo="Documento Teste",
+            url="http://teste.com",
+            texto="Texto para análise",
+            data_coleta=datetime.now(),
+        )
+        analyzer = Mock(wraps=MockSpacyAnalyzer())
+        registry = Mock(spec=ServiceRegistry)
+        registry.get.return_value = analyzer
+        return (
+            AnalisarDocumento(repo_doc=repo_doc, registry=registry, repo_analise=Mock()),
+            analyzer,
+        )
+
+    def test_reaproveita_analise_gravada(self, caso_uso):
+        """Com a análise gravada, o analisador não é executado."""
+        caso_uso, analyzer = caso_uso
+        gravada = Mock(spec=AnaliseTexto)
+        caso_uso.repo_analise.buscar.return_value = gravada
+
+        assert caso_uso.executar(documento_id=1) is gravada
+        analyzer.analisar.assert_not_called()
+        documento_id, idioma, hash_texto, modelo = caso_uso.repo_analise.buscar.call_args[0]
+        assert (documento_id, idioma, modelo) == (1, "ru", "mock-ru")
+        assert len(hash_texto) == 64
+
+    def test_grava_analise_calculada(self, caso_uso):
+        """Sem análise gravada, analisa e grava com a mesma chave da busca."""
+        caso_uso, analyzer = caso_uso
+        caso_uso.repo_analise.buscar.return_value = None
+
+        resultado = caso_uso.executar(documento_id=1)
+
+        analyzer.analisar.assert_called_once()
+        chave = caso_uso.repo_analise.buscar.call_args[0][2:]
+        caso_uso.repo_analise.salvar.assert_called_once_with(resultado, *chave)
+
+    def test_falha_do_cache_nao_impede_analise(self, caso_uso):
+        """Erros ao ler ou gravar a análise apenas fazem reanalisar."""
+        caso_uso, analyzer = caso_uso
+        caso_uso.repo_analise.buscar.side_effect = RuntimeError("banco bloqueado")
+        caso_uso.repo_analise.salvar.side_effect = RuntimeError("banco bloqueado")
+
+        assert caso_uso.executar(documento_id=1) is not None
+        analyzer.analisar.assert_called_once()
@@ -0,0 +1,55 @@
+"""
+Testes para o caso de uso BuscarDocumentos.
+"""
+
+from unittest.mock import Mock
+
+from src.application.use_cases.buscar_documentos import BuscarDocumentos
+from src.domain.value_objects.resultado_busca import ResultadoBusca
+
+
+def _resultado(i: int) -> ResultadoBusca:
+    return ResultadoBusca(
+        documento_id=i,
+        centro="lencenter",
+        titulo=f"Documento {i}",
+        tipo=None,
+        trecho="...",
+        relevancia=-1.0,
+    )
+
+
+class TestBuscarDocumentos:
+    """Testes para a busca textual."""
+
+    def test_paginacao_com_proxima(self):
+        """Deve pedir um item a mais para detectar próxima página."""
+        repo = Mock()
+        repo.buscar_texto.return_value = [_resultado(i) for i in range(6)]
+
+        resultado = BuscarDocumentos(repo).executar("николаев", pagina=2, limite=5)
+
+        assert len(resultado["items"]) == 5
+        assert resultado["tem_proxima"] is True
+        repo.buscar_texto.assert_called_once_with(
+            "николаев", centro=None, tipo=None, limite=6, offset=5
+        )
+
+    def test_ultima_pagina(self):
+        """Sem item extra não há próxima página."""
+        repo = Mock()
+        repo.buscar_texto.return_value = [_resultado(1)]
+
+        resultado = BuscarDocumentos(repo).executar("киров", limite=5, centro="lencenter")
+
+        assert resultado["tem_proxima"] is False
+        assert resultado["filtros"]["centro"] == "lencenter"
+
+    def test_consulta_vazia_nao_consulta_repositorio(self):
+        """Consulta vazia retorna lista vazia sem acessar o banco."""
+        repo = Mock()
+
+        resultado = BuscarDocumentos(repo).executar("   ")
+
+        assert resultado["items"] == []
+        repo.buscar_texto.assert_not_called()
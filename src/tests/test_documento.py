@@ -3,6 +3,7 @@
 Testes unitários para a entidade Documento.
 """
 
+from dataclasses import fields, replace
 from datetime import datetime
 
 import pytest
@@ -82,3 +83,49 @@ class TestDocumento:
         assert d["centro"] == "lencenter"
         assert d["data_coleta"] == "2024-01-01T12:00:00"
         assert d["tamanho"] == 5
+
+    def test_adiar_texto(self):
+        """Texto adiado deve ser carregado uma única vez, no primeiro acesso."""
+        doc = Documento(
+            id=1,
+            centro="lencenter",
+            titulo="Título",
+            url="url",
+            texto="",
+            data_coleta=datetime.now(),
+        )
+        chamadas = []
+
+        def carregar():
+            chamadas.append(1)
+            return "texto completo"
+
+        doc.adiar_texto(carregar).registrar_tamanhos(14, 2, 1)
+
+        assert (doc.tamanho_caracteres, doc.tamanho_palavras, doc.tamanho_paragrafos) == (14, 2, 1)
+        assert not doc.texto_carregado
+        assert doc.texto == "texto completo"
+        assert doc.tamanho_palavras == 2
+        assert len(chamadas) == 1
+
+        doc.texto = "outro texto\n\nsegundo parágrafo"
+        assert doc.tamanho_palavras == 4
+        assert doc.tamanho_paragrafos == 2
+        with pytest.raises(AttributeError):
+            doc.inexistente
+
+    def test_tamanhos_registrados_nao_sao_campo(self):
+        """Contagens registradas não entram em __eq__ nem sobrevivem a replace."""
+        data = datetime(2024, 1, 1)
+        simples = Documento(
+            centro="lencenter", titulo="T", url="u", texto="a b c", data_coleta=data
+        )
+        lido = Documento(centro="lencenter", titulo="T", url="u", texto="a b c", data_coleta=data)
+        lido.registrar_tamanhos(5, 3, 1)
+
+        assert "_tamanhos" not in {f.name for f in fields(Documento)}
+        assert lido == simples
+        assert "_tamanhos" not in repr(lido)
+
+        novo = replace(lido, texto="x")
+        assert (novo.tamanho_caracteres, novo.tamanho_palavras) == (1, 1)
@@ -31,7 +31,7 @@ class TestGerarRelatorio:
             doc.data_original = f"1934-{i+1:02d}-04"
             docs.append(doc)
 
-        repo.listar.return_value = docs
+        repo.iterar.return_value = docs
         return repo
 
     @pytest.fixture
@@ -87,7 +87,7 @@ class TestGerarRelatorio:
             doc.data_original = "1934"
             docs.append(doc)
 
-        repo_doc_mock.listar.return_value = docs
+        repo_doc_mock.iterar.return_value = docs
         use_case = GerarRelatorio(repo_doc_mock)
 
         dados = use_case._coletar_dados()
@@ -112,7 +112,7 @@ class TestGerarRelatorio:
             doc.data_original = None
             docs.append(doc)
 
-        repo_doc_mock.listar.return_value = docs
+        repo_doc_mock.iterar.return_value = docs
         use_case = GerarRelatorio(repo_doc_mock)
 
         dados = use_case._coletar_dados()
@@ -133,7 +133,7 @@ class TestGerarRelatorio:
             doc.tem_anexos = False
             docs.append(doc)
 
-        repo_doc_mock.listar.return_value = docs
+        repo_doc_mock.iterar.return_value = docs
         use_case = GerarRelatorio(repo_doc_mock)
 
         dados = use_case._coletar_dados()
@@ -214,7 +214,7 @@ class TestGerarRelatorio:
             doc.data_original = None
             docs.append(doc)
 
-        repo_doc_mock.listar.return_value = docs
+        repo_doc_mock.iterar.return_value = docs
         use_case = GerarRelatorio(repo_doc_mock)
 
         # Não deve lançar exceção
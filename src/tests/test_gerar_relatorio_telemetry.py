@@ -30,7 +30,7 @@ class TestGerarRelatorioTelemetry:
             doc.tem_anexos = False
             doc.data_original = "1934"
             docs.append(doc)
-        repo.listar.return_value = docs
+        repo.iterar.return_value = docs
         return repo
 
     def test_telemetria_coletar_dados(self):
@@ -0,0 +1,150 @@
+"""
+Testes para o backup online do banco.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.infrastructure.persistence.backup as backup_module
+from src.domain.entities.documento import Documento
+from src.infrastructure.persistence.backup import (
+    copiar_online,
+    criar_backup,
+    listar_backups,
+    verificar,
+)
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.pool import fechar_pools
+from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repositório em banco temporário com alguns documentos."""
+    repo = SQLiteDocumentoRepository(db_path=str(tmp_path / "origem.db"))
+    with repo._conexao() as conn:
+        aplicar_migracoes(conn)
+
+    for i in range(30):
+        repo.salvar(
+            Documento(
+                centro="lencenter",
+                titulo=f"Doc {i}",
+                url=f"http://teste/{i}",
+                texto="Texto do documento. " * 200,
+                data_coleta=datetime.now(),
+            )
+        )
+    yield repo
+    fechar_pools()
+
+
+def _contar(caminho) -> int:
+    conn = sqlite3.connect(caminho)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM documentos").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestBackup:
+    """Testes do backup online."""
+
+    def setup_method(self):
+        """Reconfigura o módulo antes de cada teste."""
+        backup_module._telemetry = None
+
+    def test_copia_em_passos(self, repo, tmp_path):
+        """A cópia deve avançar em vários passos e reproduzir o banco."""
+        passos = []
+        destino = tmp_path / "copia.db"
+
+        paginas = copiar_online(
+            destino,
+            repo.db_path,
+            paginas_por_passo=4,
+            pausa=0,
+            progresso=lambda restantes, total: passos.append(restantes),
+        )
+
+        assert paginas > 4
+        assert len(passos) > 1
+        assert passos[-1] == 0
+        assert _contar(destino) == 30
+
+    def test_criar_backup_compactado_e_verificado(self, repo, tmp_path):
+        """O backup final deve estar íntegro, sem arquivos temporários."""
+        diretorio = tmp_path / "backups"
+
+        resultado = criar_backup(diretorio, origem=repo.db_path, pausa=0)
+
+        assert resultado.integro
+        assert resultado.compactado
+        assert resultado.caminho.name.startswith("showtrials_")
+        assert resultado.caminho.suffix == ".db"
+        assert resultado.tamanho_bytes == resultado.caminho.stat().st_size
+        assert _contar(resultado.caminho) == 30
+        assert list(diretorio.iterdir()) == [resultado.caminho]
+
+    def test_backups_no_mesmo_segundo_nao_se_sobrescrevem(self, repo, tmp_path):
+        """Backups seguidos devem gerar arquivos distintos."""
+        primeiro = criar_backup(tmp_path, origem=repo.db_path, pausa=0)
+        segundo = criar_backup(tmp_path, origem=repo.db_path, compactado=False, pausa=0)
+
+        assert primeiro.caminho != segundo.caminho
+        assert set(listar_backups(tmp_path)) == {primeiro.caminho, segundo.caminho}
+
+    def test_escritas_durante_o_backup(self, repo, tmp_path):
+        """Escritas concorrentes não devem falhar enquanto o backup avança."""
+        erros = []
+
+        def escrever(restantes, total):
+            def salvar():
+                try:
+                    repo.salvar(
+                        Documento(
+                            centro="moscenter",
+                            titulo=f"Novo {restantes}",
+                            url=f"http://novo/{restantes}",
+                            texto="Escrito durante o backup.",
+                            data_coleta=datetime.now(),
+                        )
+                    )
+                except Exception as e:  # pragma: no cover - falha reportada abaixo
+                    erros.append(e)
+
+            t = threading.Thread(target=salvar)
+            t.start()
+            t.join(timeout=5)
+
+        resultado = criar_backup(
+            tmp_path, origem=repo.db_path, paginas_por_passo=8, pausa=0, progresso=escrever
+        )
+
+        assert erros == []
+        assert resultado.integro
+        # Snapshot do início do backup: as escritas concorrentes não entram na cópia
+        assert _contar(resultado.caminho) == 30
+        assert _contar(repo.db_path) > 30
+
+    def test_verificar_arquivo_invalido(self, tmp_path):
+        """Arquivo que não é banco SQLite deve ser reportado como problema."""
+        invalido = tmp_path / "invalido.db"
+        invalido.write_bytes(b"isto nao e um banco sqlite" * 100)
+
+        assert verificar(invalido) != []
+
+    def test_telemetria(self, repo, tmp_path):
+        """Deve registrar início, conclusão e duração."""
+        telemetry = MagicMock()
+        backup_module.configure_telemetry(telemetry)
+
+        criar_backup(tmp_path, origem=repo.db_path, pausa=0)
+
+        telemetry.increment.assert_any_call("backup.iniciado")
+        telemetry.increment.assert_any_call("backup.concluido")
+        telemetry.timing.assert_called_once()
@@ -0,0 +1,55 @@
+"""
+Testes da divisão de textos longos em blocos.
+"""
+
+import pytest
+
+from src.infrastructure.analysis.blocos import dividir_em_blocos
+
+
+def _juntar(blocos):
+    return "".join(bloco for _, bloco in blocos)
+
+
+def test_texto_curto_em_um_bloco():
+    """Texto dentro do limite (inclusive vazio) é um único bloco."""
+    assert list(dividir_em_blocos("Короткий текст.", 100)) == [(0, "Короткий текст.")]
+    assert list(dividir_em_blocos("", 100)) == [(0, "")]
+
+
+def test_blocos_cobrem_o_texto_com_deslocamentos():
+    """Os blocos são contíguos, respeitam o limite e reconstituem o texto."""
+    texto = "\n".join(f"Абзац {i}. Первое предложение. Второе предложение." for i in range(50))
+
+    blocos = list(dividir_em_blocos(texto, 200))
+
+    assert _juntar(blocos) == texto
+    for deslocamento, bloco in blocos:
+        assert texto[deslocamento : deslocamento + len(bloco)] == bloco
+        assert 0 < len(bloco) <= 200
+
+
+def test_corte_prefere_fim_de_paragrafo():
+    """Com parágrafo disponível, o bloco termina na quebra de linha."""
+    texto = "\n".join(["слово " * 15] * 10)
+
+    blocos = list(dividir_em_blocos(texto, 250))
+
+    assert all(bloco.endswith("\n") for _, bloco in blocos[:-1])
+    assert _juntar(blocos) == texto
+
+
+def test_paragrafo_gigante_corta_em_frase_ou_espaco():
+    """Parágrafo maior que o bloco é cortado entre frases, depois entre palavras."""
+    frases = list(dividir_em_blocos("Одна фраза здесь. " * 20, 100))
+    palavras = list(dividir_em_blocos("слово " * 50, 100))
+    sem_espacos = list(dividir_em_blocos("я" * 250, 100))
+
+    assert all(bloco.endswith(". ") for _, bloco in frases[:-1])
+    assert all(bloco.endswith(" ") for _, bloco in palavras[:-1])
+    assert [len(bloco) for _, bloco in sem_espacos] == [100, 100, 50]
+
+
+def test_tamanho_invalido():
+    with pytest.raises(ValueError):
+        list(dividir_em_blocos("texto", 0))
@@ -0,0 +1,294 @@
+"""
+Testes para o cache de entidades na frente dos repositórios.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.infrastructure.persistence.cache_repository as cache_module
+from src.domain.entities.documento import Documento
+from src.domain.entities.traducao import Traducao
+from src.domain.interfaces.repositories import RepositorioDocumento
+from src.domain.interfaces.repositorio_traducao import RepositorioTraducao
+from src.domain.value_objects.resultado_upsert import ResultadoUpsert
+from src.infrastructure.config import CacheConfig
+from src.infrastructure.persistence.cache_repository import (
+    TAMANHO_BASE,
+    CacheDocumentoRepository,
+    CacheLRU,
+    CacheTraducaoRepository,
+)
+
+
+def _documento(id: int, texto: str = "Texto do documento") -> Documento:
+    return Documento(
+        id=id,
+        centro="lencenter",
+        titulo=f"Documento {id}",
+        url=f"http://teste/{id}",
+        texto=texto,
+        data_coleta=datetime(2024, 1, 1),
+        envolvidos=["Nikolaev"],
+    )
+
+
+def _traducao(id: int, documento_id: int, idioma: str) -> Traducao:
+    return Traducao(
+        id=id,
+        documento_id=documento_id,
+        idioma=idioma,
+        texto_traduzido=f"Translation {id}",
+        data_traducao=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def repo_mock():
+    """Repositório de documentos simulado."""
+    repo = MagicMock(spec=RepositorioDocumento)
+    repo.buscar_por_id.side_effect = lambda id, carregar_texto=True: _documento(id)
+    return repo
+
+
+@pytest.fixture
+def repo_trad_mock():
+    """Repositório de traduções simulado."""
+    repo = MagicMock(spec=RepositorioTraducao)
+    repo.listar_por_documento.side_effect = lambda doc_id: [
+        _traducao(1, doc_id, "en"),
+        _traducao(2, doc_id, "pt"),
+    ]
+    return repo
+
+
+class TestCacheLRU:
+    """Testes do cache LRU limitado por bytes."""
+
+    def setup_method(self):
+        """Reconfigura o módulo antes de cada teste."""
+        cache_module._telemetry = None
+
+    def test_descarta_menos_usado_ao_exceder_bytes(self):
+        """Entradas menos usadas saem quando o limite de bytes é excedido."""
+        cache = CacheLRU(max_bytes=300)
+        cache.guardar("a", 1, 100, cache.marca())
+        cache.guardar("b", 2, 100, cache.marca())
+        cache.obter("a")
+        cache.guardar("c", 3, 150, cache.marca())
+
+        assert cache.obter("b") is None
+        assert cache.obter("a") == 1
+        assert cache.obter("c") == 3
+        assert cache.estatisticas()["bytes"] == 250
+        assert cache.estatisticas()["descartadas"] == 1
+
+    def test_ignora_entrada_maior_que_o_limite(self):
+        """Valor maior que o limite não deve esvaziar o cache."""
+        cache = CacheLRU(max_bytes=100)
+        cache.guardar("a", 1, 50, cache.marca())
+        cache.guardar("grande", 2, 500, cache.marca())
+
+        assert cache.obter("a") == 1
+        assert cache.obter("grande") is None
+
+    def test_expira_por_ttl(self, monkeypatch):
+        """Entradas vencidas contam como miss."""
+        agora = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: agora[0])
+        cache = CacheLRU(max_bytes=1000, ttl=60)
+        cache.guardar("a", 1, 10, cache.marca())
+
+        agora[0] += 59
+        assert cache.obter("a") == 1
+        agora[0] += 2
+        assert cache.obter("a") is None
+        assert cache.estatisticas()["expiradas"] == 1
+        assert cache.estatisticas()["bytes"] == 0
+
+    def test_leitura_anterior_a_invalidacao_nao_e_guardada(self):
+        """Valor lido antes de uma escrita concorrente é descartado."""
+        cache = CacheLRU(max_bytes=1000)
+        marca = cache.marca()
+        cache.invalidar("a")
+        cache.guardar("a", "antigo", 10, marca)
+
+        assert cache.obter("a") is None
+
+    def test_telemetria(self):
+        """Deve registrar hits e misses."""
+        telemetry = MagicMock()
+        cache_module.configure_telemetry(telemetry)
+        cache = CacheLRU(max_bytes=1000)
+
+        cache.obter("a")
+        cache.guardar("a", 1, 10, cache.marca())
+        cache.obter("a")
+
+        telemetry.increment.assert_any_call("cache_repositorio.miss")
+        telemetry.increment.assert_any_call("cache_repositorio.hit")
+
+
+class TestCacheDocumentoRepository:
+    """Testes do decorador de documentos."""
+
+    def test_segunda_busca_vem_do_cache(self, repo_mock):
+        """Busca repetida por id não deve consultar o repositório."""
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+
+        primeiro = repo.buscar_por_id(1)
+        segundo = repo.buscar_por_id(1)
+
+        assert repo_mock.buscar_por_id.call_count == 1
+        assert segundo.titulo == primeiro.titulo
+        assert repo.cache.estatisticas()["hits"] == 1
+
+    def test_entrega_copias(self, repo_mock):
+        """Alterar o documento devolvido não altera a entrada do cache."""
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+
+        doc = repo.buscar_por_id(1)
+        doc.tipo = "interrogatorio"
+        doc.envolvidos.append("Kirov")
+
+        novo = repo.buscar_por_id(1)
+        assert novo.tipo is None
+        assert novo.envolvidos == ["Nikolaev"]
+
+    def test_tamanho_pelo_texto(self, repo_mock):
+        """Documentos com texto longo ocupam mais bytes."""
+        repo_mock.buscar_por_id.side_effect = lambda id, carregar_texto=True: _documento(
+            id, "Текст " * 1000
+        )
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+
+        repo.buscar_por_id(1)
+
+        assert repo.cache.estatisticas()["bytes"] > TAMANHO_BASE + 6000
+
+    def test_entrada_sem_texto_substituida_quando_texto_pedido(self, repo_mock):
+        """Documento sem texto no cache não atende pedido com texto."""
+        repo_mock.buscar_por_id.side_effect = lambda id, carregar_texto=True: (
+            _documento(id) if carregar_texto else _documento(id).adiar_texto(lambda: "x")
+        )
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+
+        repo.buscar_por_id(1, carregar_texto=False)
+        repo.buscar_por_id(1, carregar_texto=False)
+        assert repo_mock.buscar_por_id.call_count == 1
+
+        assert repo.buscar_por_id(1).texto_carregado
+        assert repo_mock.buscar_por_id.call_count == 2
+        assert repo.buscar_por_id(1, carregar_texto=False).texto_carregado
+        assert repo_mock.buscar_por_id.call_count == 2
+
+    def test_obter_texto_do_cache(self, repo_mock):
+        """obter_texto usa o documento completo em cache."""
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+        repo.buscar_por_id(1)
+
+        assert repo.obter_texto(1) == "Texto do documento"
+        repo_mock.obter_texto.assert_not_called()
+
+    def test_salvar_invalida(self, repo_mock):
+        """salvar deve descartar a entrada do documento."""
+        repo_mock.salvar.return_value = 1
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+        doc = repo.buscar_por_id(1)
+
+        repo.salvar(doc)
+        repo.buscar_por_id(1)
+
+        assert repo_mock.buscar_por_id.call_count == 2
+
+    def test_salvar_em_lote_e_upsert_invalidam(self, repo_mock):
+        """Escritas em lote descartam as entradas afetadas."""
+        repo_mock.salvar_em_lote.return_value = [1]
+        repo_mock.upsert_por_url.return_value = ResultadoUpsert(ids=[2], atualizados=1)
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+        repo.buscar_por_id(1)
+        repo.buscar_por_id(2)
+
+        repo.salvar_em_lote(iter([_documento(1)]))
+        repo.upsert_por_url([_documento(2)])
+        repo.buscar_por_id(1)
+        repo.buscar_por_id(2)
+
+        assert repo_mock.buscar_por_id.call_count == 4
+        assert len(repo_mock.salvar_em_lote.call_args[0][0]) == 1
+
+    def test_remover_invalida_documento_e_traducoes(self, repo_mock, repo_trad_mock):
+        """remover descarta o documento e as traduções dele (cache compartilhado)."""
+        cache = CacheLRU(max_bytes=10**6)
+        repo = CacheDocumentoRepository(repo_mock, cache)
+        repo_trad = CacheTraducaoRepository(repo_trad_mock, cache)
+        repo.buscar_por_id(1)
+        repo_trad.listar_por_documento(1)
+
+        repo.remover(1)
+
+        assert cache.estatisticas()["itens"] == 0
+
+    def test_delega_demais_operacoes(self, repo_mock):
+        """Operações sem cache e atributos da implementação são delegados."""
+        repo_mock.contar.return_value = 42
+        repo_mock.db_path = "/tmp/banco.db"
+        repo = CacheDocumentoRepository(repo_mock, CacheLRU(max_bytes=10**6))
+
+        assert repo.contar(centro="lencenter") == 42
+        assert repo.db_path == "/tmp/banco.db"
+        repo_mock.contar.assert_called_once_with(centro="lencenter", tipo=None)
+
+
+class TestCacheTraducaoRepository:
+    """Testes do decorador de traduções."""
+
+    def test_busca_por_documento_usa_lista_em_cache(self, repo_trad_mock):
+        """buscar_por_documento e contar são respondidos pela lista em cache."""
+        repo = CacheTraducaoRepository(repo_trad_mock, CacheLRU(max_bytes=10**6))
+
+        assert repo.buscar_por_documento(7, "pt").id == 2
+        assert repo.buscar_por_documento(7, "en").id == 1
+        assert repo.buscar_por_documento(7, "fr") is None
+        assert repo.contar_por_documento(7) == 2
+
+        repo_trad_mock.listar_por_documento.assert_called_once_with(7)
+        repo_trad_mock.buscar_por_documento.assert_not_called()
+        repo_trad_mock.contar_por_documento.assert_not_called()
+
+    def test_salvar_invalida_documento(self, repo_trad_mock):
+        """Nova tradução descarta a lista do documento."""
+        repo_trad_mock.salvar.return_value = 3
+        repo = CacheTraducaoRepository(repo_trad_mock, CacheLRU(max_bytes=10**6))
+        repo.listar_por_documento(7)
+
+        repo.salvar(_traducao(None, 7, "fr"))
+        repo.listar_por_documento(7)
+
+        assert repo_trad_mock.listar_por_documento.call_count == 2
+
+    def test_buscar_por_id_nao_guardado(self, repo_trad_mock):
+        """Busca por id é delegada: nenhuma entrada sobrevive à remoção do documento."""
+        repo_trad_mock.buscar_por_id.side_effect = lambda id: _traducao(id, 7, "en")
+        cache = CacheLRU(max_bytes=10**6)
+        repo = CacheTraducaoRepository(repo_trad_mock, cache)
+
+        repo.buscar_por_id(5)
+        repo.buscar_por_id(5)
+
+        assert repo_trad_mock.buscar_por_id.call_count == 2
+        assert cache.estatisticas()["itens"] == 0
+
+
+class TestCacheConfig:
+    """Testes da configuração do cache."""
+
+    def test_from_dict(self):
+        """Valores do config.yaml e limite em bytes."""
+        config = CacheConfig.from_dict({"enabled": True, "max_mb": 2, "ttl": None})
+
+        assert config.enabled
+        assert config.max_bytes == 2 * 1024 * 1024
+        assert config.ttl is None
+        assert CacheConfig.from_dict(config.to_dict()) == config
@@ -0,0 +1,48 @@
+"""
+Testes para o armazenamento comprimido de textos.
+"""
+
+import sqlite3
+
+from src.infrastructure.persistence.compressao import (
+    comprimir,
+    descomprimir,
+    para_armazenar,
+    registrar_funcoes,
+    tamanho_texto,
+)
+
+
+class TestCompressao:
+    """Testes para compressão/descompressão de textos."""
+
+    def test_ida_e_volta(self):
+        """Texto comprimido deve voltar idêntico e menor."""
+        texto = "Протокол допроса Л.В. Николаева. " * 200
+
+        dados = comprimir(texto)
+
+        assert isinstance(dados, bytes)
+        assert len(dados) < len(texto.encode("utf-8")) / 5
+        assert descomprimir(dados) == texto
+        assert tamanho_texto(dados) == len(texto)
+
+    def test_texto_em_claro_passa_direto(self):
+        """Valores TEXT e None não são alterados."""
+        assert descomprimir("Николаев") == "Николаев"
+        assert descomprimir(None) is None
+        assert tamanho_texto("Николаев") == 8
+        assert para_armazenar("Николаев", comprimido=False) == "Николаев"
+        assert para_armazenar("", comprimido=True) == ""
+
+    def test_funcoes_sql(self):
+        """Funções registradas devem funcionar dentro do SQLite."""
+        conn = sqlite3.connect(":memory:")
+        registrar_funcoes(conn)
+
+        linha = conn.execute(
+            "SELECT descomprimir(?), tamanho_texto(?)", (comprimir("Киров"), comprimir("Киров"))
+        ).fetchone()
+        conn.close()
+
+        assert linha == ("Киров", 5)
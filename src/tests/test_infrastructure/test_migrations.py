@@ -11,10 +11,17 @@ import pytest
 
 from src.infrastructure.config.settings import settings
 from src.infrastructure.persistence.migrations import (
+    INDICES_DOCUMENTOS,
+    VERSAO_ESQUEMA,
+    aplicar_migracoes,
+    conectar,
+    configurar_compressao,
+    consultas_repositorios,
     criar_tabelas,
     estatisticas_banco,
     migrar_banco_existente,
     verificar_integridade,
+    verificar_planos,
 )
 
 
@@ -51,6 +58,51 @@ class TestMigrations:
 
         conn.close()
 
+    def test_aplicar_migracoes_registra_versoes(self, db_temporario):
+        """Migrações devem ser aplicadas uma única vez e registradas."""
+        aplicadas = aplicar_migracoes()
+
+        assert aplicadas == list(range(1, VERSAO_ESQUEMA + 1))
+        assert aplicar_migracoes() == []
+
+        conn = sqlite3.connect(db_temporario)
+        versoes = [row[0] for row in conn.execute("SELECT versao FROM schema_version")]
+        conn.close()
+        assert versoes == list(range(1, VERSAO_ESQUEMA + 1))
+
+    def test_verificar_integridade_migracoes_pendentes(self, db_temporario):
+        """Banco com versão antiga deve ser apontado."""
+        aplicar_migracoes()
+        conn = sqlite3.connect(db_temporario)
+        conn.execute("DELETE FROM schema_version WHERE versao = ?", (VERSAO_ESQUEMA,))
+        conn.commit()
+        conn.close()
+
+        problemas = verificar_integridade()
+
+        assert any("Schema na versão" in p for p in problemas)
+
+    def test_configurar_compressao_reescreve_textos(self, db_temporario):
+        """Ativar/desativar a compressão deve reescrever linhas e manter a busca."""
+        aplicar_migracoes()
+        conn = conectar()
+        conn.execute(
+            "INSERT INTO documentos (centro, titulo, url, texto, data_coleta) "
+            "VALUES ('lencenter', 'Протокол', 'url1', 'Показания Николаева', '2024-01-01')"
+        )
+        conn.commit()
+
+        assert configurar_compressao(conn, ativa=True) == 1
+        assert conn.execute("SELECT typeof(texto) FROM documentos").fetchone()[0] == "blob"
+        busca = "SELECT rowid FROM documentos_fts WHERE documentos_fts MATCH 'николаева'"
+        assert conn.execute(busca).fetchall() == [(1,)]
+        assert configurar_compressao(conn, ativa=True) == 0
+
+        assert configurar_compressao(conn, ativa=False) == 1
+        assert conn.execute("SELECT texto FROM documentos").fetchone()[0] == "Показания Николаева"
+        assert conn.execute(busca).fetchall() == [(1,)]
+        conn.close()
+
     def test_migrar_banco_existente(self, db_temporario):
         """Deve adicionar colunas de metadados."""
         # Criar tabela sem metadados
@@ -95,6 +147,62 @@ class TestMigrations:
 
         assert problemas == []
 
+    def test_migracao_cria_indices(self, db_temporario):
+        """Migração deve criar os índices secundários de documentos."""
+        criar_tabelas()
+        migrar_banco_existente()
+
+        conn = sqlite3.connect(db_temporario)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indices = {row[0] for row in cursor.fetchall()}
+        conn.close()
+
+        assert set(INDICES_DOCUMENTOS) <= indices
+
+    def test_verificar_integridade_aponta_scan(self, db_temporario):
+        """Consulta sem índice deve ser apontada pelo verificador de planos."""
+        criar_tabelas()
+        migrar_banco_existente()
+
+        conn = sqlite3.connect(db_temporario)
+        conn.execute("DROP INDEX idx_documentos_tipo")
+        conn.commit()
+        conn.close()
+
+        problemas = verificar_integridade()
+
+        assert any("documentos.contar_tipo" in p and "SCAN" in p for p in problemas)
+
+    def test_consultas_incluem_varreduras(self):
+        """Consultas que percorrem a tabela por definição também são verificadas."""
+        consultas = consultas_repositorios()
+
+        for nome in ("documentos.contar", "documentos.listar", "documentos.agregados"):
+            assert consultas[nome].varredura
+        assert not consultas["documentos.contar_tipo"].varredura
+        assert not consultas["documentos.agregados_centro"].varredura
+
+    def test_verificar_planos_banco_migrado(self, db_temporario):
+        """Banco migrado: todas as consultas dos repositórios executam e usam índices."""
+        aplicar_migracoes()
+
+        conn = sqlite3.connect(db_temporario)
+        try:
+            assert verificar_planos(conn.cursor()) == []
+        finally:
+            conn.close()
+
+    def test_verificar_planos_valida_varreduras(self, db_temporario):
+        """Consulta de varredura inválida (coluna removida) é apontada."""
+        conn = sqlite3.connect(db_temporario)
+        conn.execute("CREATE TABLE documentos (id INTEGER PRIMARY KEY, centro TEXT)")
+
+        problemas = verificar_planos(conn.cursor())
+        conn.close()
+
+        assert any("documentos.agregados'" in p and "inválida" in p for p in problemas)
+
     def test_verificar_integridade_banco_incompleto(self, db_temporario):
         """Banco incompleto deve apontar problemas."""
         conn = sqlite3.connect(db_temporario)
@@ -140,3 +248,118 @@ class TestMigrations:
         assert stats["total_docs"] == 5
         assert "lencenter" in stats["docs_por_centro"]
         assert "moscenter" in stats["docs_por_centro"]
+
+    def test_criar_tabelas_indexa_documentos_existentes(self, db_temporario):
+        """Índice de busca criado depois deve incluir documentos já existentes."""
+        conn = sqlite3.connect(db_temporario)
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE documentos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                centro TEXT NOT NULL,
+                titulo TEXT NOT NULL,
+                data_original TEXT,
+                url TEXT UNIQUE NOT NULL,
+                texto TEXT NOT NULL,
+                data_coleta TEXT NOT NULL
+            )
+        """
+        )
+        cursor.execute(
+            "INSERT INTO documentos (centro, titulo, url, texto, data_coleta) "
+            "VALUES ('lencenter', 'Протокол допроса', 'url1', 'Николаев', '2024-01-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        criar_tabelas()
+
+        conn = sqlite3.connect(db_temporario)
+        cursor = conn.cursor()
+        cursor.execute("SELECT rowid FROM documentos_fts WHERE documentos_fts MATCH 'николаев'")
+        assert cursor.fetchall() == [(1,)]
+        conn.close()
+
+    def test_migracao_preenche_contagens_do_texto(self, db_temporario):
+        """Documentos anteriores às colunas de contagem devem ser preenchidos."""
+        conn = sqlite3.connect(db_temporario)
+        conn.execute(
+            """
+            CREATE TABLE documentos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                centro TEXT NOT NULL,
+                titulo TEXT NOT NULL,
+                data_original TEXT,
+                url TEXT UNIQUE NOT NULL,
+                texto TEXT NOT NULL,
+                data_coleta TEXT NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            "INSERT INTO documentos (centro, titulo, url, texto, data_coleta) "
+            "VALUES ('lencenter', 'Протокол', 'url1', ?, '2024-01-01')",
+            ("Первый абзац.\n\nВторой абзац",),
+        )
+        conn.commit()
+        conn.close()
+
+        aplicar_migracoes()
+
+        conn = sqlite3.connect(db_temporario)
+        contagens = conn.execute(
+            "SELECT num_caracteres, num_palavras, num_paragrafos FROM documentos"
+        ).fetchone()
+        hash_conteudo = conn.execute("SELECT hash_conteudo FROM documentos").fetchone()[0]
+        conn.close()
+        assert contagens == (27, 4, 2)
+        assert len(hash_conteudo) == 64
+
+    def test_migracao_indexa_pessoas_existentes(self, db_temporario):
+        """Pessoas dos documentos já gravados devem entrar em documento_pessoas."""
+        aplicar_migracoes()
+        conn = conectar()
+        conn.execute(
+            "INSERT INTO documentos (centro, titulo, url, texto, data_coleta, "
+            "pessoa_principal, envolvidos) VALUES ('lencenter', 'Протокол', 'url1', 'Texto', "
+            "'2024-01-01', 'Л.В. Николаев', 'Л.В. Николаев, М.Н. Волкова')"
+        )
+        conn.execute("DELETE FROM schema_version WHERE versao >= 6")
+        conn.commit()
+        conn.close()
+
+        assert aplicar_migracoes() == list(range(6, VERSAO_ESQUEMA + 1))
+
+        conn = sqlite3.connect(db_temporario)
+        vinculos = conn.execute(
+            "SELECT p.nome, dp.papel FROM documento_pessoas dp "
+            "JOIN pessoas p ON p.id = dp.pessoa_id ORDER BY p.nome, dp.papel"
+        ).fetchall()
+        conn.close()
+        assert vinculos == [
+            ("Л.В. Николаев", "envolvido"),
+            ("Л.В. Николаев", "principal"),
+            ("М.Н. Волкова", "envolvido"),
+        ]
+
+    def test_migracao_registra_linhas_existentes_no_log(self, db_temporario):
+        """Documentos anteriores ao log devem aparecer a partir da marca 0."""
+        aplicar_migracoes()
+        conn = conectar()
+        conn.execute(
+            "INSERT INTO documentos (centro, titulo, url, texto, data_coleta) "
+            "VALUES ('lencenter', 'Протокол', 'url1', 'Texto', '2024-01-01')"
+        )
+        conn.execute("DELETE FROM schema_version WHERE versao >= 8")
+        conn.commit()
+        conn.close()
+
+        aplicar_migracoes()
+
+        conn = sqlite3.connect(db_temporario)
+        log = conn.execute("SELECT tabela, registro_id, operacao FROM alteracoes").fetchall()
+        updated_at = conn.execute("SELECT updated_at FROM documentos").fetchone()[0]
+        conn.close()
+        assert log == [("documentos", 1, "insercao")]
+        assert updated_at == "2024-01-01"
@@ -0,0 +1,111 @@
+"""
+Testes para o pool de conexões SQLite.
+"""
+
+import tempfile
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.infrastructure.persistence.pool as pool_module
+from src.infrastructure.persistence.pool import PoolConexoes, fechar_pools, obter_pool
+
+
+@pytest.fixture
+def db_path():
+    """Fixture que cria um arquivo de banco temporário."""
+    with tempfile.NamedTemporaryFile(suffix=".db") as tmp:
+        yield tmp.name
+        fechar_pools()
+
+
+class TestPoolConexoes:
+    """Testes para o pool de conexões."""
+
+    def setup_method(self):
+        """Reconfigura o módulo antes de cada teste."""
+        pool_module._telemetry = None
+
+    def test_reutiliza_conexao_na_mesma_thread(self, db_path):
+        """Mesma thread deve receber a mesma conexão."""
+        pool = PoolConexoes(db_path)
+
+        assert pool.obter() is pool.obter()
+        assert pool.estatisticas() == {"hits": 1, "misses": 1, "conexoes": 1}
+        pool.fechar()
+
+    def test_conexao_por_thread(self, db_path):
+        """Threads diferentes devem receber conexões diferentes."""
+        pool = PoolConexoes(db_path)
+        principal = pool.obter()
+        outras = []
+
+        thread = threading.Thread(target=lambda: outras.append(pool.obter()))
+        thread.start()
+        thread.join()
+
+        assert outras[0] is not principal
+        assert pool.misses == 2
+        pool.fechar()
+
+    def test_pragmas_aplicados(self, db_path):
+        """Conexão deve usar WAL, synchronous=NORMAL e cache configurado."""
+        pool = PoolConexoes(db_path, cache_size=-2000, mmap_size=0)
+        conn = pool.obter()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2000
+        pool.fechar()
+
+    def test_rollback_em_erro(self, db_path):
+        """Erro dentro do contexto deve desfazer a transação."""
+        pool = PoolConexoes(db_path)
+        with pool.conexao() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with pytest.raises(RuntimeError):
+            with pool.conexao() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("falha")
+
+        with pool.conexao() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        pool.fechar()
+
+    def test_bloco_aninhado_nao_encerra_transacao_externa(self, db_path):
+        """Só o bloco mais externo faz commit/rollback."""
+        pool = PoolConexoes(db_path)
+        with pool.conexao() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with pytest.raises(RuntimeError):
+            with pool.conexao() as externa:
+                externa.execute("INSERT INTO t VALUES (1)")
+                with pool.conexao() as interna:
+                    assert interna is externa
+                    interna.execute("INSERT INTO t VALUES (2)")
+                assert externa.in_transaction
+                raise RuntimeError("falha")
+
+        with pool.conexao() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        pool.fechar()
+
+    def test_obter_pool_compartilhado(self, db_path):
+        """Repositórios do mesmo banco devem compartilhar o pool."""
+        assert obter_pool(db_path) is obter_pool(db_path)
+
+    def test_telemetria_hit_miss(self, db_path):
+        """Pool deve reportar hits e misses à telemetria."""
+        mock_telemetry = MagicMock()
+        pool_module.configure_telemetry(telemetry_instance=mock_telemetry)
+
+        pool = PoolConexoes(db_path)
+        pool.obter()
+        pool.obter()
+
+        mock_telemetry.increment.assert_any_call("sqlite_pool.miss")
+        mock_telemetry.increment.assert_any_call("sqlite_pool.hit")
+        pool.fechar()
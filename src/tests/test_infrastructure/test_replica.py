@@ -0,0 +1,247 @@
+"""
+Testes para a réplica de leitura em memória.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.infrastructure.persistence.replica as replica_module
+from src.domain.entities.documento import Documento
+from src.domain.entities.traducao import Traducao
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.pool import fechar_pools, obter_pool
+from src.infrastructure.persistence.replica import PoolReplica, ativar_replica
+from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
+from src.infrastructure.persistence.sqlite_traducao_repository import SQLiteTraducaoRepository
+
+
+def _documento(i: int, **kwargs) -> Documento:
+    return Documento(
+        centro="lencenter",
+        titulo=f"Interrogatório {i}",
+        url=f"http://teste/{i}",
+        texto=f"Depoimento de Nikolaev número {i}",
+        data_coleta=datetime.now(),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Banco em disco com schema e alguns documentos."""
+    caminho = str(tmp_path / "showtrials.db")
+    repo = SQLiteDocumentoRepository(db_path=caminho)
+    with repo._conexao() as conn:
+        aplicar_migracoes(conn)
+    for i in range(5):
+        repo.salvar(_documento(i))
+    fechar_pools()
+    yield caminho
+    fechar_pools()
+
+
+@pytest.fixture
+def repo(db_path):
+    """Repositório servido pela réplica."""
+    ativar_replica(db_path)
+    return SQLiteDocumentoRepository(db_path=db_path)
+
+
+def _contar_arquivo(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM documentos").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestReplica:
+    """Testes do pool com réplica em memória."""
+
+    def setup_method(self):
+        """Reconfigura o módulo antes de cada teste."""
+        replica_module._telemetry = None
+
+    def test_repositorio_usa_pool_replica(self, repo, db_path):
+        """ativar_replica deve registrar o pool usado pelos repositórios."""
+        assert isinstance(obter_pool(db_path), PoolReplica)
+        assert repo.contar() == 5
+
+    def test_leituras_vem_da_replica(self, repo, db_path):
+        """Escritas externas no arquivo só aparecem após recarregar."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM documentos WHERE url = 'http://teste/0'")
+        conn.commit()
+        conn.close()
+
+        assert repo.contar() == 5
+
+        obter_pool(db_path).recarregar()
+
+        assert repo.contar() == 4
+
+    def test_escrita_vai_para_arquivo_e_replica(self, repo, db_path):
+        """salvar deve gravar no arquivo e refletir na réplica."""
+        doc_id = repo.salvar(_documento(10, pessoa_principal="L.V. Nikolaev"))
+
+        assert _contar_arquivo(db_path) == 6
+        assert repo.buscar_por_id(doc_id).titulo == "Interrogatório 10"
+        # Triggers também rodam na réplica (índice de busca e de pessoas)
+        assert doc_id in [r.documento_id for r in repo.buscar_texto("Interrogatório 10")]
+        assert [d.id for d in repo.documentos_por_pessoa("L.V. Nikolaev")] == [doc_id]
+        assert obter_pool(db_path).estatisticas()["transacoes_replicadas"] == 1
+
+    def test_salvar_traducao_retorna_id(self, repo, db_path):
+        """lastrowid do INSERT sobrevive ao executemany do log de alterações."""
+        repo_trad = SQLiteTraducaoRepository(db_path=db_path)
+        doc_id = repo.listar()[0].id
+
+        ids = [
+            repo_trad.salvar(
+                Traducao(
+                    documento_id=doc_id,
+                    idioma=idioma,
+                    texto_traduzido=f"Testimony ({idioma})",
+                    data_traducao=datetime.now(),
+                )
+            )
+            for idioma in ("en", "pt", "fr")
+        ]
+
+        assert None not in ids
+        assert len(set(ids)) == 3
+        assert repo_trad.buscar_por_id(ids[1]).idioma == "pt"
+
+    def test_le_as_proprias_escritas_na_transacao(self, repo):
+        """upsert lê ids gravados na mesma transação."""
+        resultado = repo.upsert_por_url([_documento(1), _documento(20)])
+
+        assert resultado.inseridos == 1
+        assert resultado.inalterados == 1
+        assert repo.buscar_por_id(resultado.ids[1]).url == "http://teste/20"
+
+    def test_rollback_nao_altera_arquivo_nem_replica(self, repo, db_path):
+        """Erro na transação desfaz a escrita e libera a trava."""
+        with pytest.raises(RuntimeError):
+            with repo._conexao() as conn:
+                conn.execute("DELETE FROM documentos")
+                raise RuntimeError("falha")
+
+        assert _contar_arquivo(db_path) == 5
+        assert repo.contar() == 5
+
+        repo.salvar(_documento(30))
+        assert repo.contar() == 6
+
+    def test_bloco_aninhado_nao_replica_transacao_parcial(self, repo, db_path):
+        """Bloco interno não libera a trava de escrita nem reaplica a transação."""
+        pool = obter_pool(db_path)
+
+        with pytest.raises(RuntimeError):
+            with pool.conexao() as externa:
+                externa.execute("DELETE FROM documentos WHERE url = 'http://teste/0'")
+                with pool.conexao() as interna:
+                    assert interna is externa
+                    interna.execute("DELETE FROM documentos WHERE url = 'http://teste/1'")
+                assert externa.escrevendo
+                assert pool.transacoes_replicadas == 0
+                raise RuntimeError("falha")
+
+        assert _contar_arquivo(db_path) == 5
+        assert repo.contar() == 5
+
+    def test_escritas_concorrentes(self, repo, db_path):
+        """Escritas de várias threads chegam ao arquivo e à réplica."""
+        erros = []
+
+        def trabalhar(inicio: int):
+            try:
+                for i in range(inicio, inicio + 10):
+                    repo.salvar(_documento(i))
+                    repo.contar()
+            except Exception as e:  # pragma: no cover - falha reportada abaixo
+                erros.append(e)
+
+        threads = [threading.Thread(target=trabalhar, args=(100 * n,)) for n in range(1, 5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert erros == []
+        assert _contar_arquivo(db_path) == 45
+        assert repo.contar() == 45
+
+    def test_leitura_nao_ve_reaplicacao_pela_metade(self, repo, db_path, monkeypatch):
+        """Leitores esperam a reaplicação terminar em vez de ver parte dela."""
+        pool = obter_pool(db_path)
+        meio, continuar = threading.Event(), threading.Event()
+
+        class ReplicaPausada:
+            """Réplica que pausa antes de reaplicar o log de alterações."""
+
+            def __init__(self, conn):
+                self._conn = conn
+
+            def __getattr__(self, nome):
+                return getattr(self._conn, nome)
+
+            def executemany(self, sql, parametros):
+                if "INTO alteracoes" in sql:
+                    meio.set()
+                    continuar.wait(5)
+                return self._conn.executemany(sql, parametros)
+
+        replicar = pool._replicar
+        monkeypatch.setattr(
+            pool, "_replicar", lambda replica, ops: replicar(ReplicaPausada(replica), ops)
+        )
+        lidos = []
+
+        def ler():
+            with repo._conexao() as conn:
+                lidos.append(
+                    tuple(
+                        conn.execute(
+                            "SELECT (SELECT COUNT(*) FROM documentos), "
+                            "(SELECT COUNT(*) FROM alteracoes WHERE tabela = 'documentos')"
+                        ).fetchone()
+                    )
+                )
+
+        escritor = threading.Thread(target=repo.salvar, args=(_documento(50),))
+        escritor.start()
+        assert meio.wait(5)
+        leitor = threading.Thread(target=ler)
+        leitor.start()
+        leitor.join(0.2)
+        bloqueado = leitor.is_alive()
+        continuar.set()
+        escritor.join(5)
+        leitor.join(5)
+
+        assert bloqueado
+        assert lidos == [(6, 6)]
+
+    def test_divergencia_recarrega_replica(self, repo, db_path):
+        """Falha ao reaplicar uma transação deve recarregar a réplica."""
+        telemetry = MagicMock()
+        replica_module.configure_telemetry(telemetry)
+        pool = obter_pool(db_path)
+
+        # Réplica perde um registro que o arquivo ainda tem
+        pool._ancora.execute("DELETE FROM documentos WHERE url = 'http://teste/3'")
+        pool._ancora.commit()
+        pool._ancora.execute("DROP TABLE alteracoes")
+        pool._ancora.commit()
+
+        repo.salvar(_documento(40))
+
+        telemetry.increment.assert_any_call("sqlite_replica.divergencia")
+        assert pool.estatisticas()["geracao"] == 2
+        assert repo.contar() == 6
+        assert "http://teste/3" in [d.url for d in repo.listar()]
@@ -0,0 +1,169 @@
+"""
+Testes da análise em lote do SpacyAnalyzer (modelo em branco, sem download).
+"""
+
+import pytest
+import spacy
+
+from src.infrastructure.analysis import spacy_analyzer
+from src.infrastructure.analysis.spacy_analyzer import SpacyAnalyzer
+from src.infrastructure.analysis.spacy_models import ProvedorModelos
+
+TEXTOS = [
+    (1, "Киров приехал в Ленинград."),
+    (2, "Текст без имён."),
+    (3, "Николаев и Киров.\nВторой абзац."),
+]
+
+
+@pytest.fixture
+def analyzer():
+    """Analisador com um modelo ru mínimo que reconhece dois nomes."""
+    nlp = spacy.blank("ru")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(
+        [{"label": "PER", "pattern": "Киров"}, {"label": "PER", "pattern": "Николаев"}]
+    )
+    return SpacyAnalyzer(
+        batch_size=2, modelos=ProvedorModelos(carregar=lambda nome, exclude, disable: nlp)
+    )
+
+
+def test_analisar_lote_equivale_a_analisar(analyzer):
+    """Cada resultado do lote coincide com a análise individual."""
+    resultados = list(analyzer.analisar_lote(iter(TEXTOS)))
+
+    assert [r.documento_id for r in resultados] == [1, 2, 3]
+    for (doc_id, texto), lote in zip(TEXTOS, resultados):
+        individual = analyzer.analisar(texto, doc_id)
+        assert lote.entidades == individual.entidades
+        assert lote.estatisticas == individual.estatisticas
+        assert lote.palavras_frequentes == individual.palavras_frequentes
+    assert [e.texto for e in resultados[2].entidades] == ["Николаев", "Киров"]
+    assert resultados[0].entidades_por_tipo == {"Pessoa": ["Киров"]}
+
+
+def test_analisar_lote_consumo_sob_demanda(analyzer):
+    """Os textos são lidos conforme os resultados são consumidos."""
+    lidos = []
+
+    def textos():
+        for doc_id, texto in TEXTOS:
+            lidos.append(doc_id)
+            yield doc_id, texto
+
+    resultados = analyzer.analisar_lote(textos(), batch_size=1)
+    assert lidos == []
+    assert next(resultados).documento_id == 1
+    assert len(lidos) < len(TEXTOS)
+
+
+def test_analisar_lote_multiprocesso(analyzer):
+    """Com vários processos, ordem e contexto dos documentos são mantidos."""
+    resultados = list(analyzer.analisar_lote(TEXTOS * 2, n_process=2))
+
+    assert [r.documento_id for r in resultados] == [1, 2, 3, 1, 2, 3]
+    assert [e.texto for e in resultados[3].entidades] == ["Киров"]
+
+
+def _protocolo(paragrafos: int) -> str:
+    """Texto longo: parágrafos repetidos, um nome a cada dez."""
+    return "\n".join(
+        f"{'Киров' if i % 10 == 0 else 'Свидетель'} показал, что был дома. Вопрос номер {i}."
+        for i in range(paragrafos)
+    )
+
+
+def test_texto_longo_em_blocos_equivale_a_inteiro(analyzer):
+    """Blocos pequenos produzem o mesmo resultado que o texto num único bloco."""
+    texto = _protocolo(60)
+    analyzer.tamanho_bloco = len(texto)
+    inteiro = analyzer.analisar(texto, 1)
+
+    analyzer.tamanho_bloco = 300
+    em_blocos = analyzer.analisar(texto, 1)
+
+    assert em_blocos.estatisticas == inteiro.estatisticas
+    assert em_blocos.entidades == inteiro.entidades
+    assert em_blocos.palavras_frequentes == inteiro.palavras_frequentes
+    assert em_blocos.estatisticas.total_frases == 120
+
+
+def test_texto_longo_analisado_por_inteiro(analyzer):
+    """Nada é truncado: entidades no fim do texto têm posição no texto completo."""
+    texto = _protocolo(2000) + "\nНиколаев."
+    assert len(texto) > 100000
+    analyzer.tamanho_bloco = 5000
+
+    analise = analyzer.analisar(texto, 1)
+
+    ultima = analise.entidades[-1]
+    assert ultima.texto == "Николаев"
+    assert texto[ultima.posicao_inicio : ultima.posicao_fim] == "Николаев"
+    assert sum(e.texto == "Киров" for e in analise.entidades) == 200
+    assert analise.estatisticas.total_caracteres == len(texto)
+
+
+def test_analisar_lote_agrupa_blocos_por_documento(analyzer):
+    """No lote, os blocos de cada documento voltam como uma única análise."""
+    longo = _protocolo(60)
+    analyzer.tamanho_bloco = 300
+
+    resultados = list(analyzer.analisar_lote([(1, longo), (2, ""), (3, TEXTOS[0][1])]))
+
+    assert [r.documento_id for r in resultados] == [1, 2, 3]
+    assert resultados[0].entidades == analyzer.analisar(longo, 1).entidades
+    assert resultados[1].estatisticas.total_palavras == 0
+    assert [e.texto for e in resultados[2].entidades] == ["Киров"]
+
+
+def test_analisar_lote_contexto_sem_texto(analyzer, monkeypatch):
+    """O contexto enviado ao nlp.pipe (e aos processos) não carrega o texto completo."""
+    nlp = analyzer._get_model("ru")
+    pipe_original = nlp.pipe
+    contextos = []
+
+    def pipe_espiao(entradas, **kwargs):
+        if not kwargs.get("as_tuples"):
+            return pipe_original(entradas, **kwargs)
+
+        def registrar():
+            for bloco, contexto in entradas:
+                contextos.append(contexto)
+                yield bloco, contexto
+
+        return pipe_original(registrar(), **kwargs)
+
+    monkeypatch.setattr(nlp, "pipe", pipe_espiao)
+    resultados = list(analyzer.analisar_lote(TEXTOS))
+
+    assert [r.estatisticas.total_caracteres for r in resultados] == [len(t) for _, t in TEXTOS]
+    assert contextos
+    assert not any(isinstance(valor, str) for contexto in contextos for valor in contexto)
+
+
+def test_identificar_modelo_sem_carregar(monkeypatch):
+    """A chave das análises gravadas vem dos metadados do pacote, sem carregar o modelo."""
+    cargas = []
+
+    def carregar(nome, exclude, disable):
+        cargas.append(nome)
+        return spacy.blank("ru")
+
+    monkeypatch.setattr(spacy_analyzer, "version", lambda nome: "3.8.0")
+    provedor = ProvedorModelos(carregar=carregar)
+    analyzer = SpacyAnalyzer(modelos=provedor)
+
+    chave = analyzer.identificar_modelo("ru")
+    assert chave.startswith("ru_core_news_sm-3.8.0[ner:")
+    assert cargas == []
+
+    provedor.configurar_perfis({"ner": {"exclude": ["parser"]}})
+    assert analyzer.identificar_modelo("ru") != chave
+    assert cargas == []
+
+
+def test_identificar_modelo_fora_de_pacote(analyzer):
+    """Sem metadados de pacote, a versão vem do meta do modelo carregado."""
+    assert analyzer.identificar_modelo("ru").startswith("ru_core_news_sm-0.0.0[ner:")
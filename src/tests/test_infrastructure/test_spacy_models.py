@@ -0,0 +1,201 @@
+"""
+Testes do provedor de modelos spaCy compartilhado.
+"""
+
+import threading
+import time
+
+import pytest
+import spacy
+
+from src.infrastructure.analysis.spacy_analyzer import SpacyAnalyzer
+from src.infrastructure.analysis.spacy_models import (
+    COMPONENTES_TREINADOS,
+    PerfilPipeline,
+    ProvedorModelos,
+)
+from src.infrastructure.analysis.wordcloud_generator import WordCloudGenerator
+from src.infrastructure.registry import ServiceRegistry
+
+
+class CarregadorFalso:
+    """Substitui spacy.load por modelos em branco, contando as cargas."""
+
+    def __init__(self, pausa: float = 0.0):
+        self.cargas = []
+        self.pausa = pausa
+
+    def __call__(self, nome, exclude, disable):
+        self.cargas.append((nome, tuple(exclude), tuple(disable)))
+        time.sleep(self.pausa)
+        return spacy.blank(nome[:2])
+
+
+@pytest.fixture
+def carregador():
+    return CarregadorFalso()
+
+
+def test_carrega_cada_configuracao_uma_vez(carregador):
+    """Mesma chave reutiliza o modelo; outra configuração carrega outro."""
+    provedor = ProvedorModelos(carregar=carregador)
+
+    primeiro = provedor.obter("ru_core_news_sm")
+    assert provedor.obter("ru_core_news_sm") is primeiro
+    sem_ner = PerfilPipeline.from_dict({"exclude": ["ner", "parser"]})
+    assert provedor.obter("ru_core_news_sm", sem_ner) is not primeiro
+    assert (
+        provedor.obter("ru_core_news_sm", PerfilPipeline(exclude=("ner", "parser"))) is not primeiro
+    )
+
+    assert carregador.cargas == [
+        ("ru_core_news_sm", (), ()),
+        ("ru_core_news_sm", ("ner", "parser"), ()),
+    ]
+
+
+def test_carga_concorrente_unica():
+    """Threads pedindo o mesmo modelo esperam uma única carga."""
+    carregador = CarregadorFalso(pausa=0.05)
+    provedor = ProvedorModelos(carregar=carregador)
+    modelos = []
+
+    threads = [
+        threading.Thread(target=lambda: modelos.append(provedor.obter("ru_core_news_sm")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(carregador.cargas) == 1
+    assert all(modelo is modelos[0] for modelo in modelos)
+
+
+def test_erro_de_carga_nao_fica_em_cache():
+    """Modelo ausente falha a cada pedido, sem registrar entrada."""
+
+    def ausente(nome, exclude, disable):
+        raise OSError(f"[E050] Can't find model '{nome}'")
+
+    provedor = ProvedorModelos(carregar=ausente)
+
+    with pytest.raises(OSError):
+        provedor.obter("ru_core_news_sm")
+    assert provedor.estatisticas() == []
+
+
+def test_estatisticas_e_descarregar(carregador):
+    """Estatísticas listam os modelos em memória; descarregar força recarga."""
+    provedor = ProvedorModelos(carregar=carregador, perfis={"rapido": {"disable": ["ner"]}})
+    provedor.obter("ru_core_news_sm", "rapido")
+    provedor.obter("ru_core_news_sm", "rapido")
+
+    (info,) = provedor.estatisticas()
+    assert info["modelo"] == "ru_core_news_sm"
+    assert info["perfis"] == ["rapido"]
+    assert info["disable"] == ["ner"]
+    assert info["componentes"] == []
+    assert info["usos"] == 2
+
+    provedor.descarregar()
+    assert not provedor.carregado("ru_core_news_sm", "rapido")
+    provedor.obter("ru_core_news_sm", "rapido")
+    assert len(carregador.cargas) == 2
+
+
+def test_analyzer_e_wordcloud_compartilham_modelo(carregador, tmp_path):
+    """SpacyAnalyzer e WordCloudGenerator usam a mesma instância do modelo."""
+    provedor = ProvedorModelos(carregar=carregador)
+    analyzer = SpacyAnalyzer(modelos=provedor)
+    wordcloud = WordCloudGenerator(modelos=provedor, default_size=(100, 50))
+
+    analyzer.analisar("Протокол допроса свидетеля Николаева.", 1)
+    analyzer.analisar("Протокол допроса свидетеля Петрова.", 2)
+    wordcloud.gerar("Протокол допроса свидетеля Николаева.", salvar_em=str(tmp_path / "nuvem.png"))
+    wordcloud.gerar("Протокол допроса свидетеля Николаева.", salvar_em=str(tmp_path / "nuvem.png"))
+
+    assert len(carregador.cargas) == 2
+    usos = {tuple(info["perfis"]): info["usos"] for info in provedor.estatisticas()}
+    assert usos == {("ner",): 1, ("tokens",): 2}
+
+
+def test_provedor_padrao_e_do_registry():
+    """Sem provedor explícito, os componentes usam o do ServiceRegistry."""
+    registry = ServiceRegistry()
+
+    assert SpacyAnalyzer()._provedor is registry.modelos_spacy
+    assert WordCloudGenerator()._modelos is registry.modelos_spacy
+
+
+def test_perfis_padrao(carregador):
+    """Cada perfil padrão carrega só o que a tarefa usa."""
+    provedor = ProvedorModelos(carregar=carregador)
+
+    tokens = provedor.obter("ru_core_news_sm", "tokens")
+    ner = provedor.obter("ru_core_news_sm", "ner")
+    completo = provedor.obter("ru_core_news_sm", "full")
+
+    excluidos = {carga[1] for carga in carregador.cargas}
+    assert tuple(sorted(COMPONENTES_TREINADOS)) in excluidos
+    assert not {"ner", "tok2vec"} & set(provedor.perfil("ner").exclude)
+    assert tokens.pipe_names == []
+    assert ner.pipe_names == ["sentencizer"]
+    assert completo.pipe_names == []
+
+
+def test_sentencizer_marca_frases(carregador):
+    """O perfil sentences segmenta frases sem parser nem senter."""
+    provedor = ProvedorModelos(carregar=carregador)
+
+    doc = provedor.obter("ru_core_news_sm", "sentences")("Первое предложение. Второе предложение.")
+
+    assert len(list(doc.sents)) == 2
+
+
+def test_sentencizer_nao_duplica_marcador_existente():
+    """Modelo que já marca frases não recebe o sentencizer."""
+
+    def com_senter(nome, exclude, disable):
+        nlp = spacy.blank("ru")
+        nlp.add_pipe("sentencizer", name="senter")
+        return nlp
+
+    provedor = ProvedorModelos(carregar=com_senter)
+
+    assert provedor.obter("ru_core_news_sm", "ner").pipe_names == ["senter"]
+
+
+def test_perfis_do_config_substituem_padrao(carregador):
+    """services.spacy.options.perfis redefine perfis padrão e cria novos."""
+    provedor = ProvedorModelos(carregar=carregador)
+    provedor.configurar_perfis(
+        {"ner": {"exclude": ["parser"], "disable": ["lemmatizer"]}, "lemas": {"exclude": ["ner"]}}
+    )
+
+    provedor.obter("ru_core_news_sm", "ner")
+    provedor.obter("ru_core_news_sm", "lemas")
+
+    assert carregador.cargas == [
+        ("ru_core_news_sm", ("parser",), ("lemmatizer",)),
+        ("ru_core_news_sm", ("ner",), ()),
+    ]
+    assert provedor.perfil("ner").sentencizer is False
+
+
+def test_perfil_desconhecido(carregador):
+    """Perfil inexistente é erro de configuração, não carga silenciosa."""
+    provedor = ProvedorModelos(carregar=carregador)
+
+    with pytest.raises(ValueError, match="desconhecido"):
+        provedor.obter("ru_core_news_sm", "inexistente")
+    assert carregador.cargas == []
+
+
+def test_perfil_round_trip():
+    """to_dict/from_dict preservam a configuração (ordem não importa)."""
+    perfil = PerfilPipeline.from_dict({"exclude": ["tagger", "parser"], "sentencizer": True})
+
+    assert perfil == PerfilPipeline(exclude=("parser", "tagger"), sentencizer=True)
+    assert PerfilPipeline.from_dict(perfil.to_dict()) == perfil
@@ -0,0 +1,128 @@
+"""
+Testes para o repositório SQLite de análises (cache persistente).
+"""
+
+import tempfile
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.documento import Documento
+from src.domain.entities.traducao import Traducao
+from src.infrastructure.factories import MockSpacyAnalyzer
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.sqlite_analise_repository import SQLiteAnaliseRepository
+from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
+from src.infrastructure.persistence.sqlite_traducao_repository import SQLiteTraducaoRepository
+
+HASH = "a" * 64
+MODELO = "ru_core_news_sm-3.8.0/a1"
+
+
+@pytest.fixture
+def repos():
+    """Repositórios de documentos, traduções e análises sobre o mesmo banco."""
+    with tempfile.NamedTemporaryFile(suffix=".db") as tmp:
+        repo_doc = SQLiteDocumentoRepository(db_path=tmp.name)
+        with repo_doc._conexao() as conn:
+            aplicar_migracoes(conn)
+        yield (
+            repo_doc,
+            SQLiteTraducaoRepository(db_path=tmp.name),
+            SQLiteAnaliseRepository(db_path=tmp.name),
+        )
+
+
+def _documento(repo_doc) -> Documento:
+    doc = Documento(
+        centro="lencenter",
+        titulo="Протокол допроса",
+        url="http://teste/1",
+        texto="Л.В. Николаева показала следующее.",
+        data_coleta=datetime(2024, 1, 1),
+    )
+    doc.id = repo_doc.salvar(doc)
+    return doc
+
+
+def _analise(documento_id: int, idioma: str = "ru"):
+    return MockSpacyAnalyzer().analisar("Л.В. Николаева показала следующее.", documento_id, idioma)
+
+
+def test_salvar_e_buscar(repos):
+    """A análise gravada volta igual para a mesma chave."""
+    repo_doc, _, repo_analise = repos
+    doc = _documento(repo_doc)
+    analise = _analise(doc.id)
+
+    repo_analise.salvar(analise, HASH, MODELO)
+
+    assert repo_analise.buscar(doc.id, "ru", HASH, MODELO) == analise
+
+
+def test_chave_inclui_hash_e_modelo(repos):
+    """Outro texto ou outro modelo não reaproveita a análise."""
+    repo_doc, _, repo_analise = repos
+    doc = _documento(repo_doc)
+    repo_analise.salvar(_analise(doc.id), HASH, MODELO)
+
+    assert repo_analise.buscar(doc.id, "ru", "b" * 64, MODELO) is None
+    assert repo_analise.buscar(doc.id, "ru", HASH, "ru_core_news_sm-3.9.0/a1") is None
+    assert repo_analise.buscar(doc.id, "en", HASH, MODELO) is None
+
+
+def test_nova_analise_substitui_anterior(repos):
+    """Há no máximo uma análise por documento e idioma."""
+    repo_doc, _, repo_analise = repos
+    doc = _documento(repo_doc)
+    repo_analise.salvar(_analise(doc.id), HASH, MODELO)
+    repo_analise.salvar(_analise(doc.id), "b" * 64, MODELO)
+
+    assert repo_analise.buscar(doc.id, "ru", HASH, MODELO) is None
+    assert repo_analise.remover_por_documento(doc.id) == 1
+
+
+def test_salvar_documento_invalida_analise_original(repos):
+    """Regravar o texto do documento descarta a análise em russo."""
+    repo_doc, _, repo_analise = repos
+    doc = _documento(repo_doc)
+    repo_analise.salvar(_analise(doc.id), HASH, MODELO)
+    repo_analise.salvar(_analise(doc.id, "en"), HASH, MODELO)
+
+    doc.texto = "Новый текст"
+    repo_doc.salvar(doc)
+
+    assert repo_analise.buscar(doc.id, "ru", HASH, MODELO) is None
+    assert repo_analise.buscar(doc.id, "en", HASH, MODELO) is not None
+
+
+def test_salvar_traducao_invalida_analise_do_idioma(repos):
+    """Nova tradução (ou atualização) descarta a análise daquele idioma."""
+    repo_doc, repo_trad, repo_analise = repos
+    doc = _documento(repo_doc)
+    traducao = Traducao(
+        documento_id=doc.id,
+        idioma="en",
+        texto_traduzido="Testimony",
+        data_traducao=datetime(2024, 1, 1),
+    )
+    traducao.id = repo_trad.salvar(traducao)
+    repo_analise.salvar(_analise(doc.id, "en"), HASH, MODELO)
+    repo_analise.salvar(_analise(doc.id), HASH, MODELO)
+
+    traducao.texto_traduzido = "New testimony"
+    repo_trad.salvar(traducao)
+
+    assert repo_analise.buscar(doc.id, "en", HASH, MODELO) is None
+    assert repo_analise.buscar(doc.id, "ru", HASH, MODELO) is not None
+
+
+def test_remover_documento_remove_analises(repos):
+    """Análises não sobrevivem ao documento."""
+    repo_doc, _, repo_analise = repos
+    doc = _documento(repo_doc)
+    repo_analise.salvar(_analise(doc.id), HASH, MODELO)
+
+    repo_doc.remover(doc.id)
+
+    assert repo_analise.remover_por_documento(doc.id) == 0
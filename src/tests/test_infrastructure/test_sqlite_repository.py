@@ -6,11 +6,14 @@ Usa um banco em memória para isolamento.
 
 import tempfile
 from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
 
+import src.domain.entities.documento as documento_module
 from src.domain.entities.documento import Documento
-from src.infrastructure.persistence.models import DocumentoModel, TraducaoModel
+from src.infrastructure.persistence.migrations import aplicar_migracoes
+from src.infrastructure.persistence.models import DocumentoModel
 from src.infrastructure.persistence.sqlite_repository import SQLiteDocumentoRepository
 
 
@@ -21,12 +24,21 @@ def repo_memoria():
     with tempfile.NamedTemporaryFile(suffix=".db") as tmp:
         repo = SQLiteDocumentoRepository(db_path=tmp.name)
 
-        # Criar tabelas
+        # Criar tabelas (schema completo via migrações versionadas)
         with repo._conexao() as conn:
-            cursor = conn.cursor()
-            DocumentoModel.criar_tabela(cursor)
-            TraducaoModel.criar_tabela(cursor)
-            DocumentoModel.adicionar_colunas_metadados(cursor)
+            aplicar_migracoes(conn)
+
+        yield repo
+
+
+@pytest.fixture
+def repo_comprimido():
+    """Fixture com banco no modo de texto comprimido."""
+    with tempfile.NamedTemporaryFile(suffix=".db") as tmp:
+        repo = SQLiteDocumentoRepository(db_path=tmp.name)
+
+        with repo._conexao() as conn:
+            aplicar_migracoes(conn, comprimir_texto=True)
 
         yield repo
 
@@ -181,3 +193,578 @@ class TestSQLiteDocumentoRepository:
         """Remover documento inexistente deve retornar False."""
         resultado = repo_memoria.remover(99999)
         assert resultado is False
+
+    def test_buscar_texto(self, repo_memoria):
+        """Deve encontrar documentos por termos do título ou do texto."""
+        repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Протокол допроса Л.В. Николаева",
+                url="http://teste.com/busca1",
+                texto="Показания об убийстве Кирова",
+                data_coleta=datetime.now(),
+                tipo="interrogatorio",
+            )
+        )
+        repo_memoria.salvar(
+            Documento(
+                centro="moscenter",
+                titulo="Письмо",
+                url="http://teste.com/busca2",
+                texto="Текст без совпадений",
+                data_coleta=datetime.now(),
+            )
+        )
+
+        por_titulo = repo_memoria.buscar_texto("николаева")
+        por_prefixo = repo_memoria.buscar_texto("Киров*")
+        filtrado = repo_memoria.buscar_texto("николаева", centro="moscenter")
+
+        assert len(por_titulo) == 1
+        assert "<mark>Николаева</mark>" in por_titulo[0].trecho
+        assert por_prefixo[0].documento_id == por_titulo[0].documento_id
+        assert filtrado == []
+
+    def test_texto_comprimido_transparente(self, repo_comprimido):
+        """No modo comprimido o texto vai como BLOB e volta igual."""
+        texto = "Показания об убийстве Кирова. " * 100
+        doc_id = repo_comprimido.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Протокол допроса",
+                url="http://teste.com/zlib",
+                texto=texto,
+                data_coleta=datetime.now(),
+            )
+        )
+
+        with repo_comprimido._conexao() as conn:
+            tipo = conn.execute("SELECT typeof(texto) FROM documentos").fetchone()[0]
+
+        assert tipo == "blob"
+        assert repo_comprimido.buscar_por_id(doc_id).texto == texto
+        assert repo_comprimido.listar_resumos()[0].tamanho_caracteres == len(texto)
+        resultados = repo_comprimido.buscar_texto("кирова")
+        assert resultados[0].documento_id == doc_id
+        assert "<mark>Кирова</mark>" in resultados[0].trecho
+
+    def test_buscar_texto_em_traducoes(self, repo_memoria):
+        """Índice de traduções deve acompanhar inserções e remoções."""
+        doc_id = repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Документ",
+                url="http://teste.com/busca3",
+                texto="...",
+                data_coleta=datetime.now(),
+            )
+        )
+        with repo_memoria._conexao() as conn:
+            conn.execute(
+                "INSERT INTO traducoes (documento_id, idioma, texto_traduzido, data_traducao) "
+                "VALUES (?, 'en', 'Interrogation of Nikolaev', '2024-01-01')",
+                (doc_id,),
+            )
+
+        resultados = repo_memoria.buscar_texto("nikolaev")
+        assert len(resultados) == 1
+        assert resultados[0].idioma == "en"
+
+        with repo_memoria._conexao() as conn:
+            conn.execute("DELETE FROM traducoes WHERE documento_id = ?", (doc_id,))
+
+        assert repo_memoria.buscar_texto("nikolaev") == []
+
+    def test_buscar_texto_um_acerto_por_documento(self, repo_memoria):
+        """Original e traduções são ranqueados por índice e unidos por documento."""
+        ids = [
+            repo_memoria.salvar(
+                Documento(
+                    centro="lencenter",
+                    titulo=titulo,
+                    url=f"http://teste.com/fontes{i}",
+                    texto=texto,
+                    data_coleta=datetime.now(),
+                )
+            )
+            for i, (titulo, texto) in enumerate(
+                [("Nikolaev", "Nikolaev interrogation"), ("Документ", "Текст")]
+            )
+        ]
+        with repo_memoria._conexao() as conn:
+            conn.executemany(
+                "INSERT INTO traducoes (documento_id, idioma, texto_traduzido, data_traducao) "
+                "VALUES (?, ?, ?, '2024-01-01')",
+                [
+                    (ids[0], "en", "Nikolaev"),
+                    (ids[0], "fr", "Nikolaev"),
+                    (ids[1], "en", "Letter from Nikolaev to the NKVD about the case"),
+                ],
+            )
+
+        resultados = repo_memoria.buscar_texto("nikolaev")
+
+        assert [r.documento_id for r in resultados] == ids
+        assert resultados[0].idioma is None
+        assert resultados[0].relevancia == -1.0
+        assert resultados[1].idioma == "en"
+        assert -1.0 <= resultados[1].relevancia < 0
+        assert [r.documento_id for r in repo_memoria.buscar_texto("nikolaev", offset=1)] == [ids[1]]
+
+    def test_buscar_texto_consulta_invalida(self, repo_memoria):
+        """Consulta com sintaxe FTS inválida não deve gerar erro."""
+        assert repo_memoria.buscar_texto('"AND -(') == []
+        assert repo_memoria.buscar_texto("   ") == []
+
+    def test_salvar_em_lote(self, repo_memoria):
+        """Deve inserir e atualizar em lote, retornando IDs na ordem de entrada."""
+        existente = Documento(
+            centro="lencenter",
+            titulo="Existente",
+            url="http://teste.com/lote0",
+            texto="...",
+            data_coleta=datetime.now(),
+        )
+        existente.id = repo_memoria.salvar(existente)
+        existente.tipo = "carta"
+
+        novos = [
+            Documento(
+                centro="moscenter",
+                titulo=f"Lote {i}",
+                url=f"http://teste.com/lote{i}",
+                texto="...",
+                data_coleta=datetime.now(),
+            )
+            for i in range(1, 6)
+        ]
+
+        ids = repo_memoria.salvar_em_lote([novos[0], existente, *novos[1:]], chunk_size=2)
+
+        assert ids[1] == existente.id
+        assert len(set(ids)) == 6
+        assert repo_memoria.buscar_por_id(ids[0]).titulo == "Lote 1"
+        assert repo_memoria.buscar_por_id(ids[-1]).titulo == "Lote 5"
+        assert repo_memoria.buscar_por_id(existente.id).tipo == "carta"
+
+    def test_salvar_em_lote_desfaz_apenas_lote_com_erro(self, repo_memoria):
+        """Lote com URL duplicada deve ser desfeito sem afetar os demais."""
+        docs = [
+            Documento(
+                centro="lencenter",
+                titulo=f"Doc {i}",
+                url=f"http://teste.com/dup{i if i != 3 else 2}",
+                texto="...",
+                data_coleta=datetime.now(),
+            )
+            for i in range(1, 5)
+        ]
+
+        ids = repo_memoria.salvar_em_lote(docs, chunk_size=2)
+
+        assert ids[0] is not None and ids[1] is not None
+        assert ids[2:] == [None, None]
+        assert repo_memoria.contar() == 2
+
+    def test_listar_por_cursor(self, repo_memoria):
+        """after_id/before_id devem paginar por chave em ordem crescente."""
+        for i in range(1, 8):
+            repo_memoria.salvar(
+                Documento(
+                    centro="lencenter",
+                    titulo=f"Doc {i}",
+                    url=f"http://teste.com/cursor{i}",
+                    texto=f"Texto {i}",
+                    data_coleta=datetime.now(),
+                )
+            )
+
+        depois = repo_memoria.listar(limite=3, after_id=2)
+        antes = repo_memoria.listar(limite=3, before_id=6)
+        inicio = repo_memoria.listar(limite=3, before_id=3)
+
+        assert [d.id for d in depois] == [3, 4, 5]
+        assert [d.id for d in antes] == [3, 4, 5]
+        assert [d.id for d in inicio] == [1, 2]
+
+    def test_listar_resumos_sem_texto(self, repo_memoria):
+        """Resumos devem trazer o tamanho calculado no banco, sem o texto."""
+        repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Protocolo",
+                url="http://teste.com/resumo",
+                texto="Николаев" * 10,
+                data_coleta=datetime.now(),
+                tipo="interrogatorio",
+            )
+        )
+
+        resumo = repo_memoria.listar_resumos(centro="lencenter")[0]
+
+        assert resumo.titulo == "Protocolo"
+        assert resumo.tipo == "interrogatorio"
+        assert resumo.tamanho_caracteres == 80
+        assert not hasattr(resumo, "texto")
+
+    def test_agregados(self, repo_memoria):
+        """Contagens e custos devem ser agregados no banco, respeitando filtros."""
+        dados = [
+            ("lencenter", "carta", "Л.В. Николаев", True),
+            ("lencenter", "interrogatorio", "Л.В. Николаев", False),
+            ("moscenter", "interrogatorio", "Г.Е. Зиновьев", False),
+            ("moscenter", None, None, False),
+        ]
+        ids = []
+        for i, (centro, tipo, pessoa, anexos) in enumerate(dados):
+            ids.append(
+                repo_memoria.salvar(
+                    Documento(
+                        centro=centro,
+                        titulo=f"Doc {i}",
+                        url=f"http://teste.com/agregados{i}",
+                        texto="Texto",
+                        data_coleta=datetime.now(),
+                        tipo=tipo,
+                        pessoa_principal=pessoa,
+                        tem_anexos=anexos,
+                    )
+                )
+            )
+        with repo_memoria._conexao() as conn:
+            conn.executemany(
+                "INSERT INTO traducoes (documento_id, idioma, texto_traduzido, custo, "
+                "data_traducao) VALUES (?, ?, 'x', ?, '2024-01-01')",
+                [(ids[0], "en", 0.25), (ids[0], "pt", 0.5), (ids[2], "en", 1.0)],
+            )
+
+        todos = repo_memoria.agregados()
+        lencenter = repo_memoria.agregados(centro="lencenter", limite_pessoas=1)
+
+        assert todos.total_documentos == 4
+        assert todos.por_centro == {"lencenter": 2, "moscenter": 2}
+        assert list(todos.por_tipo.items())[0] == ("interrogatorio", 2)
+        assert todos.pessoas_frequentes[0] == ("Л.В. Николаев", 2)
+        assert todos.com_anexos == 1
+        assert todos.traducoes_por_idioma == {"en": 2, "pt": 1}
+        assert todos.custo_total_traducoes == pytest.approx(1.75)
+
+        assert lencenter.total_documentos == 2
+        assert lencenter.por_tipo == {"carta": 1, "interrogatorio": 1}
+        assert len(lencenter.pessoas_frequentes) == 1
+        assert lencenter.total_traducoes == 2
+        assert repo_memoria.contar_por_tipo() == {"interrogatorio": 2, "carta": 1}
+        assert repo_memoria.contar_por_tipo(centro="moscenter") == {"interrogatorio": 1}
+
+    def test_iterar_percorre_todos_em_lotes(self, repo_memoria):
+        """Deve retornar todos os documentos, em ordem, além do tamanho do lote."""
+        for i in range(1, 8):
+            repo_memoria.salvar(
+                Documento(
+                    centro="lencenter" if i % 2 else "moscenter",
+                    titulo=f"Doc {i}",
+                    url=f"http://teste.com/iter{i}",
+                    texto=f"Texto {i}",
+                    data_coleta=datetime.now(),
+                )
+            )
+
+        todos = list(repo_memoria.iterar(batch_size=3))
+        lencenter = list(repo_memoria.iterar(batch_size=2, centro="lencenter"))
+
+        assert [d.titulo for d in todos] == [f"Doc {i}" for i in range(1, 8)]
+        assert [d.titulo for d in lencenter] == ["Doc 1", "Doc 3", "Doc 5", "Doc 7"]
+
+    def test_iterar_com_colunas_nao_carrega_texto(self, repo_memoria):
+        """Sem a coluna texto, o texto é adiado; metadados omitidos marcam o documento."""
+        repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Doc",
+                url="http://teste.com/colunas",
+                texto="Texto longo",
+                data_coleta=datetime.now(),
+                tipo="carta",
+                pessoa_principal="Николаев",
+            )
+        )
+
+        doc = next(repo_memoria.iterar(colunas=("tipo_documento",)))
+
+        assert doc.tipo == "carta"
+        assert doc.pessoa_principal is None
+        assert doc.parcial
+        assert "pessoa_principal" in doc.campos_omitidos
+        assert "tipo" not in doc.campos_omitidos
+        assert not doc.texto_carregado
+        assert doc.texto == "Texto longo"
+
+        with pytest.raises(ValueError):
+            next(repo_memoria.iterar(colunas=("inexistente; DROP TABLE documentos",)))
+
+    def test_buscar_por_id_sem_texto_carrega_sob_demanda(self, repo_comprimido):
+        """Texto só deve ser lido no primeiro acesso; o tamanho vem do banco."""
+        texto = "Показания Николаева. " * 50
+        doc_id = repo_comprimido.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Протокол допроса",
+                url="http://teste.com/adiado",
+                texto=texto,
+                data_coleta=datetime.now(),
+            )
+        )
+
+        doc = repo_comprimido.buscar_por_id(doc_id, carregar_texto=False)
+
+        assert not doc.texto_carregado
+        assert doc.tamanho_caracteres == len(texto)
+        assert not doc.texto_carregado
+        assert doc.texto == texto
+        assert doc.texto_carregado
+        assert repo_comprimido.obter_texto(9999) is None
+
+    def test_documento_parcial_nao_pode_ser_salvo(self, repo_memoria):
+        """Metadados omitidos na leitura não são gravados por cima dos reais."""
+        doc_id = repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Doc",
+                url="http://teste.com/parcial",
+                texto="Texto original",
+                data_coleta=datetime.now(),
+                tipo="carta",
+                pessoa_principal="Николаев",
+            )
+        )
+
+        parcial = next(repo_memoria.iterar(colunas=("texto",)))
+        with pytest.raises(ValueError, match="pessoa_principal"):
+            repo_memoria.salvar(parcial)
+        with pytest.raises(ValueError):
+            repo_memoria.salvar_em_lote([parcial])
+
+        completo = next(repo_memoria.iterar())
+        assert not completo.parcial
+        salvo = repo_memoria.buscar_por_id(doc_id)
+        assert (salvo.texto, salvo.tipo, salvo.pessoa_principal) == (
+            "Texto original",
+            "carta",
+            "Николаев",
+        )
+
+    def test_salvar_sem_texto_carregado_preserva_texto(self, repo_memoria):
+        """Salvar documento com texto adiado deve gravar só os metadados."""
+        ids = repo_memoria.salvar_em_lote(
+            Documento(
+                centro="lencenter",
+                titulo=f"Doc {i}",
+                url=f"http://teste.com/meta/{i}",
+                texto=f"Texto {i}",
+                data_coleta=datetime.now(),
+            )
+            for i in range(3)
+        )
+
+        doc = repo_memoria.buscar_por_id(ids[0], carregar_texto=False)
+        doc.tipo = "carta"
+        repo_memoria.salvar(doc)
+
+        lista = repo_memoria.listar(carregar_texto=False)
+        for item in lista:
+            item.tipo = "relatorio"
+        repo_memoria.salvar_em_lote(lista)
+
+        assert not any(d.texto_carregado for d in lista)
+        salvos = repo_memoria.listar()
+        assert [d.texto for d in salvos] == ["Texto 0", "Texto 1", "Texto 2"]
+        assert {d.tipo for d in salvos} == {"relatorio"}
+
+    def test_contagens_gravadas_com_o_texto(self, repo_memoria):
+        """Contagens devem ser gravadas no salvar e lidas sem carregar o texto."""
+        doc_id = repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Doc",
+                url="http://teste.com/contagens",
+                texto="Um dois três.\n\nQuatro cinco",
+                data_coleta=datetime.now(),
+            )
+        )
+
+        colunas = ("num_caracteres", "num_palavras", "num_paragrafos")
+        doc = next(repo_memoria.iterar(colunas=colunas))
+        assert not doc.texto_carregado
+        assert (doc.tamanho_caracteres, doc.tamanho_palavras, doc.tamanho_paragrafos) == (27, 5, 2)
+
+        completo = repo_memoria.buscar_por_id(doc_id)
+        completo.texto = "Texto novo"
+        repo_memoria.salvar(completo)
+
+        atualizado = repo_memoria.buscar_por_id(doc_id, carregar_texto=False)
+        assert (atualizado.tamanho_caracteres, atualizado.tamanho_palavras) == (10, 2)
+        assert not atualizado.texto_carregado
+
+    def test_documentos_por_pessoa(self, repo_memoria):
+        """Vínculos de pessoas devem acompanhar salvar, atualizar e remover."""
+        carta = Documento(
+            centro="lencenter",
+            titulo="Письмо",
+            url="http://teste.com/carta",
+            texto="Texto",
+            data_coleta=datetime.now(),
+            pessoa_principal="Л.В. Николаев",
+            remetente="Л.В. Николаев",
+            destinatario="М.Н. Волкова",
+        )
+        carta.id = repo_memoria.salvar(carta)
+        ids = repo_memoria.salvar_em_lote(
+            [
+                Documento(
+                    centro="lencenter",
+                    titulo="Очная ставка",
+                    url="http://teste.com/acareacao",
+                    texto="Texto",
+                    data_coleta=datetime.now(),
+                    envolvidos=["Л.В. Николаев", "М.Н. Волкова"],
+                )
+            ]
+        )
+
+        assert [r.id for r in repo_memoria.documentos_por_pessoa("Л.В. Николаев")] == [
+            carta.id,
+            ids[0],
+        ]
+        assert [
+            r.id for r in repo_memoria.documentos_por_pessoa("М.Н. Волкова", papel="destinatario")
+        ] == [carta.id]
+
+        carta.destinatario = None
+        repo_memoria.salvar(carta)
+        assert repo_memoria.documentos_por_pessoa("М.Н. Волкова", papel="destinatario") == []
+
+        repo_memoria.remover(ids[0])
+        assert repo_memoria.documentos_por_pessoa("М.Н. Волкова") == []
+
+        with pytest.raises(ValueError):
+            repo_memoria.documentos_por_pessoa("Л.В. Николаев", papel="autor")
+
+    def test_upsert_por_url_pula_documentos_inalterados(self, repo_memoria):
+        """Recoleta deve inserir URLs novas e regravar só o conteúdo alterado."""
+
+        def coleta(textos):
+            return [
+                Documento(
+                    centro="lencenter",
+                    titulo=f"Doc {i}",
+                    url=f"http://teste.com/upsert/{i}",
+                    texto=texto,
+                    data_coleta=datetime.now(),
+                )
+                for i, texto in enumerate(textos)
+            ]
+
+        primeira = repo_memoria.upsert_por_url(coleta(["A", "B"]))
+        assert (primeira.inseridos, primeira.atualizados, primeira.inalterados) == (2, 0, 0)
+
+        classificado = repo_memoria.buscar_por_id(primeira.ids[0])
+        classificado.tipo = "carta"
+        repo_memoria.salvar(classificado)
+
+        segunda = repo_memoria.upsert_por_url(coleta(["A", "B alterado", "C"]), chunk_size=2)
+
+        assert segunda.ids[:2] == primeira.ids
+        assert (segunda.inseridos, segunda.atualizados, segunda.inalterados) == (1, 1, 1)
+        assert repo_memoria.buscar_por_id(primeira.ids[0]).tipo == "carta"
+        assert repo_memoria.buscar_por_id(primeira.ids[1]).texto == "B alterado"
+        assert repo_memoria.contar() == 3
+
+        adiado = repo_memoria.buscar_por_id(primeira.ids[0], carregar_texto=False)
+        with pytest.raises(ValueError):
+            repo_memoria.upsert_por_url([adiado])
+
+    def test_listar_alterados_desde(self, repo_memoria):
+        """Log de alterações deve entregar só o delta desde a marca."""
+
+        def novo(i):
+            return Documento(
+                centro="lencenter",
+                titulo=f"Doc {i}",
+                url=f"http://teste.com/delta/{i}",
+                texto=f"Texto {i}",
+                data_coleta=datetime.now(),
+            )
+
+        ids = repo_memoria.salvar_em_lote([novo(1), novo(2), novo(3)])
+        inicial = repo_memoria.listar_alterados_desde(0)
+        assert inicial.alterados == ids
+        assert inicial.removidos == []
+
+        doc = repo_memoria.buscar_por_id(ids[0], carregar_texto=False)
+        doc.tipo = "carta"
+        repo_memoria.salvar(doc)
+        repo_memoria.remover(ids[1])
+        repo_memoria.upsert_por_url([novo(3)])  # inalterado: não entra no log
+
+        delta = repo_memoria.listar_alterados_desde(inicial.marca)
+        assert delta.alterados == [ids[0]]
+        assert delta.removidos == [ids[1]]
+        assert repo_memoria.listar_alterados_desde(delta.marca).vazio
+
+        with repo_memoria._conexao() as conn:
+            updated_at = conn.execute(
+                "SELECT updated_at FROM documentos WHERE id = ?", (ids[0],)
+            ).fetchone()[0]
+        assert updated_at is not None
+
+    def test_hidratacao_equivale_ao_modelo(self, repo_memoria):
+        """Carga direta da linha deve gerar o mesmo Documento que o DocumentoModel."""
+        repo_memoria.salvar(
+            Documento(
+                centro="moscenter",
+                titulo="Carta",
+                url="http://teste.com/hidratacao",
+                texto="Linha 1\nLinha 2",
+                data_coleta=datetime(2024, 5, 1, 12, 30),
+                data_original="1935",
+                tipo="carta",
+                tipo_descricao="Carta",
+                remetente="Kamenev",
+                destinatario="Zinoviev",
+                envolvidos=["Kamenev", "Zinoviev"],
+                tem_anexos=True,
+            )
+        )
+        with repo_memoria._conexao() as conn:
+            row = conn.execute(
+                f"SELECT {repo_memoria._SELECAO_COMPLETA} FROM documentos"
+            ).fetchone()
+
+        rapido = repo_memoria._row_para_entidade(row)
+        via_modelo = DocumentoModel(**dict(zip(repo_memoria._COLUNAS_LEITURA, row)))
+        via_modelo = via_modelo.para_entidade()
+
+        assert rapido == via_modelo
+        assert rapido.__dict__ == via_modelo.__dict__
+        assert rapido.tamanho_paragrafos == 2
+
+    def test_hidratacao_sem_revalidar(self, repo_memoria):
+        """Listagens não devem disparar validação nem telemetria de criação."""
+        repo_memoria.salvar(
+            Documento(
+                centro="lencenter",
+                titulo="Doc",
+                url="http://teste.com/sem-revalidar",
+                texto="Texto",
+                data_coleta=datetime.now(),
+            )
+        )
+        telemetry = MagicMock()
+        documento_module.configure_telemetry(telemetry_instance=telemetry)
+        try:
+            docs = repo_memoria.listar()
+        finally:
+            documento_module.configure_telemetry(telemetry_instance=None)
+
+        assert len(docs) == 1
+        telemetry.increment.assert_not_called()
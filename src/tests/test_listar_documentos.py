@@ -3,11 +3,15 @@
 Testes para o caso de uso ListarDocumentos (sem telemetria).
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
-from src.application.use_cases.listar_documentos import ListarDocumentos
+from src.application.use_cases.listar_documentos import (
+    ListarDocumentos,
+    codificar_cursor,
+    decodificar_cursor,
+)
 
 
 class TestListarDocumentos:
@@ -37,7 +41,7 @@ class TestListarDocumentos:
 
     def test_executar_com_paginacao_basica(self, repo_mock, documentos_mock):
         """Deve executar listagem com paginação básica."""
-        repo_mock.listar.return_value = documentos_mock
+        repo_mock.listar_resumos.return_value = documentos_mock
         repo_mock.contar.return_value = 10
 
         use_case = ListarDocumentos(repo_mock)
@@ -47,36 +51,36 @@ class TestListarDocumentos:
         assert resultado["total"] == 10
         assert resultado["pagina"] == 1
         assert resultado["total_paginas"] == 2
-        repo_mock.listar.assert_called_once_with(offset=0, limite=5, centro=None, tipo=None)
+        repo_mock.listar_resumos.assert_called_once_with(offset=0, limite=5, centro=None, tipo=None)
 
     def test_executar_com_filtros(self, repo_mock, documentos_mock):
         """Deve aplicar filtros corretamente."""
-        repo_mock.listar.return_value = documentos_mock[:3]
+        repo_mock.listar_resumos.return_value = documentos_mock[:3]
         repo_mock.contar.return_value = 3
 
         use_case = ListarDocumentos(repo_mock)
         resultado = use_case.executar(pagina=1, limite=5, centro="lencenter", tipo="interrogatorio")
 
         assert len(resultado["items"]) == 3
-        repo_mock.listar.assert_called_once_with(
+        repo_mock.listar_resumos.assert_called_once_with(
             offset=0, limite=5, centro="lencenter", tipo="interrogatorio"
         )
         repo_mock.contar.assert_called_once_with(centro="lencenter", tipo="interrogatorio")
 
     def test_executar_pagina_2(self, repo_mock, documentos_mock):
         """Deve calcular offset corretamente para página 2."""
-        repo_mock.listar.return_value = documentos_mock
+        repo_mock.listar_resumos.return_value = documentos_mock
         repo_mock.contar.return_value = 10
 
         use_case = ListarDocumentos(repo_mock)
         resultado = use_case.executar(pagina=2, limite=5)
 
         assert resultado["pagina"] == 2
-        repo_mock.listar.assert_called_once_with(offset=5, limite=5, centro=None, tipo=None)
+        repo_mock.listar_resumos.assert_called_once_with(offset=5, limite=5, centro=None, tipo=None)
 
     def test_executar_sem_resultados(self, repo_mock):
         """Deve lidar com lista vazia."""
-        repo_mock.listar.return_value = []
+        repo_mock.listar_resumos.return_value = []
         repo_mock.contar.return_value = 0
 
         use_case = ListarDocumentos(repo_mock)
@@ -86,6 +90,69 @@ class TestListarDocumentos:
         assert resultado["total"] == 0
         assert resultado["total_paginas"] == 0
 
+    def test_cursores_na_paginacao_por_pagina(self, repo_mock, documentos_mock):
+        """Página intermediária deve expor cursores para os dois sentidos."""
+        repo_mock.listar_resumos.return_value = documentos_mock
+        repo_mock.contar.return_value = 15
+
+        use_case = ListarDocumentos(repo_mock)
+        resultado = use_case.executar(pagina=2, limite=5)
+
+        assert decodificar_cursor(resultado["cursor_proximo"]) == ("a", 5)
+        assert decodificar_cursor(resultado["cursor_anterior"]) == ("b", 1)
+
+    def test_executar_com_cursor_proximo(self, repo_mock, documentos_mock):
+        """Cursor 'a' deve buscar por chave um item além do limite."""
+        repo_mock.listar_resumos.return_value = documentos_mock[:3]
+        repo_mock.contar.return_value = 8
+
+        use_case = ListarDocumentos(repo_mock)
+        resultado = use_case.executar(pagina=2, limite=5, cursor=codificar_cursor("a", 5))
+
+        repo_mock.listar_resumos.assert_called_once_with(
+            limite=6, centro=None, tipo=None, after_id=5
+        )
+        assert len(resultado["items"]) == 3
+        assert resultado["cursor_proximo"] is None
+        assert decodificar_cursor(resultado["cursor_anterior"]) == ("b", 1)
+
+    def test_executar_com_cursor_anterior(self, repo_mock, documentos_mock):
+        """Cursor 'b' deve descartar o item extra do início."""
+        repo_mock.listar_resumos.return_value = documentos_mock
+        repo_mock.contar.return_value = 20
+
+        use_case = ListarDocumentos(repo_mock)
+        resultado = use_case.executar(pagina=2, limite=4, cursor=codificar_cursor("b", 6))
+
+        repo_mock.listar_resumos.assert_called_once_with(
+            limite=5, centro=None, tipo=None, before_id=6
+        )
+        assert [dto.id for dto in resultado["items"]] == [2, 3, 4, 5]
+        assert decodificar_cursor(resultado["cursor_anterior"]) == ("b", 2)
+        assert decodificar_cursor(resultado["cursor_proximo"]) == ("a", 5)
+
+    def test_cursor_nao_reconta_o_acervo(self, repo_mock, documentos_mock):
+        """Páginas por cursor usam o total repassado ou ficam sem total."""
+        repo_mock.listar_resumos.return_value = documentos_mock[:3]
+        use_case = ListarDocumentos(repo_mock)
+
+        com_total = use_case.executar(pagina=2, limite=5, cursor=codificar_cursor("a", 5), total=8)
+        sem_total = use_case.executar(pagina=2, limite=5, cursor=codificar_cursor("a", 5))
+
+        repo_mock.contar.assert_not_called()
+        assert (com_total["total"], com_total["total_paginas"]) == (8, 2)
+        assert (sem_total["total"], sem_total["total_paginas"]) == (None, None)
+
+    def test_cursor_invalido_volta_para_paginacao(self, repo_mock, documentos_mock):
+        """Cursor inválido deve ser ignorado."""
+        repo_mock.listar_resumos.return_value = documentos_mock
+        repo_mock.contar.return_value = 5
+
+        use_case = ListarDocumentos(repo_mock)
+        use_case.executar(pagina=1, limite=5, cursor="lixo!!")
+
+        repo_mock.listar_resumos.assert_called_once_with(offset=0, limite=5, centro=None, tipo=None)
+
     def test_com_traducao_nomes_fluent(self, repo_mock):
         """Método com_traducao_nomes deve retornar self para chamadas encadeadas."""
         use_case = ListarDocumentos(repo_mock)
@@ -94,44 +161,35 @@ class TestListarDocumentos:
         assert resultado is use_case
         assert use_case._tradutor_nomes is True
 
-    def test_listar_tipos_basico(self, repo_mock, documentos_mock):
+    def test_listar_tipos_basico(self, repo_mock):
         """Deve listar tipos com contagens."""
-        repo_mock.listar.return_value = documentos_mock
+        repo_mock.contar_por_tipo.return_value = {"interrogatorio": 5}
 
         use_case = ListarDocumentos(repo_mock)
         tipos = use_case.listar_tipos()
 
         assert len(tipos) > 0
         assert len(tipos[0]) == 4  # (tipo, descricao, icone, count)
-        repo_mock.listar.assert_called_once_with(limite=1000, centro=None)
+        repo_mock.contar_por_tipo.assert_called_once_with(centro=None)
+        repo_mock.agregados.assert_not_called()
+        repo_mock.listar.assert_not_called()
 
-    def test_listar_tipos_com_filtro_centro(self, repo_mock, documentos_mock):
+    def test_listar_tipos_com_filtro_centro(self, repo_mock):
         """Deve filtrar por centro ao listar tipos."""
-        repo_mock.listar.return_value = documentos_mock
+        repo_mock.contar_por_tipo.return_value = {}
 
         use_case = ListarDocumentos(repo_mock)
-        tipos = use_case.listar_tipos(centro="lencenter")
+        use_case.listar_tipos(centro="lencenter")
 
-        repo_mock.listar.assert_called_once_with(limite=1000, centro="lencenter")
+        repo_mock.contar_por_tipo.assert_called_once_with(centro="lencenter")
 
     def test_listar_tipos_com_tipos_variados(self, repo_mock):
-        """Deve lidar com diferentes tipos de documento."""
-        docs = []
-        tipos = ["interrogatorio", "carta", "relatorio", "interrogatorio", "carta"]
-
-        for i, tipo in enumerate(tipos):
-            doc = Mock()
-            doc.id = i + 1
-            doc.tipo = tipo
-            doc.centro = "lencenter"
-            docs.append(doc)
-
-        repo_mock.listar.return_value = docs
+        """Deve manter a ordem por frequência vinda do repositório."""
+        repo_mock.contar_por_tipo.return_value = {"interrogatorio": 2, "carta": 2, "relatorio": 1}
 
         use_case = ListarDocumentos(repo_mock)
         tipos_resultado = use_case.listar_tipos()
 
-        # Deve vir ordenado por frequência
         assert tipos_resultado[0][0] == "interrogatorio"  # 2 ocorrências
         assert tipos_resultado[0][3] == 2
         assert tipos_resultado[1][0] == "carta"  # 2 ocorrências
@@ -140,79 +198,48 @@ class TestListarDocumentos:
         assert tipos_resultado[2][3] == 1
 
     def test_listar_tipos_sem_tipos(self, repo_mock):
-        """Documentos sem tipo devem ser ignorados."""
-        docs = []
-        for i in range(3):
-            doc = Mock()
-            doc.id = i + 1
-            doc.tipo = None
-            docs.append(doc)
-
-        repo_mock.listar.return_value = docs
+        """Acervo sem documentos classificados não tem tipos."""
+        repo_mock.contar_por_tipo.return_value = {}
 
         use_case = ListarDocumentos(repo_mock)
         tipos = use_case.listar_tipos()
 
         assert len(tipos) == 0
 
-    @patch("src.infrastructure.persistence.sqlite_repository.SQLiteDocumentoRepository")
-    def test_verificar_traducoes_com_sucesso(self, mock_repo_class, repo_mock):
-        """Deve verificar traduções corretamente."""
-        # Configurar mock da conexão
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-
-        # Configurar o context manager _conexao usando MagicMock
-        mock_context_manager = MagicMock()
-        mock_repo._conexao.return_value = mock_context_manager
+    def test_idiomas_da_pagina_em_uma_consulta(self, repo_mock, documentos_mock):
+        """Idiomas devem vir de uma única consulta em lote para a página."""
+        repo_mock.listar_resumos.return_value = documentos_mock
+        repo_mock.contar.return_value = 5
+        repo_trad = Mock()
+        repo_trad.idiomas_por_documento.return_value = {1: {"pt", "en"}, 3: {"en"}}
 
-        # Configurar o __enter__ para retornar a conexão mockada
-        mock_conn = MagicMock()
-        mock_context_manager.__enter__.return_value = mock_conn
-
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [3]  # 3 traduções
-
-        use_case = ListarDocumentos(repo_mock)
-        resultado = use_case._verificar_traducoes(1)
-
-        assert resultado is True
-        mock_cursor.execute.assert_called_once_with(
-            "SELECT COUNT(*) FROM traducoes WHERE documento_id = ?", (1,)
-        )
-
-    @patch("src.infrastructure.persistence.sqlite_repository.SQLiteDocumentoRepository")
-    def test_verificar_traducoes_sem_traducao(self, mock_repo_class, repo_mock):
-        """Deve retornar False quando não há traduções."""
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-
-        mock_context_manager = MagicMock()
-        mock_repo._conexao.return_value = mock_context_manager
+        use_case = ListarDocumentos(repo_mock, repo_trad)
+        resultado = use_case.executar(pagina=1, limite=5)
 
-        mock_conn = MagicMock()
-        mock_context_manager.__enter__.return_value = mock_conn
+        repo_trad.idiomas_por_documento.assert_called_once_with([1, 2, 3, 4, 5])
+        items = resultado["items"]
+        assert items[0].idiomas == ["en", "pt"]
+        assert items[0].tem_traducao is True
+        assert items[1].idiomas == []
+        assert items[1].tem_traducao is False
 
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [0]  # 0 traduções
+    def test_idiomas_sem_repositorio_de_traducoes(self, repo_mock, documentos_mock):
+        """Sem repositório de traduções, nenhum documento é marcado."""
+        repo_mock.listar_resumos.return_value = documentos_mock
+        repo_mock.contar.return_value = 5
 
-        use_case = ListarDocumentos(repo_mock)
-        resultado = use_case._verificar_traducoes(1)
+        resultado = ListarDocumentos(repo_mock).executar(pagina=1, limite=5)
 
-        assert resultado is False
+        assert not any(item.tem_traducao for item in resultado["items"])
 
-    @patch("src.infrastructure.persistence.sqlite_repository.SQLiteDocumentoRepository")
-    def test_verificar_traducoes_com_erro(self, mock_repo_class, repo_mock):
-        """Erro na consulta deve retornar False e não quebrar."""
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
+    def test_idiomas_com_erro(self, repo_mock, documentos_mock):
+        """Erro na consulta de idiomas não deve quebrar a listagem."""
+        repo_mock.listar_resumos.return_value = documentos_mock
+        repo_mock.contar.return_value = 5
+        repo_trad = Mock()
+        repo_trad.idiomas_por_documento.side_effect = Exception("Erro simulado")
 
-        # Configurar para lançar exceção ao acessar _conexao
-        mock_repo._conexao.side_effect = Exception("Erro simulado")
-
-        use_case = ListarDocumentos(repo_mock)
-        resultado = use_case._verificar_traducoes(1)
+        resultado = ListarDocumentos(repo_mock, repo_trad).executar(pagina=1, limite=5)
 
-        assert resultado is False  # Fallback seguro
+        assert len(resultado["items"]) == 5  # Fallback seguro
+        assert not any(item.tem_traducao for item in resultado["items"])
@@ -3,10 +3,11 @@
 Testes de telemetria para o caso de uso ListarDocumentos.
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock
 
 import src.application.use_cases.listar_documentos as uc_module
 from src.application.use_cases.listar_documentos import ListarDocumentos
+from src.domain.value_objects.resumo_documento import ResumoDocumento
 
 
 class TestListarDocumentosTelemetry:
@@ -22,7 +23,7 @@ class TestListarDocumentosTelemetry:
         uc_module.configure_telemetry(telemetry_instance=mock_telemetry)
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = []
+        mock_repo.listar_resumos.return_value = []
         mock_repo.contar.return_value = 0
 
         use_case = ListarDocumentos(mock_repo)
@@ -49,7 +50,7 @@ class TestListarDocumentosTelemetry:
         uc_module.configure_telemetry(telemetry_instance=mock_telemetry)
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = []
+        mock_repo.contar_por_tipo.return_value = {}
 
         use_case = ListarDocumentos(mock_repo)
         use_case.listar_tipos()
@@ -58,56 +59,46 @@ class TestListarDocumentosTelemetry:
         mock_telemetry.increment.assert_any_call("listar_documentos.listar_tipos.concluido")
         mock_telemetry.increment.assert_any_call("listar_documentos.tipos_encontrados", value=0)
 
-    @patch("src.infrastructure.persistence.sqlite_repository.SQLiteDocumentoRepository")
-    def test_telemetria_verificar_traducoes_sucesso(self, mock_repo_class):
-        """Telemetria deve registrar verificação de traduções bem-sucedida."""
+    def _repo_com_pagina(self):
+        """Repositório mock com uma página de um documento."""
+        mock_repo = Mock()
+        mock_repo.listar_resumos.return_value = [
+            ResumoDocumento(id=1, centro="lencenter", titulo="Doc")
+        ]
+        mock_repo.contar.return_value = 1
+        return mock_repo
+
+    def test_telemetria_idiomas_sucesso(self):
+        """Telemetria deve registrar a consulta de idiomas bem-sucedida."""
         mock_telemetry = MagicMock()
         uc_module.configure_telemetry(telemetry_instance=mock_telemetry)
 
-        # Configurar mocks
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-
-        # Configurar context manager com MagicMock
-        mock_context_manager = MagicMock()
-        mock_repo._conexao.return_value = mock_context_manager
+        repo_trad = Mock()
+        repo_trad.idiomas_por_documento.return_value = {1: {"en"}}
 
-        mock_conn = MagicMock()
-        mock_context_manager.__enter__.return_value = mock_conn
+        ListarDocumentos(self._repo_com_pagina(), repo_trad).executar()
 
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [1]
-
-        use_case = ListarDocumentos(Mock())
-        use_case._verificar_traducoes(1)
+        mock_telemetry.increment.assert_any_call("listar_documentos.idiomas.sucesso")
 
-        mock_telemetry.increment.assert_any_call("listar_documentos.verificar_traducoes.iniciado")
-        mock_telemetry.increment.assert_any_call("listar_documentos.verificar_traducoes.sucesso")
-
-    @patch("src.infrastructure.persistence.sqlite_repository.SQLiteDocumentoRepository")
-    def test_telemetria_verificar_traducoes_erro(self, mock_repo_class):
-        """Telemetria deve registrar erro na verificação de traduções."""
+    def test_telemetria_idiomas_erro(self):
+        """Telemetria deve registrar erro na consulta de idiomas."""
         mock_telemetry = MagicMock()
         uc_module.configure_telemetry(telemetry_instance=mock_telemetry)
 
-        # Configurar mock para lançar exceção
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo._conexao.side_effect = Exception("Erro simulado")
+        repo_trad = Mock()
+        repo_trad.idiomas_por_documento.side_effect = Exception("Erro simulado")
 
-        use_case = ListarDocumentos(Mock())
-        use_case._verificar_traducoes(1)
+        ListarDocumentos(self._repo_com_pagina(), repo_trad).executar()
 
-        mock_telemetry.increment.assert_any_call("listar_documentos.verificar_traducoes.iniciado")
-        mock_telemetry.increment.assert_any_call("listar_documentos.verificar_traducoes.erro")
+        mock_telemetry.increment.assert_any_call("listar_documentos.idiomas.erro")
 
     def test_sem_telemetria_nao_quebra(self):
         """Sem telemetria configurada, o código deve funcionar normalmente."""
         uc_module.configure_telemetry(telemetry_instance=None)
 
         mock_repo = Mock()
-        mock_repo.listar.return_value = []
+        mock_repo.listar_resumos.return_value = []
+        mock_repo.contar_por_tipo.return_value = {}
         mock_repo.contar.return_value = 0
 
         use_case = ListarDocumentos(mock_repo)
@@ -117,13 +108,8 @@ class TestListarDocumentosTelemetry:
         use_case.executar(pagina=1)
         use_case.listar_tipos()
 
-        # Agora com o patch correto, este teste vai funcionar
-        with patch(
-            "src.infrastructure.persistence.sqlite_repository.SQLiteDocumentoRepository"
-        ) as mock_repo_class:
-            mock_repo_db = Mock()
-            mock_repo_class.return_value = mock_repo_db
-            mock_repo_db._conexao.side_effect = Exception("Erro simulado")
-
-            resultado = use_case._verificar_traducoes(1)
-            assert resultado is False
+        # Falha na consulta de idiomas também não deve quebrar
+        repo_trad = Mock()
+        repo_trad.idiomas_por_documento.side_effect = Exception("Erro simulado")
+        resultado = ListarDocumentos(self._repo_com_pagina(), repo_trad).executar()
+        assert resultado["items"][0].tem_traducao is False
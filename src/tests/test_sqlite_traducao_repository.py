@@ -9,6 +9,7 @@ from datetime import datetime
 import pytest
 
 from src.domain.entities.traducao import Traducao
+from src.infrastructure.persistence.migrations import aplicar_migracoes
 from src.infrastructure.persistence.sqlite_traducao_repository import SQLiteTraducaoRepository
 
 
@@ -18,22 +19,9 @@ def repo_memoria():
     with tempfile.NamedTemporaryFile(suffix=".db") as tmp:
         repo = SQLiteTraducaoRepository(db_path=tmp.name)
 
-        # Criar tabela
+        # Criar tabelas (schema completo via migrações versionadas)
         with repo._conexao() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE traducoes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    documento_id INTEGER NOT NULL,
-                    idioma TEXT NOT NULL,
-                    texto_traduzido TEXT NOT NULL,
-                    modelo TEXT,
-                    custo REAL,
-                    data_traducao TEXT NOT NULL
-                )
-            """
-            )
+            aplicar_migracoes(conn)
 
         yield repo
 
@@ -170,3 +158,81 @@ class TestSQLiteTraducaoRepository:
 
         count_outro = repo_memoria.contar_por_documento(99)
         assert count_outro == 0
+
+    def test_salvar_em_lote(self, repo_memoria):
+        """Deve inserir traduções em lote retornando IDs válidos."""
+        traducoes = [
+            Traducao(
+                documento_id=i,
+                idioma="en",
+                texto_traduzido=f"Text {i}",
+                data_traducao=datetime.now(),
+            )
+            for i in range(1, 6)
+        ]
+
+        ids = repo_memoria.salvar_em_lote(traducoes, chunk_size=2)
+
+        assert len(ids) == 5
+        for i, traducao_id in enumerate(ids, 1):
+            assert repo_memoria.buscar_por_id(traducao_id).texto_traduzido == f"Text {i}"
+
+    def test_idiomas_por_documento(self, repo_memoria):
+        """Deve retornar os idiomas de vários documentos de uma vez."""
+        repo_memoria.salvar_em_lote(
+            Traducao(
+                documento_id=doc_id,
+                idioma=idioma,
+                texto_traduzido="Texto",
+                data_traducao=datetime.now(),
+            )
+            for doc_id, idioma in [(1, "en"), (1, "pt"), (2, "en"), (9, "en")]
+        )
+
+        idiomas = repo_memoria.idiomas_por_documento([1, 2, 3])
+
+        assert idiomas == {1: {"en", "pt"}, 2: {"en"}}
+        assert repo_memoria.idiomas_por_documento([]) == {}
+
+    def test_texto_traduzido_comprimido(self):
+        """No modo comprimido a tradução é gravada como BLOB e lida em claro."""
+        with tempfile.NamedTemporaryFile(suffix=".db") as tmp:
+            repo = SQLiteTraducaoRepository(db_path=tmp.name)
+            with repo._conexao() as conn:
+                aplicar_migracoes(conn, comprimir_texto=True)
+
+            traducao_id = repo.salvar(
+                Traducao(
+                    documento_id=1,
+                    idioma="en",
+                    texto_traduzido="Interrogation record. " * 50,
+                    data_traducao=datetime.now(),
+                )
+            )
+
+            with repo._conexao() as conn:
+                tipo = conn.execute("SELECT typeof(texto_traduzido) FROM traducoes").fetchone()[0]
+
+            assert tipo == "blob"
+            assert repo.buscar_por_id(traducao_id).texto_traduzido == "Interrogation record. " * 50
+
+    def test_listar_alterados_desde(self, repo_memoria):
+        """Inserções e atualizações devem entrar no log de alterações."""
+        traducao = Traducao(
+            documento_id=1, idioma="en", texto_traduzido="Hello", data_traducao=datetime.now()
+        )
+        traducao.id = repo_memoria.salvar(traducao)
+        marca = repo_memoria.listar_alterados_desde().marca
+
+        traducao.texto_traduzido = "Hello again"
+        repo_memoria.salvar(traducao)
+        outra = Traducao(
+            documento_id=2, idioma="pt", texto_traduzido="Olá", data_traducao=datetime.now()
+        )
+        outra_id = repo_memoria.salvar_em_lote([outra])[0]
+
+        delta = repo_memoria.listar_alterados_desde(marca)
+
+        assert delta.alterados == [traducao.id, outra_id]
+        assert delta.removidos == []
+        assert repo_memoria.listar_alterados_desde(delta.marca).vazio
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 import pytest
 
 import src.infrastructure.persistence.sqlite_traducao_repository as repo_module
+from src.infrastructure.persistence.migrations import aplicar_migracoes
 
 
 @pytest.fixture
@@ -22,22 +23,9 @@ def repo_memoria():
 
         repo = SQLiteTraducaoRepository(db_path=tmp.name)
 
-        # Criar tabela
+        # Criar tabelas (schema completo via migrações versionadas)
         with repo._conexao() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE traducoes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    documento_id INTEGER NOT NULL,
-                    idioma TEXT NOT NULL,
-                    texto_traduzido TEXT NOT NULL,
-                    modelo TEXT,
-                    custo REAL,
-                    data_traducao TEXT NOT NULL
-                )
-            """
-            )
+            aplicar_migracoes(conn)
 
         yield repo
 
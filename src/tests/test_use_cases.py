@@ -6,10 +6,15 @@ Testes para os casos de uso da camada Application.
 from datetime import datetime
 from unittest.mock import Mock
 
+import pytest
+
 from src.application.use_cases.classificar_documento import ClassificarDocumento
+from src.application.use_cases.estatisticas import ObterEstatisticas
 from src.application.use_cases.listar_documentos import ListarDocumentos
 from src.application.use_cases.obter_documento import ObterDocumento
 from src.domain.entities.documento import Documento
+from src.domain.value_objects.agregados_acervo import AgregadosAcervo
+from src.domain.value_objects.resumo_documento import ResumoDocumento
 
 
 class TestClassificarDocumento:
@@ -52,26 +57,76 @@ class TestClassificarDocumento:
         mock_repo.salvar.assert_not_called()
 
 
+    def test_executar_em_lote_usa_salvar_em_lote(self):
+        mock_repo = Mock()
+        docs = [
+            Documento(
+                id=i,
+                centro="lencenter",
+                titulo="Протокол допроса Л.В. Николаева",
+                url=f"http://teste.com/{i}",
+                texto="...",
+                data_coleta=datetime.now(),
+                tipo="carta" if i == 3 else None,
+            )
+            for i in range(1, 4)
+        ]
+        mock_repo.iterar.return_value = iter(docs)
+        mock_repo.salvar_em_lote.return_value = [1, 2]
+
+        total = ClassificarDocumento(mock_repo).executar_em_lote()
+
+        assert total == 2
+        salvos = mock_repo.salvar_em_lote.call_args[0][0]
+        assert [d.id for d in salvos] == [1, 2]
+        assert all(d.tipo == "interrogatorio" for d in salvos)
+        mock_repo.salvar.assert_not_called()
+        assert "texto" not in mock_repo.iterar.call_args.kwargs["colunas"]
+
+    @pytest.mark.parametrize("limite, lotes", [(None, [500, 500, 200]), (700, [500, 200])])
+    def test_executar_em_lote_percorre_todo_o_acervo(self, limite, lotes):
+        """Documentos além dos primeiros 1000 também são classificados, lote a lote."""
+        mock_repo = Mock()
+        mock_repo.iterar.return_value = (
+            Documento(
+                id=i,
+                centro="lencenter",
+                titulo="Протокол допроса Л.В. Николаева",
+                url=f"http://teste.com/{i}",
+                texto="...",
+                data_coleta=datetime.now(),
+                tipo="carta" if i % 2 else None,
+            )
+            for i in range(2400)
+        )
+        mock_repo.salvar_em_lote.side_effect = lambda lote, chunk_size: [d.id for d in lote]
+
+        total = ClassificarDocumento(mock_repo).executar_em_lote(limite=limite)
+
+        chamadas = mock_repo.salvar_em_lote.call_args_list
+        assert [len(c.args[0]) for c in chamadas] == lotes
+        assert total == sum(lotes)
+        assert chamadas[-1].args[0][-1].id == 2 * (sum(lotes) - 1)
+
+
 class TestListarDocumentos:
     """Testes para o caso de uso ListarDocumentos."""
 
     def test_listar_com_paginacao(self):
         mock_repo = Mock()
 
-        # Mock de documentos
-        docs = [
-            Documento(
+        # Mock de resumos (listagem não carrega o texto)
+        resumos = [
+            ResumoDocumento(
                 id=i,
                 centro="lencenter",
                 titulo=f"Documento {i}",
-                url="http://teste.com",
-                texto="...",
-                data_coleta=datetime.now(),
+                tamanho_caracteres=100 * i,
             )
             for i in range(1, 6)
         ]
 
-        mock_repo.listar.return_value = docs
+        mock_repo.listar_resumos.return_value = resumos
         mock_repo.contar.return_value = 50
 
         caso_uso = ListarDocumentos(mock_repo)
@@ -82,9 +137,11 @@ class TestListarDocumentos:
         assert resultado["total"] == 50
         assert resultado["pagina"] == 2
         assert resultado["total_paginas"] == 10
+        assert resultado["items"][2].tamanho == 300
 
         # Verificar chamadas
-        mock_repo.listar.assert_called_with(offset=5, limite=5, centro=None, tipo=None)
+        mock_repo.listar_resumos.assert_called_with(offset=5, limite=5, centro=None, tipo=None)
+        mock_repo.listar.assert_not_called()
 
 
 class TestObterDocumento:
@@ -114,3 +171,32 @@ class TestObterDocumento:
         assert dto.titulo == "Протокол допроса Л.В. Николаева"
         assert dto.tipo == "interrogatorio"
         assert dto.tamanho_caracteres == len("Texto longo...")
+
+
+class TestObterEstatisticas:
+    """Testes para o caso de uso ObterEstatisticas."""
+
+    def test_estatisticas_usam_agregados(self):
+        mock_repo = Mock()
+        mock_repo.agregados.return_value = AgregadosAcervo(
+            total_documentos=6000,
+            por_centro={"lencenter": 3000, "moscenter": 3000},
+            por_tipo={"interrogatorio": 5997, "carta": 3},
+            pessoas_frequentes=[("Л.В. Николаев", 10)],
+            com_anexos=1,
+            total_traducoes=2,
+            traducoes_por_idioma={"en": 2},
+            custo_total_traducoes=0.5,
+        )
+
+        stats = ObterEstatisticas(mock_repo).executar()
+
+        assert stats.total_documentos == 6000
+        assert stats.cartas == 3
+        assert stats.laudos == 0
+        assert stats.documentos_com_anexos == 1
+        assert stats.total_traducoes == 2
+        assert stats.custo_total_traducoes == 0.5
+        assert stats.pessoas_frequentes[0][:2] == ("Л.В. Николаев", 10)
+        mock_repo.listar.assert_not_called()
+        mock_repo.iterar.assert_not_called()